@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark combo matching.
+
+Compares the old list-and-slice key handling of DuelEngine.press with the
+streaming ComboMatcher, in microseconds per key, at every chapter's combo
+length and for a long key stream. Slicing copies the last len(combination)
+keys on every press, so its cost grows with the combo; the matcher's
+doesn't.
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.combo import ComboMatcher
+from src.engine import ARROWS, CHAPTERS
+
+DUELS = 20000
+STREAM_KEYS = 200000
+REPEATS = 5  # Best of, so a busy machine doesn't decide the comparison
+
+
+def slice_duel(combination, keys):
+    """One duel as DuelEngine.press used to play it."""
+    player_input, correct_keys = [], 0
+    for key in keys:
+        player_input.append(key)
+        position = len(player_input) - 1
+        if correct_keys == position and position < len(combination) and combination[position] == key:
+            correct_keys += 1
+        if player_input[-len(combination):] == combination:
+            return True
+        elif len(player_input) >= len(combination):
+            if player_input[-len(combination):] != combination:
+                return False
+
+
+def matcher_duel(combination, keys):
+    """One duel through a strict ComboMatcher."""
+    matcher = ComboMatcher(combination)
+    for key in keys:
+        result = matcher.feed(key)
+        if result is not None:
+            return result
+
+
+def slice_stream(combination, keys):
+    """Search a key stream by slicing the tail after every key."""
+    player_input, length = [], len(combination)
+    for key in keys:
+        player_input.append(key)
+        if player_input[-length:] == combination:
+            player_input = []
+
+
+def matcher_stream(combination, keys):
+    """Search a key stream with a sliding ComboMatcher."""
+    matcher = ComboMatcher(combination, strict=False)
+    for key in keys:
+        if matcher.feed(key) is not None:
+            matcher.reset()
+
+
+def per_key(run, cases, keys):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for case in cases:
+            run(*case)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / keys
+
+
+def main():
+    rng = random.Random(1)
+    print(f"{'case':<22}{'slice us/key':>14}{'matcher us/key':>16}")
+    for combo in sorted({chapter["combo"] for chapter in CHAPTERS}):
+        cases = []
+        for _ in range(DUELS):
+            combination = [rng.choice(ARROWS) for _ in range(combo)]
+            cases.append((combination, [key if rng.random() < 0.95 else rng.choice(ARROWS) for key in combination]))
+        keys = DUELS * combo
+        print(f"{f'duel, combo {combo}':<22}{per_key(slice_duel, cases, keys):>14.3f}"
+              f"{per_key(matcher_duel, cases, keys):>16.3f}")
+
+    # Long combos show the scaling: a slice copies the whole window per key
+    stream = [rng.choice(ARROWS) for _ in range(STREAM_KEYS)]
+    for combo in (12, 64, 256):
+        cases = [([rng.choice(ARROWS) for _ in range(combo)], stream)]
+        print(f"{f'stream, combo {combo}':<22}{per_key(slice_stream, cases, STREAM_KEYS):>14.3f}"
+              f"{per_key(matcher_stream, cases, STREAM_KEYS):>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for Pixelated Showdown.
+
+Times asset setup, steady-state frames of every scene and full process
+start-up under the SDL dummy video and audio drivers, writes the results as
+JSON and optionally compares them with a baseline file:
+
+    python scripts/benchmark.py --output bench.json
+    python scripts/benchmark.py --baseline bench.json --threshold 0.2
+
+The exit status is 1 when any benchmark's median regressed past the
+threshold, so the comparison can gate CI.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('PIXELATED_SHOWDOWN_CACHE', tempfile.mkdtemp(prefix='pixelated-bench-'))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # Assets are resolved relative to the project root
+
+import pygame
+
+WIDTH, HEIGHT = 800, 600
+
+# Full start-up: interpreter, imports, window, shared assets and the first duel frame
+COLD_START = """
+import os, sys
+sys.path.insert(0, os.getcwd())
+import pygame
+pygame.init()
+window = pygame.display.set_mode((800, 600))
+from src.game import Game
+game = Game(window)
+game.start_chapter()
+game.draw()
+game.present()
+"""
+
+
+def summarise(samples):
+    """Reduce per-iteration seconds to millisecond statistics."""
+    ms = sorted(sample * 1000 for sample in samples)
+    return {
+        "iterations": len(ms),
+        "mean_ms": statistics.fmean(ms),
+        "median_ms": statistics.median(ms),
+        "p95_ms": ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+        "min_ms": ms[0],
+    }
+
+
+def measure(setup, run, iterations, warmup=3):
+    """Time run(state) after setup(); setup is excluded from the timing."""
+    state = setup()
+    for _ in range(warmup):
+        run(state)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run(state)
+        samples.append(time.perf_counter() - start)
+    return summarise(samples)
+
+
+def bench_graphics_init(screen, iterations):
+    """Graphics() with an empty asset cache, i.e. every sprite rebuilt."""
+    from src.assets import assets
+    from src.graphics import Graphics
+
+    def run(_):
+        assets.clear()
+        Graphics(screen, WIDTH, HEIGHT).close()
+    return {"graphics_init": measure(lambda: None, run, iterations)}
+
+
+def bench_sound_manager_init(screen, iterations):
+    """SoundManager() with an empty asset cache, i.e. every effect decoded."""
+    from src.assets import assets
+    from src.sound import SoundManager
+
+    def run(_):
+        assets.clear()
+        SoundManager().close()
+    return {"sound_manager_init": measure(lambda: None, run, iterations)}
+
+
+def bench_game_draw(screen, iterations):
+    """Steady-state duel frames at every chapter's combo length."""
+    from src.game import Game
+    game = Game(screen)
+    results = {}
+    for number, chapter in enumerate(game.enemies, start=1):
+        def setup(number=number):
+            game.engine.current_chapter = number
+            game.engine.start_chapter()
+            game.engine.start_countdown()
+            game.engine.start_duel()
+            game.handle_engine_events()
+            assert game.duel_started and not game.chapter_intro
+            return game
+
+        def run(game):
+            game.engine.duel_time = 0  # Keep the duel from timing out mid-run
+            game.draw()
+            game.present()
+        results[f"game_draw.chapter_{number}.combo_{chapter['combo']}"] = measure(setup, run, iterations)
+    return results
+
+
+def bench_presentation_fade(screen, iterations):
+    """Presentation.draw while a story slide fades in."""
+    from src.presentation import Presentation
+    presentation = Presentation(screen, WIDTH, HEIGHT)
+    presentation.images = presentation.load_images()
+
+    def run(presentation):
+        presentation.fade.update(1000 / 60)
+        if presentation.fade.done:
+            presentation.fade.elapsed = 0
+        presentation.draw()
+        presentation.present()
+    result = measure(lambda: presentation, run, iterations)
+    presentation.close()
+    return {"presentation_fade": result}
+
+
+def bench_ending_frames(screen, iterations):
+    """EndingScene slide frames with the image and text fading in."""
+    from src.ending import EndingScene
+    from src.sound import SoundManager
+    scene = EndingScene(screen, SoundManager())
+    images = scene.load_images()
+    alphas = iter(range(10 ** 9))
+
+    def run(scene):
+        scene.draw_slide(images[0], scene.TEXTS[0], next(alphas) * 5 % 256)
+        pygame.display.flip()
+    result = measure(lambda: scene, run, iterations)
+    scene.release_images()
+    return {"ending_frame": result}
+
+
+def bench_startup(screen, iterations):
+    """Process start to first duel frame, with a fresh and with a warm image cache."""
+    def start(cache_dir):
+        env = dict(os.environ, PIXELATED_SHOWDOWN_CACHE=cache_dir)
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, "-c", COLD_START], cwd=ROOT_DIR, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return time.perf_counter() - begin
+
+    runs = max(3, iterations // 20)
+    cold = [start(tempfile.mkdtemp(prefix='pixelated-cold-')) for _ in range(runs)]
+    warm_dir = tempfile.mkdtemp(prefix='pixelated-warm-')
+    start(warm_dir)
+    warm = [start(warm_dir) for _ in range(runs)]
+    return {"startup_cold": summarise(cold), "startup_warm": summarise(warm)}
+
+
+BENCHMARKS = {
+    "graphics_init": bench_graphics_init,
+    "sound_manager_init": bench_sound_manager_init,
+    "game_draw": bench_game_draw,
+    "presentation_fade": bench_presentation_fade,
+    "ending_frames": bench_ending_frames,
+    "startup": bench_startup,
+}
+
+
+def compare(results, baseline, threshold):
+    """Return rows of (name, baseline median, median, ratio, regressed)."""
+    rows = []
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else float("inf")
+        rows.append((name, before["median_ms"], result["median_ms"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative median slowdown that counts as a regression (default 0.2)")
+    parser.add_argument("--iterations", type=int, default=200, help="timed iterations per benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        results.update(BENCHMARKS[name](screen, args.iterations))
+    pygame.quit()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}}  {'median ms':>10}  {'p95 ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<{width}}  {result['median_ms']:>10.3f}  {result['p95_ms']:>10.3f}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        print(f"\n{'benchmark':<{width}}  {'baseline':>10}  {'now':>10}  {'ratio':>6}")
+        for name, before, now, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<{width}}  {before:>10.3f}  {now:>10.3f}  {ratio:>6.2f}{flag}")
+        if any(row[4] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,13 +49,13 @@ def build_executable():
     
     print(f"\nUsing main script: {main_script}")
     
-    # Define additional data files to include
-    assets_dir = os.path.join(root_dir, 'assets')
-    if not os.path.exists(assets_dir):
-        print(f"Warning: Assets directory not found at {assets_dir}")
-        assets_arg = []
-    else:
-        assets_arg = [f'--add-data={assets_dir}{os.pathsep}assets']
+    # Assets ship as one pack next to the executable, mapped at run time,
+    # rather than inside the --onefile archive, which extracts its data to a
+    # temporary directory on every launch
+    dist_dir = os.path.join(root_dir, 'dist')
+    sys.path.insert(0, root_dir)
+    from src.pack import build as build_pack
+    build_pack(os.path.join(dist_dir, 'assets.pack'))
     
     # PyInstaller command line arguments
     args = [
@@ -63,7 +63,8 @@ def build_executable():
         '--onefile',
         '--windowed',
         '--name=PixelatedShowdown',
-    ] + assets_arg
+        f'--distpath={dist_dir}',
+    ]
     
     print(f"\nPyInstaller arguments: {args}")
     
@@ -0,0 +1,192 @@
+import os
+import sys
+import logging
+import threading
+import pygame
+from src.image_cache import image_cache
+from src.pack import AssetPack, PackError
+
+# Process-wide asset cache. Every image, sprite set and sound is loaded once
+# and shared by all Graphics / SoundManager / scene instances; acquire()
+# hands out the shared object and bumps its reference count, release()
+# drops it and frees the asset when nobody holds it any more. The manager is
+# thread-safe so the preloader can warm assets from a worker thread.
+#
+# Assets are named by their path under ASSET_DIR, wherever the game was
+# started from. Once open_pack() has found an asset pack (see src/pack.py),
+# everything in it is read from the pack's mapping instead of loose files.
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+def default_pack_path():
+    # Next to the executable in a frozen build; loose files otherwise
+    if getattr(sys, 'frozen', False):
+        return os.environ.get('PIXELATED_SHOWDOWN_PACK', os.path.join(os.path.dirname(sys.executable), 'assets.pack'))
+    return os.environ.get('PIXELATED_SHOWDOWN_PACK')
+
+def pack_name(path):
+    # An asset's name in the pack: its path relative to ASSET_DIR
+    return os.path.relpath(os.path.abspath(path), ASSET_DIR).replace(os.sep, '/')
+
+class AssetEntry:
+    def __init__(self, asset):
+        self.asset = asset
+        self.refs = 0
+
+
+class AssetManager:
+    def __init__(self):
+        self.entries = {}
+        self.loading = {}  # key -> Event set when another thread finishes loading it
+        self.lock = threading.RLock()
+        self.loads = 0
+        self.pack = None
+
+    def acquire(self, key, loader):
+        while True:
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry is not None:
+                    entry.refs += 1
+                    return entry.asset
+                pending = self.loading.get(key)
+                if pending is None:
+                    pending = self.loading[key] = threading.Event()
+                    break
+            pending.wait()
+
+        # Load outside the lock so other assets stay available meanwhile
+        try:
+            asset = loader()
+        except BaseException:
+            with self.lock:
+                del self.loading[key]
+            pending.set()
+            raise
+        with self.lock:
+            entry = AssetEntry(asset)
+            entry.refs = 1
+            self.entries[key] = entry
+            self.loads += 1
+            del self.loading[key]
+        pending.set()
+        logging.debug(f"Loaded asset: {key}")
+        return asset
+
+    def release(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0:
+                del self.entries[key]
+                logging.debug(f"Released asset: {key}")
+
+    def is_loaded(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def open_pack(self, path=None):
+        path = path or default_pack_path()
+        if not path:
+            return None
+        try:
+            self.pack = AssetPack(path)
+            logging.info(f"Using asset pack {path} ({len(self.pack.entries)} assets)")
+        except (OSError, PackError) as e:
+            logging.error(f"Couldn't open asset pack {path}, using loose files: {e}")
+        return self.pack
+
+    def packed(self, path):
+        if self.pack is None:
+            return None
+        name = pack_name(path)
+        return name if name in self.pack else None
+
+    def source(self, path):
+        # What pygame loads from: a view into the pack, or the file itself
+        name = self.packed(path)
+        return path if name is None else self.pack.open(name)
+
+    def read(self, path):
+        name = self.packed(path)
+        if name is not None:
+            return self.pack.view(name)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def image(self, path, size=None):
+        return self.acquire(('image', path, size), lambda: self.load_image(path, size))
+
+    def load_image(self, path, size=None):
+        if size is not None:
+            # Scaled images come pre-scaled from the persistent cache
+            return image_cache.load(path, size, self.read(path))
+        return pygame.image.load(self.source(path), os.path.basename(path))
+
+    def sound(self, path):
+        return self.acquire(('sound', path), lambda: pygame.mixer.Sound(self.source(path)))
+
+    def sprites(self, name, builder):
+        return self.acquire(('sprites', name), builder)
+
+    def data(self, path):
+        # Raw file contents, e.g. compressed music streamed by the mixer
+        return self.acquire(('data', path), lambda: self.read(path))
+
+    def load(self, key):
+        # Acquire an asset from its key alone: ('image', path, size), ('sound', path) or ('data', path)
+        kind = key[0]
+        if kind == 'image':
+            return self.image(key[1], key[2])
+        if kind == 'sound':
+            return self.sound(key[1])
+        if kind == 'data':
+            return self.data(key[1])
+        raise ValueError(f"Can't load asset {key} without a builder")
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def report(self):
+        # (key, refs, resident bytes) per asset, largest first
+        with self.lock:
+            entries = list(self.entries.items())
+        rows = [(key, entry.refs, asset_size(entry.asset)) for key, entry in entries]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def resident_bytes(self):
+        return sum(size for _, _, size in self.report())
+
+    def log_report(self):
+        for key, refs, size in self.report():
+            logging.info(f"Asset {key}: {refs} refs, {size / 1024:.1f} KiB")
+        logging.info(f"Assets resident: {self.resident_bytes() / 1024:.1f} KiB")
+
+
+def asset_size(asset):
+    if isinstance(asset, pygame.Surface):
+        if asset.get_parent() is not None:
+            # A cell of a sprite sheet: count its share, not the whole sheet's pitch
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        return asset.get_pitch() * asset.get_height()
+    if isinstance(asset, dict):
+        return sum(asset_size(value) for value in asset.values())
+    if isinstance(asset, (list, tuple)):
+        return sum(asset_size(value) for value in asset)
+    if isinstance(asset, (bytes, bytearray, memoryview)):
+        return len(asset)
+    try:
+        # Decoded mixer.Sound: samples * channels * sample width
+        frequency, size, channels = pygame.mixer.get_init()
+        return int(round(asset.get_length() * frequency)) * channels * abs(size) // 8
+    except (AttributeError, TypeError, pygame.error):
+        return 0
+
+
+assets = AssetManager()
+
+def asset_path(*parts):
+    return os.path.join(ASSET_DIR, *parts)
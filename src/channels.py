@@ -0,0 +1,115 @@
+import logging
+from collections import namedtuple
+import pygame
+
+# Mixer channels for sound effects. Every effect belongs to a category with
+# its own reserved channels, so a burst of gunfire can never take the
+# channel a "win"/"dead" voice needs. When a category is full the new sound
+# steals the oldest voice of no higher priority, otherwise it is dropped;
+# retriggers of the same sound inside its cooldown collapse into one. The
+# mixer channel count is fixed, which bounds the mixing load.
+
+Voice = namedtuple("Voice", ["category", "priority", "cooldown"])
+
+CATEGORY_CHANNELS = {
+    'ui': 1,
+    'gunfire': 2,
+    'voice': 2,
+}
+
+VOICES = {
+    'start': Voice('ui', 1, 100),
+    'shoot': Voice('gunfire', 2, 30),
+    'win': Voice('voice', 3, 100),
+    'dead': Voice('voice', 3, 100),
+    'game_over': Voice('voice', 4, 250),
+}
+
+DEFAULT_VOICE = Voice('ui', 0, 0)
+FREE_CHANNELS = 2  # Left unreserved for plain Sound.play() calls
+
+
+class ChannelPool:
+    def __init__(self, categories=CATEGORY_CHANNELS, voices=VOICES, clock=pygame.time.get_ticks):
+        self.voices = dict(voices)
+        self.clock = clock
+        total = sum(categories.values())
+        pygame.mixer.set_num_channels(total + FREE_CHANNELS)
+        pygame.mixer.set_reserved(total)
+        self.channels = {}
+        index = 0
+        for category, count in categories.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        self.voicing = {}  # channel -> (name, priority, start tick)
+        self.last_played = {}
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.collapsed = 0
+
+    def voice(self, name):
+        return self.voices.get(name, DEFAULT_VOICE)
+
+    def find_channel(self, voice):
+        channels = self.channels.get(voice.category)
+        if not channels:
+            return None
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        # Every reserved channel is busy: steal the oldest voice we outrank or match
+        victims = [channel for channel in channels
+                   if channel in self.voicing and self.voicing[channel][1] <= voice.priority]
+        if not victims:
+            return None
+        victim = min(victims, key=lambda channel: self.voicing[channel][2])
+        victim.stop()
+        self.stolen += 1
+        logging.debug(f"Stole channel from {self.voicing[victim][0]}")
+        return victim
+
+    def play(self, name, sound):
+        voice = self.voice(name)
+        now = self.clock()
+        last = self.last_played.get(name)
+        if last is not None and now - last < voice.cooldown:
+            self.collapsed += 1
+            return None
+        channel = self.find_channel(voice)
+        if channel is None:
+            self.dropped += 1
+            logging.debug(f"Dropped sound: {name}")
+            return None
+        channel.play(sound)
+        self.voicing[channel] = (name, voice.priority, now)
+        self.last_played[name] = now
+        self.played += 1
+        return channel
+
+    def stop(self, name):
+        for channel, (playing, _, _) in list(self.voicing.items()):
+            if playing == name:
+                channel.stop()
+                del self.voicing[channel]
+
+    def stats(self):
+        return {'played': self.played, 'dropped': self.dropped,
+                'stolen': self.stolen, 'collapsed': self.collapsed}
+
+    def log_report(self):
+        logging.info("Sound channels: " + ", ".join(f"{key} {value}" for key, value in self.stats().items()))
+
+
+# Mixer channels are process-wide, so one pool hands them out
+_pool = None
+
+def get_channel_pool():
+    global _pool
+    if _pool is None:
+        _pool = ChannelPool()
+    return _pool
+
+def reset_channel_pool():
+    global _pool
+    _pool = None
@@ -1,5 +1,6 @@
 import pygame
 from src.graphics import Graphics  # Add this import at the top of the file
+from src.utils import FRAME_MS
 
 class Character:
     def __init__(self, x, y):
@@ -7,17 +8,22 @@ class Character:
         self.y = y
         self.state = "normal"
         self.animation_timer = 0
-        self.ANIMATION_DURATION = 30
+        self.ANIMATION_DURATION = 500  # Milliseconds
 
-    def update(self):
-        if self.animation_timer > 0:
-            self.animation_timer -= 1
-            if self.animation_timer == 0:
-                if self.state == "shoot":
-                    self.state = "win"
-                    self.animation_timer = self.ANIMATION_DURATION * 2
-                elif self.state in ["hit", "win"]:
+    def update(self, dt=FRAME_MS):
+        if self.animation_timer <= 0:
+            return
+        self.animation_timer -= dt
+        # Carry any overshoot into the next state so long frames don't stretch the chain
+        while self.animation_timer <= 0:
+            if self.state == "shoot":
+                self.state = "win"
+                self.animation_timer += self.ANIMATION_DURATION * 2
+            else:
+                if self.state in ["hit", "win"]:
                     self.state = "normal"
+                self.animation_timer = 0
+                break
 
     def set_state(self, state):
         self.state = state
@@ -25,7 +31,7 @@ class Character:
 
     def draw(self, screen):
         image = self.get_image()
-        screen.blit(image, (self.x, self.y))
+        return screen.blit(image, (self.x, self.y))
 
     def get_image(self):
         raise NotImplementedError
@@ -41,7 +47,7 @@ class Player(Character):
 
     def draw(self, screen):
         self.image = self.graphics.get_player_image(self.state)
-        screen.blit(self.image, (self.x, self.y))
+        return screen.blit(self.image, (self.x, self.y))
 
     def get_image(self):
         return self.graphics.get_player_image(self.state)
@@ -56,7 +62,7 @@ class Computer(Character):
 
     def draw(self, screen):
         image = self.graphics.get_enemy_image(self.current_enemy)
-        screen.blit(image, (self.x, self.y))
+        return screen.blit(image, (self.x, self.y))
 
     def set_state(self, state):
         self.state = state
@@ -64,5 +70,5 @@ class Computer(Character):
     def set_enemy(self, enemy_name):
         self.current_enemy = enemy_name
 
-    def update(self):
+    def update(self, dt=FRAME_MS):
         pass
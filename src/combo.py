@@ -0,0 +1,91 @@
+from collections import deque
+
+# Incremental combo matching. A ComboMatcher consumes one key at a time in
+# O(1) and keeps only the last len(combination) keys, so nothing grows with
+# the number of presses. In strict mode (the duel rules) an attempt is over
+# after len(combination) keys and matches only if every key was right; in
+# sliding mode the combination may turn up anywhere in the key stream and is
+# tracked with a KMP automaton. ComboSet feeds one key stream to several
+# live combos at once. Pure Python, like the engine.
+
+MATCHED = "matched"
+FAILED = "failed"
+
+
+def build_automaton(combination):
+    # table[state][key] -> next state, where state is the length of the
+    # longest prefix of combination that is a suffix of the keys so far.
+    # Keys missing from a row go back to state 0.
+    if not combination:
+        return []
+    table = [{combination[0]: 1}]
+    fallback = 0
+    for position in range(1, len(combination)):
+        key = combination[position]
+        row = dict(table[fallback])
+        row[key] = position + 1
+        table.append(row)
+        fallback = table[fallback].get(key, 0)
+    return table
+
+
+class ComboMatcher:
+    def __init__(self, combination, strict=True):
+        self.combination = tuple(combination)
+        self.strict = strict
+        self.table = None if strict else build_automaton(self.combination)
+        self.reset()
+
+    def reset(self):
+        # A strict attempt ends after len(combination) keys, so a plain list
+        # stays bounded; sliding mode keeps a ring of the last keys
+        self.history = [] if self.strict else deque(maxlen=max(len(self.combination), 1))
+        self.count = 0  # Keys fed since the last reset
+        self.progress = 0  # Strict: leading keys right; sliding: automaton state
+        self.result = None
+
+    @property
+    def done(self):
+        return self.result is not None
+
+    def feed(self, key):
+        # Returns MATCHED or FAILED once the attempt is decided, else None
+        if self.result is not None:
+            return self.result
+        self.history.append(key)
+        self.count += 1
+        combination = self.combination
+        if self.strict:
+            progress = self.progress
+            if progress == self.count - 1 and progress < len(combination) and combination[progress] == key:
+                self.progress = progress = progress + 1
+            if self.count >= len(combination):
+                self.result = MATCHED if combination and progress == len(combination) else FAILED
+        elif combination:
+            self.progress = self.table[self.progress].get(key, 0)
+            if self.progress == len(combination):
+                self.result = MATCHED
+        return self.result
+
+
+class ComboSet:
+    def __init__(self):
+        self.matchers = {}
+
+    def add(self, name, combination, strict=True):
+        self.matchers[name] = ComboMatcher(combination, strict)
+        return self.matchers[name]
+
+    def remove(self, name):
+        self.matchers.pop(name, None)
+
+    def progress(self, name):
+        return self.matchers[name].progress
+
+    def feed(self, key):
+        # [(name, result)] for the combos this key decided
+        decided = []
+        for name, matcher in self.matchers.items():
+            if matcher.result is None and matcher.feed(key) is not None:
+                decided.append((name, matcher.result))
+        return decided
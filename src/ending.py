@@ -1,134 +1,148 @@
+import math
 import pygame
-import sys
-import os
+from src.text import get_font, render_text, text_block
+from src.assets import assets, asset_path
+from src.preload import preloader, POLL_MS
+from src.transitions import Transition, fade_in, fade_out, prepare, blit_alpha
+from src.scenes import Scene
+
+SLIDE_MS = 5000  # Time each ending slide stays up, fade included
+
+
+class EndingScene(Scene):
+    TEXTS = [
+        "After a bloody journey of retribution, the gunslinger finally fulfilled his promise, and the entire Dried Gut gang was defeated.",
+        "At last, his family could rest in peace...",
+        "and once more, his guns were laid to rest."
+    ]
 
-class EndingScene:
     def __init__(self, screen, sound_manager):
         self.screen = screen
         self.sound_manager = sound_manager
         self.WIDTH, self.HEIGHT = screen.get_size()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
+        self.font = get_font(36)
+        self.title_font = get_font(72)
         self.image_size = (600, 400)
         self.text_height = 150
-        self.fade_alpha = 0
-        self.fade_speed = 5
+        self.transition = Transition(screen)
+        self.fade = fade_in()
+        self.to_black = fade_out()
+        self.images = None
+        self.slide = 0
+        self.slide_time = 0
+        self.result = None  # "new_game" or "quit" once the scene is done
 
     def load_images(self):
         images = []
         for i in range(6, 9):  # Ending images are 06.png, 07.png, 08.png
-            image_path = os.path.join('assets', 'images', f'0{i}.png')
-            image = pygame.image.load(image_path)
-            image = pygame.transform.scale(image, self.image_size)
-            images.append(image)
+            image_path = asset_path('images', f'0{i}.png')
+            images.append(prepare(assets.image(image_path, self.image_size)))
         return images
 
-    def show_ending(self):
-        self.sound_manager.stop_music()  # Ensure all music is stopped
-        self.sound_manager.play_sound('the_final_sunset')
-        
-        ending_images = self.load_images()
-        
-        ending_texts = [
-            "After a bloody journey of retribution, the gunslinger finally fulfilled his promise, and the entire Dried Gut gang was defeated.",
-            "At last, his family could rest in peace...",
-            "and once more, his guns were laid to rest."
-        ]
-        
-        clock = pygame.time.Clock()
+    def release_images(self):
+        for i in range(6, 9):
+            assets.release(('image', asset_path('images', f'0{i}.png'), self.image_size))
+        preloader.release('ending')
+
+    def enter(self):
+        # Fade the last duel frame to black. The ending is normally warmed during
+        # the final chapter; keep frames flowing until it is
+        self.sound_manager.play_music('the_final_sunset', fade_ms=1000)
+        preloader.preload('ending')
+        self.transition.capture()
+        self.to_black = fade_out()
+        self.images = None
+        self.slide = 0
+        self.slide_time = 0
+        self.result = None
+
+    def exit(self):
+        if self.images is not None:
+            self.release_images()
+            self.images = None
+        self.sound_manager.stop_music()
+
+    def finish(self, result):
+        self.result = result
+        self.manager.pop()
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if self.images is not None and self.slide < len(self.TEXTS):
+            if event.key == pygame.K_ESCAPE:
+                self.finish("quit")
+        elif self.slide == len(self.TEXTS):
+            if event.key == pygame.K_n:
+                self.finish("new_game")
+            elif event.key == pygame.K_q:
+                self.finish("quit")
+
+    def update(self, dt):
+        if self.images is None:
+            self.to_black.update(dt)
+            if self.to_black.done and preloader.ready('ending'):
+                self.images = self.load_images()
+                self.fade = fade_in()
+            return
+        if self.slide < len(self.TEXTS):
+            self.fade.update(dt)
+            self.slide_time += dt
+            if self.fade.done and self.slide_time >= SLIDE_MS:
+                self.slide += 1
+                self.slide_time = 0
+                self.fade = fade_in()
+
+    def idle_ms(self):
+        if self.images is None:
+            # Black while the slides finish loading
+            return POLL_MS if self.to_black.done else None
+        if self.slide == len(self.TEXTS):
+            return math.inf  # The options wait for a key
+        if not self.fade.done:
+            return None
+        return max(SLIDE_MS - self.slide_time, 0)
+
+    def draw(self):
+        if self.images is None:
+            self.transition.fade_to_black(255 - self.to_black.alpha)
+        elif self.slide < len(self.TEXTS):
+            self.draw_slide(self.images[self.slide], self.TEXTS[self.slide], self.fade.alpha)
+        else:
+            self.draw_options()
+
+    def draw_slide(self, image, text, alpha):
+        self.screen.fill((0, 0, 0))  # Black background
         
-        for image, text in zip(ending_images, ending_texts):
-            self.fade_alpha = 0
-            start_time = pygame.time.get_ticks()
-            
-            while self.fade_alpha < 255 or pygame.time.get_ticks() - start_time < 5000:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return "quit"
-                
-                self.screen.fill((0, 0, 0))  # Black background
-                
-                # Draw the current image with fade effect
-                image_with_alpha = image.copy()
-                image_with_alpha.set_alpha(self.fade_alpha)
-                image_x = (self.WIDTH - self.image_size[0]) // 2
-                image_y = (self.HEIGHT - self.image_size[1] - self.text_height) // 2
-                self.screen.blit(image_with_alpha, (image_x, image_y))
-                
-                # Draw text with fade effect
-                self.draw_text(text, (255, 255, 255), 
-                               10, image_y + self.image_size[1] + 20, self.WIDTH - 20, self.fade_alpha)
-                
-                if self.fade_alpha < 255:
-                    self.fade_alpha = min(255, self.fade_alpha + self.fade_speed)
-                
-                pygame.display.flip()
-                clock.tick(60)
+        # Draw the current image with fade effect
+        image_x = (self.WIDTH - self.image_size[0]) // 2
+        image_y = (self.HEIGHT - self.image_size[1] - self.text_height) // 2
+        blit_alpha(self.screen, image, (image_x, image_y), alpha)
         
-        return self.show_options()
+        # Draw text with fade effect
+        self.draw_text(text, (255, 255, 255), 
+                       10, image_y + self.image_size[1] + 20, self.WIDTH - 20, alpha)
 
     def draw_text(self, text, color, x, y, max_width, alpha):
-        words = text.split()
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font.render(test_line, True, color)
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
-
-        total_height = len(lines) * self.font.get_linesize()
-        current_y = y + (self.text_height - total_height) // 2
-
-        for line in lines:
-            text_surface = self.font.render(line, True, color)
-            text_surface.set_alpha(alpha)
-            text_rect = text_surface.get_rect(center=(self.WIDTH // 2, current_y))
-            self.screen.blit(text_surface, text_rect)
-            current_y += self.font.get_linesize()
-
-    def show_options(self):
+        # Wrapped once and cached; fades only change the alpha of the cached lines
+        block = text_block(text, self.font, color, max_width)
+        return block.draw(self.screen, self.WIDTH // 2, y + (self.text_height - block.height) // 2, alpha)
+
+    def draw_options(self):
         self.screen.fill((0, 0, 0))
         
-        title_surface = self.title_font.render("Pixelated Showdown", True, (255, 255, 255))
+        title_surface = render_text("Pixelated Showdown", self.title_font, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 - 100))
         self.screen.blit(title_surface, title_rect)
         
-        text_surface = self.font.render("The end.", True, (255, 255, 255))
+        text_surface = render_text("The end.", self.font, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
         self.screen.blit(text_surface, text_rect)
         
-        new_game_surface = self.font.render("Press N for New Game", True, (255, 255, 255))
+        new_game_surface = render_text("Press N for New Game", self.font, (255, 255, 255))
         new_game_rect = new_game_surface.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 100))
         self.screen.blit(new_game_surface, new_game_rect)
         
-        quit_surface = self.font.render("Press Q to Quit", True, (255, 255, 255))
+        quit_surface = render_text("Press Q to Quit", self.font, (255, 255, 255))
         quit_rect = quit_surface.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 150))
         self.screen.blit(quit_surface, quit_rect)
-        
-        pygame.display.flip()
-        
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.sound_manager.stop_music()  # Stop music before quitting
-                    return "quit"
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_n:
-                        self.sound_manager.stop_music()  # Stop music before new game
-                        return "new_game"
-                    elif event.key == pygame.K_q:
-                        self.sound_manager.stop_music()  # Stop music before quitting
-                        return "quit"
-        
-        self.sound_manager.stop_music()  # Ensure music is stopped if loop is exited
-        return "quit"  # Default action if the loop is somehow exited
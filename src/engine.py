@@ -0,0 +1,211 @@
+import random
+import hashlib
+from collections import namedtuple
+from src.combo import ComboMatcher, MATCHED
+
+# Pure-Python duel rules. Nothing in here may import pygame: the engine has to
+# run headless for simulations, replays and tests. Game drives it with frame
+# deltas and key presses and turns the emitted events into sprites and sound.
+
+ARROWS = ("left", "up", "right", "down")
+
+CHAPTERS = [
+    {"name": "Little Bit", "lives": 2, "combo": 4},
+    {"name": "Brain Splitter", "lives": 2, "combo": 4},
+    {"name": "Slaughterhouse", "lives": 4, "combo": 6},
+    {"name": "Boot", "lives": 4, "combo": 8},
+    {"name": "Few Locks", "lives": 4, "combo": 8},
+    {"name": "Dry Lagoon", "lives": 6, "combo": 8},
+    {"name": "Little Chinese", "lives": 6, "combo": 8},
+    {"name": "Dried Gut", "lives": 8, "combo": 12}
+]
+
+PLAYER_LIVES = 3
+PROGRESS_SPEED = 30  # Percent of the bar per second
+ANIMATION_DURATION = 500  # Milliseconds
+COUNTDOWN_STEP = 1000  # Milliseconds per "3, 2, 1, DUEL!" step
+
+# Event kinds emitted by the engine
+CHAPTER_STARTED = "chapter_started"
+COUNTDOWN_STARTED = "countdown_started"
+DUEL_STARTED = "duel_started"
+DUEL_ENDED = "duel_ended"
+GAME_OVER = "game_over"
+GAME_WON = "game_won"
+
+Event = namedtuple("Event", ["kind", "time", "data"])
+
+
+class DuelEngine:
+    def __init__(self, keys=ARROWS, chapters=CHAPTERS, rng=None):
+        self.keys = list(keys)
+        self.chapters = [dict(chapter) for chapter in chapters]
+        self.rng = rng if rng is not None else random.Random()
+        self.progress_speed = PROGRESS_SPEED
+        self.events = []
+        self.reset()
+
+    def reset(self):
+        self.time = 0  # Simulated milliseconds since reset
+        self.player_lives = PLAYER_LIVES
+        self.game_over_state = False
+        self.won = False
+
+        self.current_chapter = 1
+        self.enemy_lives = self.chapters[0]["lives"]
+        self.combination_length = self.chapters[0]["combo"]
+
+        self.chapter_intro = False
+        self.countdown_timer = 0
+        self.animation_timer = 0  # Delay between a resolved duel and the next countdown
+
+        self.duel_started = False
+        self.winner = None
+        self.arrow_combination = []
+        self.duel_time = 0
+
+    @property
+    def chapter(self):
+        return self.chapters[self.current_chapter - 1]
+
+    @property
+    def arrow_combination(self):
+        return self.combination
+
+    @arrow_combination.setter
+    def arrow_combination(self, combination):
+        # A new combination starts a fresh attempt
+        self.combination = list(combination)
+        self.matcher = ComboMatcher(self.combination)
+
+    @property
+    def player_input(self):
+        return list(self.matcher.history)
+
+    @property
+    def correct_keys(self):
+        # Leading keys of the combination entered correctly
+        return self.matcher.progress
+
+    @property
+    def progress(self):
+        return self.duel_time * self.progress_speed / 1000
+
+    @progress.setter
+    def progress(self, value):
+        self.duel_time = value * 1000 / self.progress_speed
+
+    def emit(self, kind, **data):
+        self.events.append(Event(kind, self.time, data))
+
+    def poll_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+    def step(self, dt):
+        self.time += dt
+
+        if self.duel_started:
+            self.duel_time += dt
+            if self.progress >= 100:
+                # The bar ran out part-way through this step; only the rest
+                # of it counts towards the post-duel delay
+                dt = max(self.duel_time - 100 * 1000 / self.progress_speed, 0)
+                self.end_duel("Computer")
+
+        if self.countdown_timer > 0:
+            self.countdown_timer -= dt
+            if self.countdown_timer <= 0:
+                self.countdown_timer = 0
+                self.start_duel()
+
+        if self.animation_timer > 0:
+            self.animation_timer -= dt
+            if self.animation_timer <= 0:
+                self.animation_timer = 0
+                if not self.game_over_state:
+                    self.start_countdown()
+
+    def confirm(self):
+        # ENTER on the chapter intro
+        if self.chapter_intro:
+            self.start_countdown()
+
+    def press(self, key):
+        if not self.duel_started or key not in self.keys:
+            return
+        result = self.matcher.feed(key)
+        if result is not None:
+            self.end_duel("Player" if result == MATCHED else "Computer")
+
+    def start_chapter(self):
+        self.enemy_lives = self.chapter["lives"]
+        self.combination_length = self.chapter["combo"]
+        self.duel_started = False
+        self.countdown_timer = 0
+        self.chapter_intro = True
+        self.emit(CHAPTER_STARTED, chapter=self.current_chapter, enemy=self.chapter["name"])
+
+    def start_countdown(self):
+        self.chapter_intro = False
+        self.duel_started = False
+        self.countdown_timer = COUNTDOWN_STEP * 4
+        self.emit(COUNTDOWN_STARTED)
+
+    def start_duel(self):
+        self.countdown_timer = 0
+        self.duel_started = True
+        self.arrow_combination = [self.rng.choice(self.keys) for _ in range(self.combination_length)]
+        self.duel_time = 0
+        self.emit(DUEL_STARTED, combination=list(self.arrow_combination))
+
+    def end_duel(self, winner):
+        self.winner = winner
+        self.duel_started = False
+        self.emit(DUEL_ENDED, winner=winner)
+        if winner == "Player":
+            self.enemy_lives -= 1
+            if self.enemy_lives <= 0:
+                self.next_chapter()
+            else:
+                self.animation_timer = ANIMATION_DURATION * 3
+        else:
+            self.player_lives -= 1
+            if self.player_lives <= 0:
+                self.game_over()
+            else:
+                self.animation_timer = ANIMATION_DURATION * 3
+
+    def skip_to_end(self):
+        # Debug: jump to the last enemy's final life and win
+        self.current_chapter = len(self.chapters)
+        self.enemy_lives = 1
+        self.combination_length = self.chapter["combo"]
+        self.win_game()
+
+    def state_hash(self):
+        # Digest of everything the rules depend on, the RNG included; replays
+        # compare it at every duel boundary
+        state = (self.time, self.player_lives, self.enemy_lives, self.current_chapter,
+                 self.combination_length, self.winner, self.arrow_combination, self.correct_keys,
+                 self.duel_started, self.duel_time, self.countdown_timer, self.animation_timer,
+                 self.chapter_intro, self.game_over_state, self.won, self.rng.getstate())
+        return hashlib.blake2b(repr(state).encode(), digest_size=8).digest()
+
+    def next_chapter(self):
+        self.current_chapter += 1
+        if self.current_chapter > len(self.chapters):
+            self.win_game()
+        else:
+            self.start_chapter()
+
+    def win_game(self):
+        self.game_over_state = True
+        self.won = True
+        self.emit(GAME_WON)
+
+    def game_over(self):
+        self.game_over_state = True
+        self.duel_started = False
+        self.emit(GAME_OVER)
@@ -1,275 +1,386 @@
 import pygame
+import math
 import random
-import sys
-import logging
-import time
 from src.characters import Player, Computer
 from src.graphics import Graphics
 from src.sound import SoundManager
-from src.utils import draw_message, draw_progress_bar
+from src.utils import draw_message, draw_progress_bar, FPS, FRAME_MS
 from src.ending import EndingScene
-
-logging.basicConfig(level=logging.INFO)
-
-class Game:
-    def __init__(self, window, debug_mode=False):
+from src.text import get_font, render_text, text_block
+from src.render import FrameRenderer
+from src.scenes import Scene, SceneManager
+from src.profiler import FrameProfiler
+from src.latency import LatencyTracker
+from src.assets import assets
+from src.preload import preloader
+from src.replay import new_seed, RESET, START, CONFIRM, PRESS, STEP, NEXT, WIN, SKIP_TO_END
+from src.engine import (DuelEngine, ANIMATION_DURATION, COUNTDOWN_STEP, CHAPTER_STARTED,
+                        COUNTDOWN_STARTED, DUEL_STARTED, DUEL_ENDED, GAME_WON)
+
+def _engine_attribute(name):
+    # Expose a DuelEngine field as a Game attribute
+    return property(lambda self: getattr(self.engine, name),
+                    lambda self, value: setattr(self.engine, name, value))
+
+class Game(Scene):
+    ANIMATION_DURATION = ANIMATION_DURATION
+    COUNTDOWN_STEP = COUNTDOWN_STEP
+
+    # Duel rules live in DuelEngine; Game only renders them and plays audio
+    duel_started = _engine_attribute("duel_started")
+    winner = _engine_attribute("winner")
+    arrow_combination = _engine_attribute("arrow_combination")
+    player_input = _engine_attribute("player_input")
+    correct_keys = _engine_attribute("correct_keys")
+    progress = _engine_attribute("progress")
+    progress_speed = _engine_attribute("progress_speed")
+    animation_timer = _engine_attribute("animation_timer")
+    chapter_intro = _engine_attribute("chapter_intro")
+    countdown_timer = _engine_attribute("countdown_timer")
+    player_lives = _engine_attribute("player_lives")
+    game_over_state = _engine_attribute("game_over_state")
+    current_chapter = _engine_attribute("current_chapter")
+    enemy_lives = _engine_attribute("enemy_lives")
+    combination_length = _engine_attribute("combination_length")
+    enemies = _engine_attribute("chapters")
+
+    def __init__(self, window, debug_mode=False, fps=FPS, dirty_rects=False, seed=None, replay=None, profiler=None):
         pygame.init()
         pygame.mixer.init()
         self.WIDTH, self.HEIGHT = 800, 600
         self.screen = window  # Use the window passed from main.py
-        self.clock = pygame.time.Clock()
+        self.profiler = profiler if profiler is not None else FrameProfiler(fps or FPS)
+        self.latency = LatencyTracker()
+        self.latency_report_due = None  # Chapter whose latency report waits for the next present
+        self.fps = fps  # 0 runs uncapped
 
         self.graphics = Graphics(self.screen, self.WIDTH, self.HEIGHT)
+        self.renderer = FrameRenderer(self.screen, self.graphics.background, dirty_rects)
         self.sound_manager = SoundManager()
 
         self.debug_mode = debug_mode
-        self.ending_scene = EndingScene(self.screen, self.sound_manager)
+        self.ending_scene = None  # Built on first win
+        # One seeded RNG per session, so a replay can reproduce every combo
+        self.seed = new_seed() if seed is None else seed
+        self.engine = DuelEngine(keys=Graphics.ARROW_KEYS, rng=random.Random(self.seed))
+        self.replay = None
+        self.replay_elapsed = 0  # Playback time, for a replay being watched
 
         self.reset_game_state()
+        self.replay = replay  # A ReplayRecorder or ReplayPlayer, from the first scene on
+        if replay is not None and not replay.playing:
+            replay.begin(self.seed, self.engine.keys)
 
     def reset_game_state(self):
+        self.engine.reset()
+        self.record(RESET)
+        self.engine.poll_events()
         self.player = Player(100, self.HEIGHT - 140, self.graphics)
         self.computer = Computer(self.WIDTH - 140, self.HEIGHT - 140, self.graphics)
 
-        self.duel_started = False
-        self.winner = None
-        self.arrow_combination = []
-        self.player_input = []
-        self.progress = 0
-        self.progress_speed = 0.5
         self.progress_bar_width = 200
         self.progress_bar_height = 20
         self.progress_bar_x = self.WIDTH - 250
         self.progress_bar_y = 50
 
-        self.animation_timer = 0
-        self.ANIMATION_DURATION = 30
-
-        self.font = pygame.font.Font(None, 36)
-
-        self.player_lives = 3  # Initialize player lives
-        self.game_over_state = False  # New variable to track game over state
-        
-        self.current_chapter = 1
-        self.enemy_lives = 2
-        self.combination_length = 4
-
-        self.enemies = [
-            {"name": "Little Bit", "lives": 2, "combo": 4},
-            {"name": "Brain Splitter", "lives": 2, "combo": 4},
-            {"name": "Slaughterhouse", "lives": 4, "combo": 6},
-            {"name": "Boot", "lives": 4, "combo": 8},
-            {"name": "Few Locks", "lives": 4, "combo": 8},
-            {"name": "Dry Lagoon", "lives": 6, "combo": 8},
-            {"name": "Little Chinese", "lives": 6, "combo": 8},
-            {"name": "Dried Gut", "lives": 8, "combo": 12}
-        ]
-
-        # Start playing background music
-        self.sound_manager.stop_music()  # Stop any currently playing music
-        self.sound_manager.stop_sound('the_final_sunset')  # Explicitly stop the ending song
+        self.font = get_font(36)
+
+        # Start playing background music (no-op if it's already on)
         self.sound_manager.play_sound('background_music')
 
     def run(self):
-        self.sound_manager.play_sound('background_music')
-        running = True
-        self.start_chapter()
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F1:
-                        self.debug_mode = not self.debug_mode
-                        print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
-                    if self.debug_mode and event.key == pygame.K_F11:
-                        self.debug_skip_to_end()
-                    if self.game_over_state:
-                        if event.key == pygame.K_RETURN:
-                            self.reset_game_state()
-                            self.start_chapter()
-                        elif event.key == pygame.K_q:
-                            running = False
-                    elif self.duel_started:
-                        self.check_input(event.key)
-                    elif event.key == pygame.K_RETURN:
-                        self.start_duel()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+        # Play on its own, without the title and story scenes
+        SceneManager(self.screen, self.fps, self.profiler, self.sound_manager).run(self)
+
+    def play_replay(self):
+        # Re-run the recorded session in real time; returns the ReplayPlayer
+        # with the hash check results
+        self.run()
+        return self.replay
+
+    def enter(self):
+        if not self.playing_replay:
+            self.start_chapter()  # A replay starts its chapters itself
+        self.renderer.invalidate()
+
+    def resume(self):
+        # Back from the ending
+        self.renderer.invalidate()
+        result = self.ending_scene.result
+        if result == "new_game":
+            self.reset_game_state()
+            self.start_chapter()
+        elif result == "quit":
+            self.manager.quit()
+
+    def exit(self):
+        self.latency.log_report()
+        if self.replay is not None and not self.replay.playing:
+            self.replay.close()
         self.sound_manager.stop_music()
-        pygame.quit()
-        sys.exit()
+        preloader.release('game')
+
+    @property
+    def playing_replay(self):
+        return self.replay is not None and self.replay.playing
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_F1:
+            self.debug_mode = not self.debug_mode
+            print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+            if self.debug_mode:
+                assets.log_report()
+                self.sound_manager.channels.log_report()
+        if self.playing_replay:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.quit()
+            return  # Every other input comes from the replay
+        if self.debug_mode and event.key == pygame.K_F11:
+            self.debug_skip_to_end()
+        if self.debug_mode and event.key == pygame.K_F12:
+            self.profiler.dump_csv()
+        if self.game_over_state:
+            if event.key == pygame.K_RETURN:
+                self.reset_game_state()
+                self.start_chapter()
+            elif event.key == pygame.K_q:
+                self.manager.quit()
+        elif self.duel_started:
+            self.latency.key_down(event, self.current_chapter)
+            self.check_input(event.key)
+        elif self.chapter_intro and event.key == pygame.K_RETURN:
+            self.confirm()
+
+    def play_replay_frame(self, dt):
+        # Apply every recorded input due by now: the session keeps its
+        # recorded frame times but is drawn at the app's frame rate
+        self.replay_elapsed += dt
+        for op, arg in self.replay.ops_until(self.replay_elapsed):
+            if op == STEP:
+                self.step(arg)
+            elif op == RESET:
+                self.reset_game_state()
+            elif op == START:
+                self.start_chapter()
+            elif op == CONFIRM:
+                self.confirm()
+            elif op == PRESS:
+                self.check_input(arg)
+            elif op == NEXT:
+                self.next_chapter()
+            elif op == WIN:
+                self.win_game()
+            elif op == SKIP_TO_END:
+                self.debug_skip_to_end()
+        if self.replay.finished:
+            self.manager.quit()
+
+    def idle_ms(self):
+        # The chapter intro and the finished game-over screen only change on a key.
+        # A replay runs on recorded time, and the debug overlay keeps refreshing
+        if self.playing_replay or self.debug_mode:
+            return None
+        if self.chapter_intro:
+            return math.inf
+        if self.game_over_state and self.animation_timer <= 0 and self.player.animation_timer <= 0:
+            return math.inf
+        return None
+
+    def record(self, op, arg=0):
+        if self.replay is not None:
+            self.replay.record(op, arg)
+
+    def update(self, dt=FRAME_MS):
+        if self.playing_replay:
+            self.play_replay_frame(dt)
+        else:
+            self.step(dt)
+
+    def step(self, dt):
+        self.engine.step(dt)
+        self.record(STEP, dt)
+        self.handle_engine_events()
+        self.player.update(dt)
+        self.computer.update(dt)
+
+    def handle_engine_events(self):
+        # Translate rule changes into sprites and sound
+        for event in self.engine.poll_events():
+            if event.kind == CHAPTER_STARTED:
+                self.computer.set_enemy(event.data["enemy"])
+                if event.data["chapter"] > 1:
+                    # Once the frame showing the chapter's last key is presented
+                    self.latency_report_due = event.data["chapter"] - 1
+            elif event.kind == COUNTDOWN_STARTED:
+                self.sound_manager.play_sound('start')
+            elif event.kind == DUEL_STARTED:
+                self.graphics.build_combination_strip(event.data["combination"])
+                self.player.set_state("normal")
+                self.computer.set_state("normal")
+            elif event.kind == DUEL_ENDED:
+                self.sound_manager.play_sound('shoot')
+                if event.data["winner"] == "Player":
+                    self.player.set_state("shoot")
+                    self.computer.set_state("hit")
+                    self.sound_manager.play_sound('win')
+                else:
+                    self.player.set_state("hit")
+                    self.computer.set_state("shoot")
+                    self.sound_manager.play_sound('dead')
+                self.latency.state_changed()
+                if self.replay is not None:
+                    self.replay.duel_ended(self.engine)
+            elif event.kind == GAME_WON:
+                if self.playing_replay:
+                    continue  # What follows the ending comes from the replay
+                self.show_ending()
 
-    def update(self):
-        if self.duel_started:
-            self.progress += self.progress_speed
-            if self.progress >= 100:
-                self.end_duel("Computer")
+    def draw(self):
+        mark, lap = self.renderer.mark, self.profiler.lap
+        self.renderer.begin(self.scene_key())
+        lap("background")
 
-        if self.animation_timer > 0:
-            self.animation_timer -= 1
-            if self.animation_timer == 0:
-                if not self.game_over_state:
-                    self.start_duel()  # Start a new duel if the game isn't over
+        if self.chapter_intro:
+            mark(self.draw_chapter_intro())
+            lap("text")
+            return
 
-        self.player.update()
-        self.computer.update()
+        mark(self.player.draw(self.screen))
+        mark(self.computer.draw(self.screen))
+        lap("sprites")
 
-    def draw(self):
-        self.graphics.draw_background()
-        self.player.draw(self.screen)
-        self.computer.draw(self.screen)
+        if self.countdown_timer > 0:
+            mark(self.draw_countdown())
+            lap("text")
+            return
 
         # Draw chapter title at the top center
-        draw_message(self.screen, f"Chapter {self.current_chapter}: {self.enemies[self.current_chapter-1]['name']}", self.WIDTH, self.HEIGHT, y_offset=-280)
+        mark(draw_message(self.screen, f"Chapter {self.current_chapter}: {self.enemies[self.current_chapter-1]['name']}", self.WIDTH, self.HEIGHT, y_offset=-280))
+        lap("text")
 
         # Draw player lives on the left
-        self.graphics.draw_player_lives(self.player_lives)
+        mark(self.graphics.draw_player_lives(self.player_lives))
 
         # Draw enemy lives on the right
-        self.graphics.draw_enemy_lives(self.enemy_lives)
+        mark(self.graphics.draw_enemy_lives(self.enemy_lives))
+        lap("hud")
 
         if self.game_over_state:
-            draw_message(self.screen, "Game Over!", self.WIDTH, self.HEIGHT)
-            draw_message(self.screen, "Press ENTER to retry or Q to quit", self.WIDTH, self.HEIGHT, y_offset=50)
+            mark(draw_message(self.screen, "Game Over!", self.WIDTH, self.HEIGHT))
+            mark(draw_message(self.screen, "Press ENTER to retry or Q to quit", self.WIDTH, self.HEIGHT, y_offset=50))
+            lap("text")
         elif self.duel_started:
             # Draw arrow combination in the upper right
-            self.graphics.draw_arrow_combination(self.arrow_combination)
+            mark(self.graphics.draw_arrow_combination(self.arrow_combination, self.correct_keys))
+            lap("arrows")
             # Draw progress bar in the upper right, below the combination
             progress_bar_width = 200
             progress_bar_height = 15
             progress_bar_x = self.WIDTH - progress_bar_width - 10
             progress_bar_y = 70  # Just below the arrow combination
-            draw_progress_bar(self.screen, progress_bar_x, progress_bar_y, 
-                              progress_bar_width, progress_bar_height, self.progress)
+            mark(draw_progress_bar(self.screen, progress_bar_x, progress_bar_y,
+                                   progress_bar_width, progress_bar_height, self.progress))
+            lap("hud")
 
+    def present(self):
         if self.debug_mode:
-            debug_text = self.font.render("DEBUG MODE (F1): ON", True, (255, 0, 0))
-            self.screen.blit(debug_text, (10, self.HEIGHT - 30))
-
-        pygame.display.flip()
+            debug_text = render_text("DEBUG MODE (F1): ON", self.font, (255, 0, 0))
+            self.renderer.mark(self.screen.blit(debug_text, (10, self.HEIGHT - 30)))
+            self.renderer.mark(self.profiler.draw(self.screen, get_font(18)))
+            summary = self.latency.summary(self.current_chapter)
+            if summary:
+                latency_text = render_text(summary, get_font(18), (255, 0, 0))
+                self.renderer.mark(self.screen.blit(latency_text, (10, self.HEIGHT - 50)))
+            self.profiler.lap("overlay")
+        self.renderer.present()
+        self.latency.presented()
+        if self.latency_report_due is not None:
+            self.latency.log_report(self.latency_report_due)
+            self.latency_report_due = None
+
+    def scene_key(self):
+        # Anything that changes the whole layout forces a full repaint
+        return (self.chapter_intro, self.countdown_timer > 0, self.game_over_state, self.current_chapter)
 
     def start_chapter(self):
-        self.enemy_lives = self.enemies[self.current_chapter-1]['lives']
-        self.combination_length = self.enemies[self.current_chapter-1]['combo']
-        self.computer.set_enemy(self.enemies[self.current_chapter-1]['name'])
-        
-        # Display chapter information
-        self.graphics.draw_background()
-        draw_message(self.screen, f"Chapter {self.current_chapter}", self.WIDTH, self.HEIGHT, y_offset=-50)
-        draw_message(self.screen, f"Enemy: {self.enemies[self.current_chapter-1]['name']}", self.WIDTH, self.HEIGHT, y_offset=0)
-        draw_message(self.screen, f"Enemy Lives: {self.enemy_lives}", self.WIDTH, self.HEIGHT, y_offset=50)
-        draw_message(self.screen, "Press ENTER to start the duel", self.WIDTH, self.HEIGHT, y_offset=100)
-        pygame.display.flip()
-        
-        # Wait for player to press ENTER
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    waiting = False
-        
-        self.duel_started = False
-        self.start_duel()
+        # Show the chapter information until the player presses ENTER (handled in run)
+        self.engine.start_chapter()
+        self.record(START)
+        self.handle_engine_events()
+        preloader.enter_scene('game', self.current_chapter)
+
+    def draw_chapter_intro(self):
+        text = "\n".join([
+            f"Chapter {self.current_chapter}",
+            f"Enemy: {self.enemies[self.current_chapter-1]['name']}",
+            f"Enemy Lives: {self.enemy_lives}",
+            "Press ENTER to start the duel",
+        ])
+        block = text_block(text, get_font(36), (0, 0, 0), self.WIDTH, line_height=50)
+        return block.draw(self.screen, self.WIDTH // 2, self.HEIGHT // 2 - 50)
+
+    def start_countdown(self):
+        self.engine.start_countdown()
+        self.handle_engine_events()
+
+    def draw_countdown(self):
+        # 3, 2, 1 then DUEL! for the last step
+        step = math.ceil(self.countdown_timer / self.COUNTDOWN_STEP) - 1
+        text = str(step) if step > 0 else "DUEL!"
+        return self.draw_text(text, (255, 255, 255), self.WIDTH // 2, self.HEIGHT // 2)
 
     def start_duel(self):
-        self.sound_manager.play_sound('start')
-        
-        for i in range(3, 0, -1):
-            self.graphics.draw_background()
-            self.player.draw(self.screen)
-            self.computer.draw(self.screen)
-            self.draw_text(str(i), (255, 255, 255), self.WIDTH // 2, self.HEIGHT // 2)
-            pygame.display.flip()
-            time.sleep(1)
-        
-        self.graphics.draw_background()
-        self.player.draw(self.screen)
-        self.computer.draw(self.screen)
-        self.draw_text("DUEL!", (255, 255, 255), self.WIDTH // 2, self.HEIGHT // 2)
-        pygame.display.flip()
-        time.sleep(1)
-
-        self.duel_started = True
-        self.arrow_combination = [random.choice(Graphics.ARROW_KEYS) for _ in range(self.combination_length)]
-        self.player_input = []
-        self.progress = 0
-        self.player.set_state("normal")
-        self.computer.set_state("normal")
+        self.engine.start_duel()
+        self.handle_engine_events()
 
     def draw_text(self, text, color, x, y):
-        text_surface = self.font.render(text, True, color)
+        text_surface = render_text(text, self.font, color)
         text_rect = text_surface.get_rect()
         text_rect.center = (x, y)
-        self.screen.blit(text_surface, text_rect)
+        return self.screen.blit(text_surface, text_rect)
+
+    def confirm(self):
+        self.engine.confirm()
+        self.record(CONFIRM)
+        self.handle_engine_events()
 
     def check_input(self, key):
-        if key in Graphics.ARROW_KEYS:
-            self.player_input.append(key)
-            if self.player_input[-len(self.arrow_combination):] == self.arrow_combination:
-                self.end_duel("Player")
-            elif len(self.player_input) >= len(self.arrow_combination):
-                if self.player_input[-len(self.arrow_combination):] != self.arrow_combination:
-                    self.end_duel("Computer")
+        self.engine.press(key)
+        self.record(PRESS, key)
+        self.latency.decided()
+        self.handle_engine_events()
 
     def end_duel(self, winner):
-        self.winner = winner
-        self.sound_manager.play_sound('shoot')
-        self.duel_started = False
-        if winner == "Player":
-            self.player.set_state("shoot")
-            self.computer.set_state("hit")
-            self.sound_manager.play_sound('win')
-            self.enemy_lives -= 1
-            if self.enemy_lives <= 0:
-                self.next_chapter()
-            else:
-                self.animation_timer = self.ANIMATION_DURATION * 3
-        else:
-            self.player.set_state("hit")
-            self.computer.set_state("shoot")
-            self.sound_manager.play_sound('dead')
-            self.player_lives -= 1
-            if self.player_lives <= 0:
-                self.game_over()
-            else:
-                self.animation_timer = self.ANIMATION_DURATION * 3
+        self.engine.end_duel(winner)
+        self.handle_engine_events()
 
     def next_chapter(self):
-        self.current_chapter += 1
-        if self.current_chapter > 8:
-            self.win_game()
-        else:
-            self.start_chapter()
-        
+        self.engine.next_chapter()
+        self.record(NEXT)
+        self.handle_engine_events()
+
         if self.debug_mode:
             print(f"Skipped to Chapter {self.current_chapter}")
 
     def win_game(self):
-        self.game_over_state = True
-        self.sound_manager.stop_music()  # Stop background music
-        result = self.ending_scene.show_ending()
-        if result == "new_game":
-            self.sound_manager.stop_music()  # Stop ending music
-            self.sound_manager.stop_sound('the_final_sunset')  # Explicitly stop the ending song
-            self.reset_game_state()
-            self.start_chapter()
-        elif result == "quit":
-            pygame.quit()
-            sys.exit()
+        self.engine.win_game()
+        self.record(WIN)
+        self.handle_engine_events()
+
+    def show_ending(self):
+        if self.ending_scene is None:
+            self.ending_scene = EndingScene(self.screen, self.sound_manager)
+        self.manager.push(self.ending_scene)  # resume() picks up its result
 
     def game_over(self):
-        self.game_over_state = True
-        self.duel_started = False
+        self.engine.game_over()
+        self.handle_engine_events()
 
     def debug_skip_to_end(self):
-        self.current_chapter = 8
-        self.enemy_lives = 1
-        self.combination_length = 12
-        self.computer.set_enemy("Dried Gut")
+        self.engine.skip_to_end()
+        self.record(SKIP_TO_END)
+        self.computer.set_enemy(self.enemies[-1]["name"])
         print(f"Debug: Skipped to final chapter")
-        self.win_game()  # Call win_game() directly instead of start_chapter()
+        self.handle_engine_events()
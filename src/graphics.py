@@ -1,258 +1,308 @@
 import pygame
+from src.assets import assets
+from src.engine import CHAPTERS
+from src.pixelart import rasterise, build_sheet
+
+# Sprite pixel matrices: 1 marks a lit pixel, drawn in the sprite's palette colour
+
+ARROW_PIXELS = {
+    "left": [
+        [0,0,0,0,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,1,1,0,0,0],
+        [0,1,1,1,0,0,0],
+        [1,1,1,1,1,1,1],
+        [0,1,1,1,0,0,0],
+        [0,0,1,1,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,0,0,0,0]
+    ],
+    "up": [
+        [0,0,0,0,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,1,1,1,0,0],
+        [0,1,1,1,1,1,0],
+        [1,1,1,1,1,1,1],
+        [0,0,0,1,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,0,0,0,0]
+    ],
+    "right": [
+        [0,0,0,0,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,1,1,0,0],
+        [0,0,0,1,1,1,0],
+        [1,1,1,1,1,1,1],
+        [0,0,0,1,1,1,0],
+        [0,0,0,1,1,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,0,0,0,0]
+    ],
+    "down": [
+        [0,0,0,0,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,1,0,0,0],
+        [1,1,1,1,1,1,1],
+        [0,1,1,1,1,1,0],
+        [0,0,1,1,1,0,0],
+        [0,0,0,1,0,0,0],
+        [0,0,0,0,0,0,0]
+    ],
+}
+
+HEART_PIXELS = [
+    [0,1,1,0,1,1,0],
+    [1,1,1,1,1,1,1],
+    [1,1,1,1,1,1,1],
+    [0,1,1,1,1,1,0],
+    [0,0,1,1,1,0,0],
+    [0,0,0,1,0,0,0]
+]
+
+PLAYER_PIXELS = {
+    "normal": [
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,0,0,1,0,0],
+        [0,1,1,0,0,1,1,0],
+        [1,1,0,0,0,0,1,1],
+        [0,0,0,0,0,0,0,0]
+    ],
+    "shoot": [
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,1,1],
+        [0,0,0,1,1,0,0,1],
+        [0,0,1,0,0,1,0,0],
+        [0,1,1,0,0,1,1,0],
+        [1,1,0,0,0,0,1,1],
+        [0,0,0,0,0,0,0,0]
+    ],
+    "win": [
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,0,1,1,0,1,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,1,1,0,0,1,1,0],
+        [1,1,0,0,0,0,1,1],
+        [1,0,0,0,0,0,0,1],
+        [0,0,0,0,0,0,0,0]
+    ],
+    "hit": [
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,0,1,1,1,1,0,0],
+        [0,0,0,1,1,0,0,0],
+        [0,1,0,0,0,0,1,0],
+        [1,0,1,0,0,1,0,1],
+        [0,0,1,0,0,1,0,0],
+        [0,0,1,0,0,1,0,0]
+    ],
+}
+
+COMPUTER_PIXELS = {
+    "normal": [
+        [0,1,1,1,1,1,0,0],
+        [1,1,1,1,1,1,0,0],
+        [1,0,1,1,1,0,0,0],
+        [1,1,1,1,1,1,0,0],
+        [0,1,1,1,1,1,1,0],
+        [0,0,1,1,1,0,0,1],
+        [0,0,1,1,1,0,0,0],
+        [0,0,1,0,1,0,0,0]
+    ],
+    "shoot": [
+        [0,1,1,1,1,1,0,0],
+        [1,1,1,1,1,1,0,0],
+        [1,0,1,1,1,0,0,0],
+        [1,1,1,1,1,1,1,1],
+        [0,1,1,1,1,1,1,1],
+        [0,0,1,1,1,0,0,1],
+        [0,0,1,1,1,0,0,0],
+        [0,0,1,0,1,0,0,0]
+    ],
+    "win": [
+        [0,1,1,1,1,1,0,0],
+        [1,1,1,1,1,1,0,0],
+        [1,0,1,1,1,0,1,0],
+        [1,1,1,1,1,1,0,0],
+        [0,1,1,1,1,1,1,0],
+        [0,0,1,1,1,0,0,1],
+        [0,1,1,0,1,1,0,0],
+        [1,0,1,0,1,0,1,0]
+    ],
+    "hit": [
+        [0,1,1,1,1,1,0,0],
+        [1,1,1,1,1,1,0,0],
+        [1,0,1,1,1,0,0,0],
+        [1,1,1,1,1,1,0,0],
+        [0,1,1,1,1,1,1,0],
+        [0,0,1,1,1,0,0,1],
+        [0,1,0,1,0,1,0,0],
+        [1,0,0,1,0,0,1,0]
+    ],
+}
+
+ENEMY_PIXELS = {
+    "Little Bit": [
+        [0,0,1,1,1,1,0,0],
+        [0,1,1,1,1,1,1,0],
+        [1,0,1,0,0,1,0,1],
+        [1,1,1,1,1,1,1,1],
+        [0,1,1,1,1,1,1,0],
+        [0,0,1,0,0,1,0,0],
+        [0,1,0,0,0,0,1,0],
+        [1,0,0,0,0,0,0,1]
+    ],
+    "Brain Breaker": [
+        [0,1,1,1,1,1,1,0],
+        [1,1,0,1,1,0,1,1],
+        [1,0,1,1,1,1,0,1],
+        [1,1,1,0,0,1,1,1],
+        [1,1,0,1,1,0,1,1],
+        [0,1,1,1,1,1,1,0],
+        [0,0,1,0,0,1,0,0],
+        [0,1,0,0,0,0,1,0]
+    ],
+}
+
+DEFAULT_ENEMY_PIXELS = [
+    [0,1,1,1,1,1,0,0],
+    [1,1,1,1,1,1,1,0],
+    [1,0,1,1,1,0,1,0],
+    [1,1,1,1,1,1,1,0],
+    [0,1,1,1,1,1,1,0],
+    [0,0,1,1,1,0,1,0],
+    [0,1,0,1,0,1,0,0],
+    [1,0,0,1,0,0,1,0]
+]
+
+
+def build_background(width, height):
+    background = pygame.Surface((width, height))
+    background.fill((135, 206, 235))  # Sky blue
+    pygame.draw.rect(background, (139, 69, 19), (0, height - 100, width, 100))  # Ground
+    return background
+
 
 class Graphics:
     ARROW_KEYS = [pygame.K_LEFT, pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN]
+    ARROW_SIZE = 25  # Display size of the combination arrows
+    ARROW_SPACING = 5
+    HIGHLIGHT_COLOR = (0, 200, 0, 110)  # Overlay on keys already entered correctly
+    SPRITE_SIZE = (50, 50)
 
     def __init__(self, screen, width, height):
         self.screen = screen
         self.WIDTH = width
         self.HEIGHT = height
+        self.asset_keys = []
         self.load_images()
         self.create_background()
-        self.heart_image = self.create_heart_image()
+        self.heart_image = self.acquire('heart', self.create_heart_image)
+
+    def acquire(self, name, builder):
+        # Sprites are built once per process and shared through the asset manager
+        self.asset_keys.append(('sprites', name))
+        return assets.sprites(name, builder)
+
+    def close(self):
+        for key in self.asset_keys:
+            assets.release(key)
+        self.asset_keys = []
 
     def load_images(self):
-        self.arrow_images = {
-            pygame.K_LEFT: self.create_arrow_image("left"),
-            pygame.K_UP: self.create_arrow_image("up"),
-            pygame.K_RIGHT: self.create_arrow_image("right"),
-            pygame.K_DOWN: self.create_arrow_image("down")
-        }
+        self.arrow_images = self.acquire('arrows', self.create_arrow_images)
+        self.arrow_atlas, self.arrow_atlas_rects, self.arrow_highlight = \
+            self.acquire('arrow_atlas', self.create_arrow_atlas)
+        self.combination_key = None
+        self.combination_strip = None
+        self.highlighted = 0
         
-        self.player_images = {
-            "normal": self.create_player_image(),
-            "shoot": self.create_player_shoot_image(),
-            "win": self.create_player_win_image(),
-            "hit": self.create_player_hit_image()
-        }
-        
-        self.computer_images = {
-            "normal": self.create_computer_image(),
-            "shoot": self.create_computer_shoot_image(),
-            "win": self.create_computer_win_image(),
-            "hit": self.create_computer_hit_image()
-        }
-        
-        self.enemy_images = {
-            "Little Bit": self.create_enemy_image("Little Bit"),
-            "Brain Splitter": self.create_enemy_image("Brain Splitter"),
-            "Slaughterhouse": self.create_enemy_image("Slaughterhouse"),
-            "Boot": self.create_enemy_image("Boot"),
-            "Few Locks": self.create_enemy_image("Few Locks"),
-            "Dry Lagoon": self.create_enemy_image("Dry Lagoon"),
-            "Little Chinese": self.create_enemy_image("Little Chinese"),
-            "Dried Gut": self.create_enemy_image("Dried Gut")
-        }
+        # Each character set is one sprite sheet, rasterised in a single pass
+        self.player_images = self.acquire('player', lambda: build_sheet(PLAYER_PIXELS, self.SPRITE_SIZE, [(0, 0, 0)]))
+        self.computer_images = self.acquire('computer', lambda: build_sheet(COMPUTER_PIXELS, self.SPRITE_SIZE, [(0, 0, 0)]))
+        self.enemy_images = self.acquire('enemies', lambda: build_sheet(
+            {chapter["name"]: ENEMY_PIXELS.get(chapter["name"], DEFAULT_ENEMY_PIXELS) for chapter in CHAPTERS},
+            self.SPRITE_SIZE, [(0, 0, 0)]))
 
-    def create_arrow_image(self, direction):
+    def create_arrow_images(self):
         size = 60  # Increased size
-        image = pygame.Surface((size, size), pygame.SRCALPHA)
         color = (255, 255, 255)  # White color
         border_color = (100, 100, 100)  # Gray color for border
-        
-        # Draw the key border
-        pygame.draw.rect(image, border_color, (0, 0, size, size))
-        pygame.draw.rect(image, color, (2, 2, size-4, size-4))
-        
-        # Draw the arrow
-        if direction == "left":
-            arrow = [
-                [0,0,0,0,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,1,1,0,0,0],
-                [0,1,1,1,0,0,0],
-                [1,1,1,1,1,1,1],
-                [0,1,1,1,0,0,0],
-                [0,0,1,1,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,0,0,0,0]
-            ]
-        elif direction == "up":
-            arrow = [
-                [0,0,0,0,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,1,1,1,0,0],
-                [0,1,1,1,1,1,0],
-                [1,1,1,1,1,1,1],
-                [0,0,0,1,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,0,0,0,0]
-            ]
-        elif direction == "right":
-            arrow = [
-                [0,0,0,0,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,1,1,0,0],
-                [0,0,0,1,1,1,0],
-                [1,1,1,1,1,1,1],
-                [0,0,0,1,1,1,0],
-                [0,0,0,1,1,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,0,0,0,0]
-            ]
-        elif direction == "down":
-            arrow = [
-                [0,0,0,0,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,1,0,0,0],
-                [1,1,1,1,1,1,1],
-                [0,1,1,1,1,1,0],
-                [0,0,1,1,1,0,0],
-                [0,0,0,1,0,0,0],
-                [0,0,0,0,0,0,0]
-            ]
-        
         pixel_size = 6
-        for y, row in enumerate(arrow):
-            for x, pixel in enumerate(row):
-                if pixel:
-                    pygame.draw.rect(image, (0, 0, 0), (x * pixel_size + 6, y * pixel_size + 6, pixel_size, pixel_size))
-        
-        return image
-
-    def create_pixel_art(self, width, height, color, pixels):
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        pixel_size = min(width // len(pixels[0]), height // len(pixels))
-        for y, row in enumerate(pixels):
-            for x, pixel in enumerate(row):
-                if pixel:
-                    pygame.draw.rect(surface, color, (x * pixel_size, y * pixel_size, pixel_size, pixel_size))
-        return surface
-
-    def create_player_image(self):
-        pixels = [
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,0,0,1,0,0],
-            [0,1,1,0,0,1,1,0],
-            [1,1,0,0,0,0,1,1],
-            [0,0,0,0,0,0,0,0]
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+        directions = {pygame.K_LEFT: "left", pygame.K_UP: "up", pygame.K_RIGHT: "right", pygame.K_DOWN: "down"}
+        glyph_size = (len(ARROW_PIXELS["left"][0]) * pixel_size, len(ARROW_PIXELS["left"]) * pixel_size)
+        glyphs = build_sheet(ARROW_PIXELS, glyph_size, [(0, 0, 0)])
 
-    def create_player_shoot_image(self):
-        pixels = [
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,1,1],
-            [0,0,0,1,1,0,0,1],
-            [0,0,1,0,0,1,0,0],
-            [0,1,1,0,0,1,1,0],
-            [1,1,0,0,0,0,1,1],
-            [0,0,0,0,0,0,0,0]
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+        images = {}
+        for key, direction in directions.items():
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            # Draw the key border, then the arrow
+            pygame.draw.rect(image, border_color, (0, 0, size, size))
+            pygame.draw.rect(image, color, (2, 2, size-4, size-4))
+            image.blit(glyphs[direction], (6, 6))
+            images[key] = image
+        return images
 
-    def create_player_win_image(self):
-        pixels = [
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,0,1,1,0,1,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,1,1,0,0,1,1,0],
-            [1,1,0,0,0,0,1,1],
-            [1,0,0,0,0,0,0,1],
-            [0,0,0,0,0,0,0,0]
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
-
-    def create_player_hit_image(self):
-        pixels = [
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,1,1,1,1,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,1,0,0,0,0,1,0],
-            [1,0,1,0,0,1,0,1],
-            [0,0,1,0,0,1,0,0],
-            [0,0,1,0,0,1,0,0]
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+    def create_background(self):
+        self.background = self.acquire(('background', self.WIDTH, self.HEIGHT), self.create_background_image)
 
-    def create_computer_image(self):
-        pixels = [
-            [0,1,1,1,1,1,0,0],
-            [1,1,1,1,1,1,0,0],
-            [1,0,1,1,1,0,0,0],
-            [1,1,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,0,1,1,1,0,0,1],
-            [0,0,1,1,1,0,0,0],
-            [0,0,1,0,1,0,0,0],
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+    def create_background_image(self):
+        return build_background(self.WIDTH, self.HEIGHT)
 
-    def create_computer_shoot_image(self):
-        pixels = [
-            [0,1,1,1,1,1,0,0],
-            [1,1,1,1,1,1,0,0],
-            [1,0,1,1,1,0,0,0],
-            [1,1,1,1,1,1,1,1],
-            [0,1,1,1,1,1,1,1],
-            [0,0,1,1,1,0,0,1],
-            [0,0,1,1,1,0,0,0],
-            [0,0,1,0,1,0,0,0],
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+    def draw_background(self):
+        return self.screen.blit(self.background, (0, 0))
 
-    def create_computer_win_image(self):
-        pixels = [
-            [0,1,1,1,1,1,0,0],
-            [1,1,1,1,1,1,0,0],
-            [1,0,1,1,1,0,1,0],
-            [1,1,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,0,1,1,1,0,0,1],
-            [0,1,1,0,1,1,0,0],
-            [1,0,1,0,1,0,1,0],
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+    def create_arrow_atlas(self):
+        # Bake every arrow glyph at its display size into one surface, once
+        size = self.ARROW_SIZE
+        atlas = pygame.Surface((size * len(self.ARROW_KEYS), size), pygame.SRCALPHA)
+        rects = {}
+        for i, key in enumerate(self.ARROW_KEYS):
+            glyph = pygame.transform.scale(self.arrow_images[key], (size, size))
+            rects[key] = atlas.blit(glyph, (i * size, 0))
+        highlight = pygame.Surface((size, size), pygame.SRCALPHA)
+        highlight.fill(self.HIGHLIGHT_COLOR)
+        return atlas, rects, highlight
 
-    def create_computer_hit_image(self):
-        pixels = [
-            [0,1,1,1,1,1,0,0],
-            [1,1,1,1,1,1,0,0],
-            [1,0,1,1,1,0,0,0],
-            [1,1,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,0,1,1,1,0,0,1],
-            [0,1,0,1,0,1,0,0],
-            [1,0,0,1,0,0,1,0],
-        ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+    def build_combination_strip(self, combination):
+        # Render the whole combination once per duel; frames then do a single blit
+        size, spacing = self.ARROW_SIZE, self.ARROW_SPACING
+        total_width = max(len(combination) * (size + spacing) - spacing, 0)
+        self.combination_strip = pygame.Surface((total_width, size), pygame.SRCALPHA)
+        for i, key in enumerate(combination):
+            area = self.arrow_atlas_rects.get(key)
+            if area:
+                self.combination_strip.blit(self.arrow_atlas, (i * (size + spacing), 0), area)
+        self.combination_key = tuple(combination)
+        self.highlighted = 0
 
-    def create_background(self):
-        self.background = pygame.Surface((self.WIDTH, self.HEIGHT))
-        self.background.fill((135, 206, 235))  # Sky blue
-        pygame.draw.rect(self.background, (139, 69, 19), (0, self.HEIGHT - 100, self.WIDTH, 100))  # Ground
+    def draw_arrow_combination(self, combination, correct=0):
+        if tuple(combination) != self.combination_key or correct < self.highlighted:
+            self.build_combination_strip(combination)
 
-    def draw_background(self):
-        self.screen.blit(self.background, (0, 0))
+        # Highlight newly entered keys on top of the cached strip
+        size, spacing = self.ARROW_SIZE, self.ARROW_SPACING
+        for i in range(self.highlighted, min(correct, len(combination))):
+            self.combination_strip.blit(self.arrow_highlight, (i * (size + spacing), 0))
+        self.highlighted = max(self.highlighted, correct)
 
-    def draw_arrow_combination(self, combination):
-        arrow_size = 25  # Slightly smaller arrows
-        spacing = 5
-        total_width = len(combination) * (arrow_size + spacing) - spacing
-        start_x = self.WIDTH - total_width - 10  # 10 pixels from the right edge
+        start_x = self.WIDTH - self.combination_strip.get_width() - 10  # 10 pixels from the right edge
         start_y = 40  # Just below the enemy lives
-
-        for i, key in enumerate(combination):
-            image = self.arrow_images.get(key)
-            if image:
-                scaled_image = pygame.transform.scale(image, (arrow_size, arrow_size))
-                self.screen.blit(scaled_image, (start_x + i * (arrow_size + spacing), start_y))
+        return self.screen.blit(self.combination_strip, (start_x, start_y))
 
     def get_player_image(self, state):
         return self.player_images.get(state, self.player_images["normal"])
@@ -261,72 +311,14 @@ class Graphics:
         return self.computer_images.get(state, self.computer_images["normal"])
 
     def create_heart_image(self):
-        size = 20
-        image = pygame.Surface((size, size), pygame.SRCALPHA)
-        color = (255, 0, 0)  # Red color for heart
-        
-        heart = [
-            [0,1,1,0,1,1,0],
-            [1,1,1,1,1,1,1],
-            [1,1,1,1,1,1,1],
-            [0,1,1,1,1,1,0],
-            [0,0,1,1,1,0,0],
-            [0,0,0,1,0,0,0],
-        ]
-        
-        pixel_size = 2
-        for y, row in enumerate(heart):
-            for x, pixel in enumerate(row):
-                if pixel:
-                    pygame.draw.rect(image, color, (x * pixel_size + 3, y * pixel_size + 4, pixel_size, pixel_size))
-        
-        return image
+        image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        return rasterise(HEART_PIXELS, 2, [(255, 0, 0)], image, offset=(3, 4))  # Red heart
 
     def draw_player_lives(self, lives):
-        for i in range(lives):
-            self.screen.blit(self.heart_image, (10 + i * 25, 10))
+        return [self.screen.blit(self.heart_image, (10 + i * 25, 10)) for i in range(lives)]
 
     def draw_enemy_lives(self, lives):
-        for i in range(lives):
-            self.screen.blit(self.heart_image, (self.WIDTH - 30 - i * 25, 10))
-
-    def create_enemy_image(self, enemy_name):
-        # Create different pixel art for each enemy
-        if enemy_name == "Little Bit":
-            pixels = [
-                [0,0,1,1,1,1,0,0],
-                [0,1,1,1,1,1,1,0],
-                [1,0,1,0,0,1,0,1],
-                [1,1,1,1,1,1,1,1],
-                [0,1,1,1,1,1,1,0],
-                [0,0,1,0,0,1,0,0],
-                [0,1,0,0,0,0,1,0],
-                [1,0,0,0,0,0,0,1]
-            ]
-        elif enemy_name == "Brain Breaker":
-            pixels = [
-                [0,1,1,1,1,1,1,0],
-                [1,1,0,1,1,0,1,1],
-                [1,0,1,1,1,1,0,1],
-                [1,1,1,0,0,1,1,1],
-                [1,1,0,1,1,0,1,1],
-                [0,1,1,1,1,1,1,0],
-                [0,0,1,0,0,1,0,0],
-                [0,1,0,0,0,0,1,0]
-            ]
-        # ... (create pixel art for other enemies)
-        else:
-            pixels = [
-                [0,1,1,1,1,1,0,0],
-                [1,1,1,1,1,1,1,0],
-                [1,0,1,1,1,0,1,0],
-                [1,1,1,1,1,1,1,0],
-                [0,1,1,1,1,1,1,0],
-                [0,0,1,1,1,0,1,0],
-                [0,1,0,1,0,1,0,0],
-                [1,0,0,1,0,0,1,0]
-            ]
-        return self.create_pixel_art(50, 50, (0, 0, 0), pixels)
+        return [self.screen.blit(self.heart_image, (self.WIDTH - 30 - i * 25, 10)) for i in range(lives)]
 
     def get_enemy_image(self, enemy_name):
         return self.enemy_images.get(enemy_name, self.enemy_images["Little Bit"])
\ No newline at end of file
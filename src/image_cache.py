@@ -0,0 +1,84 @@
+import io
+import os
+import glob
+import hashlib
+import logging
+import mmap
+import pygame
+
+# Persistent cache of decoded, pre-scaled images. Entries are raw pixel
+# buffers in the display's pixel format, named after a hash of the source
+# file contents, the target size and the pixel format, so editing a PNG or
+# changing the display size simply misses and rebuilds. Hits are mapped with
+# mmap and copied straight into a surface: no PNG decode, no resample.
+
+CACHE_VERSION = 1
+
+def default_cache_dir():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.environ.get('PIXELATED_SHOWDOWN_CACHE', os.path.join(base, 'pixelated-showdown', 'images'))
+
+
+class ImageCache:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def new_surface(self, size):
+        # Display format when a window exists, otherwise the usual XRGB8888
+        display = pygame.display.get_surface() if pygame.display.get_init() else None
+        if display is not None:
+            return pygame.Surface(size, 0, display)
+        return pygame.Surface(size, 0, 32)
+
+    def entry_path(self, path, data, size, surface):
+        digest = hashlib.sha256()
+        digest.update(data)
+        digest.update(repr((CACHE_VERSION, size, surface.get_bitsize(),
+                            surface.get_masks(), surface.get_pitch())).encode())
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{size[0]}x{size[1]}-{digest.hexdigest()[:16]}.raw")
+
+    def load(self, path, size, data=None):
+        # data: the file's contents when they are already at hand, e.g. in the asset pack
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        surface = self.new_surface(size)
+        entry = self.entry_path(path, data, size, surface)
+        expected = surface.get_pitch() * size[1]
+
+        try:
+            with open(entry, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pixels:
+                    if len(pixels) == expected:
+                        with memoryview(surface.get_view('0')) as view:
+                            view.cast('B')[:] = pixels
+                        self.hits += 1
+                        return surface
+        except (OSError, ValueError):
+            pass
+
+        self.misses += 1
+        image = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+        surface.blit(pygame.transform.scale(image, size), (0, 0))
+        self.store(entry, surface)
+        return surface
+
+    def store(self, entry, surface):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Drop stale entries for the same image and size before writing the new one
+            prefix = os.path.basename(entry).rsplit('-', 1)[0]
+            for stale in glob.glob(os.path.join(self.cache_dir, glob.escape(prefix) + '-*.raw')):
+                os.remove(stale)
+            temp = entry + '.tmp'
+            with open(temp, 'wb') as f:
+                f.write(surface.get_buffer().raw)
+            os.replace(temp, entry)
+        except OSError as e:
+            logging.warning(f"Couldn't write image cache {entry}: {e}")
+
+
+image_cache = ImageCache()
@@ -0,0 +1,143 @@
+import time
+import random
+import logging
+import threading
+from collections import deque
+import pygame
+from src.profiler import percentile
+
+# Input-to-photon latency for duel key presses. Each KEYDOWN is stamped when
+# it is pulled from the queue (or when it was injected, for synthetic
+# events), then again when check_input has decided, when end_duel has changed
+# the state and when the frame showing the result has been flipped. Samples
+# are kept per chapter; LatencyProbe plays duels with synthetic key presses
+# at random points in the frame so the whole pipeline can be measured
+# without a player.
+
+HISTORY = 1000  # Presses kept per chapter
+
+
+class Press:
+    def __init__(self, chapter, key_down):
+        self.chapter = chapter
+        self.key_down = key_down
+        self.decision = None
+        self.state = None
+
+    def latencies(self, presented):
+        # (key -> decision, key -> state change or None, key -> photon) in ms
+        def since(stamp):
+            return None if stamp is None else (stamp - self.key_down) * 1000
+        return since(self.decision), since(self.state), since(presented)
+
+
+class LatencyTracker:
+    def __init__(self, clock=time.perf_counter, history=HISTORY):
+        self.clock = clock
+        self.history = history
+        self.open = []  # Presses whose result hasn't been presented yet
+        self.samples = {}  # chapter -> deque of Press.latencies()
+        self.decisive = 0  # Presses that ended a duel
+
+    def key_down(self, event, chapter):
+        stamp = getattr(event, 'injected_at', None)
+        press = Press(chapter, stamp if stamp is not None else self.clock())
+        self.open.append(press)
+        return press
+
+    def decided(self):
+        if self.open and self.open[-1].decision is None:
+            self.open[-1].decision = self.clock()
+
+    def state_changed(self):
+        if self.open and self.open[-1].state is None:
+            self.open[-1].state = self.clock()
+
+    def presented(self):
+        if not self.open:
+            return
+        now = self.clock()
+        for press in self.open:
+            samples = self.samples.setdefault(press.chapter, deque(maxlen=self.history))
+            samples.append(press.latencies(now))
+            if press.state is not None:
+                self.decisive += 1
+        self.open = []
+
+    def stats(self, chapter):
+        samples = self.samples.get(chapter)
+        if not samples:
+            return None
+        photon = sorted(sample[2] for sample in samples)
+        decisions = [sample[0] for sample in samples if sample[0] is not None]
+        states = [sample[1] for sample in samples if sample[1] is not None]
+        return {
+            "count": len(photon),
+            "p50": percentile(photon, 0.5),
+            "p95": percentile(photon, 0.95),
+            "p99": percentile(photon, 0.99),
+            "max": photon[-1],
+            "decision": sum(decisions) / len(decisions) if decisions else 0.0,
+            "state": sum(states) / len(states) if states else 0.0,
+        }
+
+    def summary(self, chapter):
+        stats = self.stats(chapter)
+        if stats is None:
+            return None
+        return (f"input->photon ch {chapter}: p50 {stats['p50']:.1f} p95 {stats['p95']:.1f} "
+                f"p99 {stats['p99']:.1f} max {stats['max']:.1f} ms ({stats['count']} keys)")
+
+    def log_report(self, chapter=None):
+        chapters = sorted(self.samples) if chapter is None else [chapter]
+        for number in chapters:
+            stats = self.stats(number)
+            if stats is not None:
+                logging.info(f"{self.summary(number)}; decision {stats['decision']:.2f} ms, "
+                             f"state change {stats['state']:.2f} ms after the key")
+
+
+class LatencyProbe:
+    # Plays the game with synthetic key presses posted from a worker thread at
+    # random times, so presses land anywhere in the frame, then quits
+    def __init__(self, game, duels=30, delay_ms=(40, 120), rng=None):
+        self.game = game
+        self.duels = duels
+        self.delay_ms = delay_ms
+        self.rng = rng if rng is not None else random.Random()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="latency-probe", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def post_key(self, key):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0,
+                                             injected_at=self.game.latency.clock()))
+
+    def next_key(self):
+        game = self.game
+        if game.chapter_intro:
+            return pygame.K_RETURN
+        if game.duel_started:
+            try:
+                return game.arrow_combination[game.correct_keys]
+            except IndexError:
+                return None
+        return None
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.rng.uniform(*self.delay_ms) / 1000):
+                if self.game.latency.decisive >= self.duels:
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return
+                key = self.next_key()
+                if key is not None:
+                    self.post_key(key)
+        except pygame.error:
+            pass  # The display went away under us
@@ -1,126 +1,207 @@
 import sys
 import os
-import pygame
-from pygame.locals import *
+import math
+import logging
+import argparse
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-from src.game import Game
-from src.graphics import Graphics
-from src.presentation import Presentation
-from src.sound import SoundManager
-from src.ending import EndingScene
+from src.startup import timeline, Deferred  # Starts the startup clock
 
-# Initialize Pygame
-pygame.init()
+with timeline.phase("import pygame"):
+    import pygame
+    from pygame.locals import *
+
+# Only what the title screen needs; the game, the story and the replay code
+# are imported when first used or on an idle frame behind the title
+with timeline.phase("import title"):
+    from src.graphics import Graphics, build_background
+    from src.assets import assets
+    from src.sound import SoundManager
+    from src.scenes import Scene, SceneManager
+    from src.profiler import FrameProfiler
+    from src.utils import FPS
+    from src.text import get_font, render_text
+    from src.preload import preloader
 
 # Set up the game window
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
-window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("Pixelated Showdown")
 
 # Colors
 WHITE = (255, 255, 255)
 
-# Fonts
-font = pygame.font.Font(None, 36)
-title_font = pygame.font.Font(None, 72)  # Larger font for the title
-
-# Create instances
-graphics = Graphics(window, WINDOW_WIDTH, WINDOW_HEIGHT)
-sound_manager = SoundManager()
+def create_window():
+    # Display and fonts only: the mixer is opened by the first SoundManager
+    pygame.display.init()
+    pygame.font.init()
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Pixelated Showdown")
+    return window
 
-def draw_text(text, font, color, x, y):
-    text_surface = font.render(text, True, color)
+def draw_text(screen, text, font, color, x, y):
+    text_surface = render_text(text, font, color)
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
-    window.blit(text_surface, text_rect)
-
-def game_start_screen():
-    sound_manager.play_sound('background_music')
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == KEYDOWN and event.key == K_RETURN:
-                waiting = False
-        
-        graphics.draw_background()
+    screen.blit(text_surface, text_rect)
+
+class TitleScene(Scene):
+    def __init__(self, screen, sound):
+        self.screen = screen
+        self.sound = sound  # Deferred SoundManager
+        self.background = assets.sprites(('background', WINDOW_WIDTH, WINDOW_HEIGHT),
+                                         lambda: build_background(WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.font = get_font(36)
+        self.title_font = get_font(72)  # Larger font for the title
+
+    def enter(self):
+        # The music starts after the first frame, so opening the mixer doesn't hold up the title
+        self.manager.defer(self.start_music)
+        preloader.enter_scene('title')  # Warm the story slides while the title is up
+
+    def start_music(self):
+        if self.manager.top is self:
+            self.sound.get().play_sound('background_music')
+
+    def handle_event(self, event):
+        if event.type == KEYDOWN and event.key == K_RETURN:
+            self.sound.get().stop_music()
+            self.manager.switch('presentation')
+
+    def idle_ms(self):
+        return math.inf  # Nothing moves until ENTER
+
+    def draw(self):
+        self.screen.blit(self.background, (0, 0))
         
         # Draw the game title
-        draw_text("The Pixelated Showdown", title_font, WHITE, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50)
+        draw_text(self.screen, "The Pixelated Showdown", self.title_font, WHITE, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50)
         
         # Draw the "Press ENTER to start" message
-        draw_text("Press ENTER to start", font, WHITE, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50)
-        
-        pygame.display.flip()
-    sound_manager.stop_music()
+        draw_text(self.screen, "Press ENTER to start", self.font, WHITE, WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50)
+
+def import_scenes():
+    # Warms sys.modules; the factories below import from there
+    import src.game
+    import src.presentation
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="The Pixelated Showdown")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="redraw and present only the changed regions of the duel screen")
+    parser.add_argument('--latency-test', type=int, nargs='?', const=30, metavar='DUELS',
+                        help="skip to the duels, play DUELS of them (default 30) with synthetic key presses "
+                             "and log the input-to-photon latency per chapter")
+    parser.add_argument('--seed', type=int,
+                        help="seed the session's combos instead of picking a random seed")
+    parser.add_argument('--record', nargs='?', const='', metavar='FILE',
+                        help="record the session to a replay file (default: a new file in "
+                             "~/.cache/pixelated-showdown/replays)")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="watch a recorded session at 1x and check it against the recorded state hashes")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print how long each startup phase took, up to the title screen and the work "
+                             "deferred behind it, then quit")
+    return parser.parse_args(argv)
+
+def new_recorder(args):
+    from src.replay import ReplayRecorder
+    if args.record is None:
+        return None
+    return ReplayRecorder(args.record or None)
 
-def debug_skip_to_end():
-    global current_state
-    print("Debug: Skipping to end")
-    current_state = "ending"
-    sound_manager.stop_music()
-    sound_manager.play_sound('the_final_sunset')
+def watch_replay(window, path, dirty_rects):
+    from src.game import Game
+    from src.replay import Replay, ReplayError, ReplayPlayer
+    try:
+        replay = Replay.load(path)
+    except (OSError, ReplayError) as e:
+        logging.error(f"Couldn't load replay {path}: {e}")
+        return 2
+    if replay.keys != list(Graphics.ARROW_KEYS):
+        logging.error(f"Replay {path} was recorded with different keys")
+        return 2
+    game = Game(window, dirty_rects=dirty_rects, seed=replay.seed, replay=ReplayPlayer(replay))
+    player = game.play_replay()
+    if player.verified:
+        logging.info(f"Replay finished: all {player.duels} duel state hashes match")
+        return 0
+    logging.error(f"Replay diverged at duels {player.mismatches} "
+                  f"({player.duels} played, {len(replay.hashes)} recorded)")
+    return 1
+
+def latency_test(window, args):
+    from src.game import Game
+    from src.latency import LatencyProbe
+    game = Game(window, dirty_rects=args.dirty_rects, seed=args.seed, replay=new_recorder(args))
+    LatencyProbe(game, args.latency_test).start()
+    game.run()  # Logs the latency report once the probe quits
+
+def print_startup_profile(manager):
+    print("Startup timeline:")
+    for line in timeline.report():
+        print(line)
+    manager.quit()
 
 def main():
-    global current_state, player, enemy, chapter, game, debug_mode
-    
-    while True:
-        game_start_screen()  # Show the start screen first
-        
-        current_state = "presentation"  # Initialize the current_state to "presentation"
-        debug_mode = False  # Initialize debug_mode to False
-        
-        ending_scene = EndingScene(window, sound_manager)
-        
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F1:
-                        debug_mode = not debug_mode
-                        print(f"Debug mode: {'ON' if debug_mode else 'OFF'}")
-                    elif debug_mode and event.key == pygame.K_F11:
-                        debug_skip_to_end()
-                        if 'game' in locals():
-                            game.win_game()  # Call win_game() if game object exists
-            
-            if current_state == "presentation":
-                sound_manager.stop_music()  # Ensure all music is stopped
-                sound_manager.play_sound('presentation_music')
-                presentation = Presentation(window, WINDOW_WIDTH, WINDOW_HEIGHT)
-                if presentation.run():
-                    sound_manager.fade_out(1000)  # Fade out the presentation music over 1 second
-                    sound_manager.play_sound('background_music')
-                    game = Game(window, debug_mode)  # Pass debug_mode to Game
-                    current_state = "game"
-                else:
-                    pygame.quit()
-                    sys.exit()
-            elif current_state == "game":
-                game.run()
-                if game.debug_mode != debug_mode:  # Update debug_mode if changed in game
-                    debug_mode = game.debug_mode
-            elif current_state == "ending":
-                result = ending_scene.show_ending()
-                if result == "new_game":
-                    sound_manager.stop_music()  # Stop all music before starting a new game
-                    sound_manager.stop_sound('the_final_sunset')  # Explicitly stop the ending song
-                    break  # Break the inner loop to restart the game
-                elif result == "quit":
-                    pygame.quit()
-                    sys.exit()
-            
-            pygame.display.flip()
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with timeline.phase("asset pack"):
+        assets.open_pack()  # Loose files under assets/ unless there is one
+    with timeline.phase("window"):
+        window = create_window()
+
+    if args.replay:
+        status = watch_replay(window, args.replay, args.dirty_rects)
+        pygame.quit()
+        sys.exit(status)
+
+    if args.latency_test:
+        latency_test(window, args)
+        pygame.quit()
+        sys.exit()
+
+    # Title, story and duels share one loop; each scene is built on first use
+    # and kept for the rest of the run. Only the title is built before the
+    # first frame: audio, sprites and the other scenes' code come after it,
+    # on idle frames, unless the player gets to them first.
+    manager = SceneManager(window, profiler=FrameProfiler(FPS))
+
+    def open_sound():
+        manager.sound_manager = SoundManager(load=False)
+        return manager.sound_manager
+
+    def build_game():
+        from src.game import Game
+        return Game(window, dirty_rects=args.dirty_rects, seed=args.seed,
+                    replay=new_recorder(args), profiler=manager.profiler)
+
+    def build_presentation():
+        from src.presentation import Presentation
+        return Presentation(window, WINDOW_WIDTH, WINDOW_HEIGHT, sound.get())
+
+    sound = Deferred("sound", open_sound, timeline)
+    effects = Deferred("sound effects", lambda: sound.get().load_sounds(), timeline)
+    sprites = Deferred("sprites", lambda: Graphics(window, WINDOW_WIDTH, WINDOW_HEIGHT), timeline)
+    scenes = Deferred("import scenes", import_scenes, timeline)
+    manager.register('title', lambda: TitleScene(window, sound))
+    manager.register('presentation', Deferred("presentation scene", build_presentation, timeline).get)
+    manager.register('game', Deferred("game scene", build_game, timeline).get)
+
+    # Deferred tasks run in order, one per frame, each after a frame is presented
+    manager.defer(lambda: timeline.mark("first frame"))
+    with timeline.phase("title scene"):
+        manager.push('title')  # Queues the title music
+    manager.defer(effects.get)
+    manager.defer(sprites.get)  # Held for the run: the game's Graphics shares them
+    manager.defer(scenes.get)
+    if args.startup_profile:
+        manager.defer(lambda: print_startup_profile(manager))
+    manager.run()
+    pygame.quit()
+    sys.exit()
 
 if __name__ == "__main__":
     main()
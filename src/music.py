@@ -0,0 +1,142 @@
+import os
+import logging
+from collections import namedtuple
+import pygame
+from src.assets import assets, asset_path
+from src.pack import BufferReader
+
+# Long tracks are streamed through pygame.mixer.music and never decoded into
+# memory; only short effects live in SoundManager as resident mixer.Sound
+# objects. MusicPlayer owns the track registry and the play/stop/fade/
+# crossfade API on top of the single music stream. It remembers what
+# is playing, so asking for the current track again is a no-op, and it
+# streams from the compressed file bytes kept in memory (or mapped from the
+# asset pack), so switching tracks never touches the filesystem once a track
+# has been read (or preloaded).
+
+Track = namedtuple("Track", ["path", "loops"])
+
+TRACKS = {
+    'background_music': Track(asset_path('sounds', 'background_music.mp3'), -1),
+    'the_final_sunset': Track(asset_path('sounds', 'the_final_sunset.mp3'), 0),
+    'final_sunset': Track(asset_path('sounds', 'the_final_sunset.mp3'), 0),
+}
+
+MUSIC_END = pygame.USEREVENT + 1
+
+
+class MusicPlayer:
+    def __init__(self, tracks=TRACKS):
+        self.tracks = dict(tracks)
+        self.data = {}  # path -> compressed bytes held through the asset manager
+        self.current = None
+        self.pending = None  # (name, fade_ms, start tick) for a crossfade in progress
+        try:
+            pygame.mixer.music.set_endevent(MUSIC_END)
+        except pygame.error as e:
+            logging.error(f"Couldn't set music end event: {e}")
+
+    def register(self, name, path, loops=-1):
+        self.tracks[name] = Track(path, loops)
+
+    def stream(self, track):
+        # A fresh file over the bytes for the mixer; they are read (or mapped from the pack) once per process
+        data = self.data.get(track.path)
+        if data is None:
+            data = self.data[track.path] = assets.data(track.path)
+        return BufferReader(data), os.path.splitext(track.path)[1].lstrip('.')
+
+    def close(self):
+        for path in self.data:
+            assets.release(('data', path))
+        self.data = {}
+
+    def is_active(self, name):
+        # Playing it, or already fading towards it
+        if self.pending and self.pending[0] == name:
+            return True
+        return self.current == name and pygame.mixer.music.get_busy()
+
+    def play(self, name, fade_ms=0):
+        if self.is_active(name):
+            return
+        self.start(name, fade_ms)
+
+    def start(self, name, fade_ms=0):
+        track = self.tracks.get(name)
+        if track is None:
+            logging.error(f"Music not found: {name}")
+            return
+        self.pending = None
+        try:
+            pygame.mixer.music.load(*self.stream(track))
+            if fade_ms:
+                pygame.mixer.music.play(track.loops, fade_ms=fade_ms)
+            else:
+                pygame.mixer.music.play(track.loops)
+            self.current = name
+            logging.info(f"Playing music: {name}")
+        except (pygame.error, OSError) as e:
+            self.current = None
+            logging.error(f"Couldn't play music {name}: {e}")
+
+    def stop(self):
+        self.pending = None
+        self.current = None
+        pygame.mixer.music.stop()
+        logging.info("Stopped music")
+
+    def fadeout(self, time):
+        self.pending = None
+        self.current = None
+        pygame.mixer.music.fadeout(time)
+
+    def crossfade(self, name, time):
+        # Fade the current track out over the first half, then fade the new one in
+        if self.is_active(name):
+            return
+        if self.current is None or not pygame.mixer.music.get_busy():
+            self.start(name, fade_ms=time)
+            return
+        pygame.mixer.music.fadeout(time // 2)
+        self.current = None
+        self.pending = (name, time - time // 2, pygame.time.get_ticks() + time // 2)
+
+    def update(self):
+        if self.pending and pygame.time.get_ticks() >= self.pending[2]:
+            name, fade_ms, _ = self.pending
+            self.start(name, fade_ms=fade_ms)
+
+    def wake_ms(self):
+        # Time until update() has to start a crossfade's second half, if one is pending
+        if self.pending is None:
+            return None
+        return max(self.pending[2] - pygame.time.get_ticks(), 0)
+
+    def handle_event(self, event):
+        if event.type != MUSIC_END:
+            return False
+        # A track finished. Stops and reloads post this event too, so only
+        # trust it if the stream is idle.
+        if not pygame.mixer.music.get_busy():
+            self.current = None
+        return True
+
+    def is_playing(self, name):
+        return self.current == name
+
+
+# One mixer music stream per process, so one player tracks it
+_player = None
+
+def get_music_player():
+    global _player
+    if _player is None:
+        _player = MusicPlayer()
+    return _player
+
+def reset_music_player():
+    global _player
+    if _player is not None:
+        _player.close()
+    _player = None
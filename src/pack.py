@@ -0,0 +1,236 @@
+import io
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import logging
+import argparse
+
+# Asset pack: every asset the game uses in one file, read through a single
+# read-only mmap. The file starts with an index of (offset, size, content
+# hash, name) records; names are paths relative to the assets directory
+# with '/' separators, e.g. "images/01.png". Entries are stored in the
+# order a cold launch first needs them, so starting the game reads the
+# mapping front to back; identical files are stored once. Images and
+# sounds are handed to pygame as file-like views into the mapping; nothing
+# is extracted or copied.
+#
+#   python -m src.pack build dist/assets.pack
+#   python -m src.pack verify dist/assets.pack
+
+MAGIC = b"PSPK"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")  # magic, version, entry count
+ENTRY = struct.Struct("<QQ16sH")  # offset, size, blake2b-128 of the contents, name length
+ALIGN = 16
+
+
+class PackError(Exception):
+    pass
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class BufferReader(io.RawIOBase):
+    # Read-only, seekable file over a buffer; bytes are only copied when read
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        data = self.buffer[self.position:self.position + len(b)]
+        b[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self.position = offset
+        return offset
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        self.buffer.release()
+        super().close()
+
+
+class AssetPack:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise PackError(f"{path} is empty")
+        if hasattr(self.map, 'madvise'):
+            # One front-to-back pass over the pack at start-up
+            self.map.madvise(mmap.MADV_SEQUENTIAL)
+        try:
+            self.entries = self.parse_index()
+        except PackError:
+            self.map.close()
+            raise
+
+    def parse_index(self):
+        if len(self.map) < HEADER.size:
+            raise PackError(f"{self.path} is not an asset pack")
+        magic, version, count = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise PackError(f"{self.path} is not an asset pack")
+        if version != VERSION:
+            raise PackError(f"{self.path} has unsupported version {version}")
+        entries = {}
+        position = HEADER.size
+        for _ in range(count):
+            if position + ENTRY.size > len(self.map):
+                raise PackError(f"{self.path}: truncated index")
+            offset, size, digest, name_length = ENTRY.unpack_from(self.map, position)
+            position += ENTRY.size
+            name = self.map[position:position + name_length].decode('utf-8')
+            position += name_length
+            if offset + size > len(self.map):
+                raise PackError(f"{self.path}: {name} runs past the end of the file")
+            entries[name] = (offset, size, digest)
+        return entries
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return list(self.entries)
+
+    def view(self, name):
+        # Zero-copy memoryview of one asset's bytes; raises KeyError if it isn't packed
+        offset, size, _ = self.entries[name]
+        return memoryview(self.map)[offset:offset + size]
+
+    def open(self, name):
+        return BufferReader(self.view(name))
+
+    def verify(self):
+        # Names whose contents don't match the hash in the index
+        bad = []
+        for name, (_, _, digest) in self.entries.items():
+            with self.view(name) as data:
+                if content_hash(data) != digest:
+                    bad.append(name)
+        return bad
+
+    def close(self):
+        self.map.close()
+
+
+def write_pack(path, files):
+    # files: [(name, source path)] in the order they should be laid out
+    contents = []
+    for name, source in files:
+        with open(source, 'rb') as f:
+            contents.append((name.encode('utf-8'), f.read()))
+    offset = HEADER.size + sum(ENTRY.size + len(name) for name, _ in contents)
+    index = [HEADER.pack(MAGIC, VERSION, len(contents))]
+    blobs = []
+    stored = {}  # hash -> offset: identical files are stored once
+    for name, data in contents:
+        digest = content_hash(data)
+        if digest not in stored:
+            offset += -offset % ALIGN
+            stored[digest] = offset
+            blobs.append(data)
+            offset += len(data)
+        index.append(ENTRY.pack(stored[digest], len(data), digest, len(name)) + name)
+
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(b"".join(index))
+        for data in blobs:
+            f.write(bytes(-f.tell() % ALIGN))
+            f.write(data)
+    os.replace(temp, path)
+
+
+def referenced_assets():
+    # Every asset path the code refers to, in the order a cold launch first
+    # uses them: the title music, then each scene's assets along the scene
+    # graph, then whatever is only loaded on demand
+    from src.music import TRACKS
+    from src.sound import SoundManager
+    from src.preload import SCENE_ASSETS, SCENE_GRAPH
+    from src.assets import asset_path
+
+    paths = [TRACKS['background_music'].path]
+    scene = 'title'
+    seen = set()
+    while scene not in seen:
+        seen.add(scene)
+        paths += [key[1] for key in SCENE_ASSETS.get(scene, [])]
+        scene = SCENE_GRAPH[scene][0]
+    paths += [asset_path('sounds', name) for name in SoundManager.SFX.values()]
+    paths += [track.path for track in TRACKS.values()]
+    return list(dict.fromkeys(os.path.normpath(path) for path in paths))
+
+
+def build(path):
+    from src.assets import ASSET_DIR, pack_name
+    files = []
+    for source in referenced_assets():
+        if not os.path.exists(source):
+            logging.error(f"Referenced asset is missing, not packed: {source}")
+            continue
+        files.append((pack_name(source), source))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_pack(path, files)
+    loose = sum(os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(ASSET_DIR) for name in names)
+    logging.info(f"Packed {len(files)} assets into {path}: {os.path.getsize(path) / 1024:.0f} KiB "
+                 f"(the assets directory holds {loose / 1024:.0f} KiB)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build, list or verify an asset pack")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="pack every asset the code references")
+    build_parser.add_argument('pack', nargs='?', default=os.path.join('dist', 'assets.pack'),
+                              help="output file (default dist/assets.pack)")
+    for command, text in (('list', "list the packed assets"), ('verify', "check every asset against its hash")):
+        commands.add_parser(command, help=text).add_argument('pack')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == 'build':
+        return build(args.pack)
+    try:
+        pack = AssetPack(args.pack)
+    except (OSError, PackError) as e:
+        logging.error(f"Couldn't open asset pack {args.pack}: {e}")
+        return 2
+    if args.command == 'list':
+        for name, (offset, size, digest) in pack.entries.items():
+            print(f"{offset:>10} {size:>10}  {digest.hex()}  {name}")
+        return 0
+    bad = pack.verify()
+    for name in bad:
+        logging.error(f"Hash mismatch: {name}")
+    if not bad:
+        logging.info(f"All {len(pack.entries)} assets match their hashes")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
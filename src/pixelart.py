@@ -0,0 +1,61 @@
+import numpy
+import pygame
+
+# Pixel-art rasteriser. A sprite is a matrix of palette indices (0 is
+# transparent); it is scaled up by whole pixels, coloured with one palette
+# gather and turned into a surface in one copy, instead of a
+# pygame.draw.rect per lit pixel. build_sheet() does the same for a whole
+# set of sprites at once, so startup cost follows the number of sprites
+# rather than the number of lit pixels.
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+def rgba(color):
+    return tuple(color) if len(color) == 4 else tuple(color) + (255,)
+
+def palette_colors(palette):
+    # A list colours indices 1.., a dict maps index -> colour
+    if isinstance(palette, dict):
+        colors = [TRANSPARENT] * (max(palette) + 1)
+        for index, color in palette.items():
+            colors[index] = rgba(color)
+        return colors
+    return [TRANSPARENT] + [rgba(color) for color in palette]
+
+def fit_pixel_size(pixels, size):
+    return min(size[0] // len(pixels[0]), size[1] // len(pixels))
+
+
+def scale_indices(pixels, pixel_size):
+    return numpy.asarray(pixels, dtype=numpy.uint8).repeat(pixel_size, 0).repeat(pixel_size, 1)
+
+def indices_surface(indices, colors):
+    # Palette mapped to the surface's own 32-bit pixel values, so colouring is
+    # a single gather and the pixels land in the buffer in one write
+    surface = pygame.Surface((indices.shape[1], indices.shape[0]), pygame.SRCALPHA)
+    table = numpy.array([surface.map_rgb(color) & 0xFFFFFFFF for color in colors], dtype=numpy.uint32)
+    surface.get_buffer().write(numpy.take(table, indices).tobytes())
+    return surface
+
+
+def rasterise(pixels, pixel_size, palette, surface=None, offset=(0, 0)):
+    # A new sprite surface, or lit cells blitted over surface at offset
+    sprite = indices_surface(scale_indices(pixels, pixel_size), palette_colors(palette))
+    if surface is None:
+        return sprite
+    surface.blit(sprite, offset)
+    return surface
+
+def build_sheet(sprites, cell_size, palette):
+    # One surface, one cell per sprite stacked vertically, each sprite scaled to
+    # fit its cell from the top-left; returns name -> subsurface
+    width, height = cell_size
+    names = list(sprites)
+    indices = numpy.zeros((height * len(names), width), dtype=numpy.uint8)
+    for i, name in enumerate(names):
+        pixels = sprites[name]
+        scaled = scale_indices(pixels, fit_pixel_size(pixels, cell_size))[:height, :width]
+        indices[i * height:i * height + scaled.shape[0], :scaled.shape[1]] = scaled
+    sheet = indices_surface(indices, palette_colors(palette))
+    return {name: sheet.subsurface((0, i * height, width, height)) for i, name in enumerate(names)}
@@ -0,0 +1,118 @@
+import logging
+import queue
+import threading
+import time
+import pygame
+from src.assets import assets, asset_path
+from src.engine import CHAPTERS
+from src.music import TRACKS
+
+# Predictive preloading. The scene graph says which scene can follow the
+# current one; while a scene runs, a worker thread warms the next scene's
+# images and audio in the shared asset manager. The main thread never waits
+# on it: scenes check ready() and keep drawing frames until the assets are in.
+
+STORY_IMAGE_SIZE = (600, 400)
+POLL_MS = 50  # How often a scene drawing black checks whether its assets are in
+
+SCENE_GRAPH = {
+    'title': ['presentation'],
+    'presentation': ['game'],
+    'game': ['ending'],
+    'ending': ['title'],
+}
+
+SCENE_ASSETS = {
+    'presentation': [('image', asset_path('images', f'0{i}.png'), STORY_IMAGE_SIZE) for i in range(1, 6)],
+    'game': [('sound', asset_path('sounds', name)) for name in ('shoot.wav', 'win.wav', 'dead.wav', 'start.wav')] +
+            [('data', TRACKS['background_music'].path)],
+    'ending': [('image', asset_path('images', f'0{i}.png'), STORY_IMAGE_SIZE) for i in range(6, 9)] +
+              [('data', TRACKS['the_final_sunset'].path)],
+}
+
+FINAL_CHAPTER = len(CHAPTERS)
+
+
+class Preloader:
+    def __init__(self, manager=assets, scene_assets=SCENE_ASSETS, scene_graph=SCENE_GRAPH):
+        self.manager = manager
+        self.scene_assets = scene_assets
+        self.scene_graph = scene_graph
+        self.requests = queue.Queue()
+        self.lock = threading.Lock()
+        self.scheduled = set()
+        self.done = set()
+        self.held = {}  # scene -> keys the preloader holds a reference to
+        self.thread = None
+
+    def next_scenes(self, scene, chapter=None):
+        # The ending is only worth warming once the last chapter has started
+        if scene == 'game' and (chapter is None or chapter < FINAL_CHAPTER):
+            return []
+        return self.scene_graph.get(scene, [])
+
+    def enter_scene(self, scene, chapter=None):
+        for next_scene in self.next_scenes(scene, chapter):
+            self.preload(next_scene)
+
+    def preload(self, scene):
+        with self.lock:
+            if scene in self.scheduled:
+                return
+            self.scheduled.add(scene)
+            self.held.setdefault(scene, [])
+        self.requests.put(scene)
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="preloader", daemon=True)
+            self.thread.start()
+
+    def ready(self, scene):
+        with self.lock:
+            return scene in self.done
+
+    def wait(self, scene, timeout=None):
+        # For tools and tests; the game itself polls ready() between frames
+        deadline = None if timeout is None else time.monotonic() + timeout / 1000
+        while not self.ready(scene):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def release(self, scene):
+        with self.lock:
+            keys = self.held.pop(scene, [])
+            self.scheduled.discard(scene)
+            self.done.discard(scene)
+        for key in keys:
+            self.manager.release(key)
+
+    def run(self):
+        while True:
+            scene = self.requests.get()
+            if scene is None:
+                break
+            for key in self.scene_assets.get(scene, []):
+                try:
+                    self.manager.load(key)
+                except (pygame.error, OSError) as e:
+                    logging.error(f"Couldn't preload {key}: {e}")
+                    continue
+                with self.lock:
+                    keep = scene in self.scheduled
+                    if keep:
+                        self.held[scene].append(key)
+                if not keep:
+                    self.manager.release(key)  # Released while still loading
+            with self.lock:
+                if scene in self.scheduled:
+                    self.done.add(scene)
+            logging.info(f"Preloaded scene: {scene}")
+
+    def stop(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.requests.put(None)
+            self.thread.join()
+
+
+preloader = Preloader()
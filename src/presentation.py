@@ -1,17 +1,25 @@
+import math
 import pygame
-import os
-import time
+from src.text import get_font, render_text, text_block
+from src.assets import assets, asset_path
+from src.transitions import fade_in, prepare, blit_alpha
+from src.preload import preloader, POLL_MS
+from src.scenes import Scene
 
-class Presentation:
-    def __init__(self, screen, width, height):
+SLIDE_MS = 5000  # Time each story slide stays up, fade included
+
+
+class Presentation(Scene):
+    def __init__(self, screen, width, height, sound_manager=None):
         self.screen = screen
+        self.sound_manager = sound_manager
         self.width = width
         self.height = height
-        self.font = pygame.font.Font(None, 32)
-        self.title_font = pygame.font.Font(None, 64)  # Larger font for the title
+        self.font = get_font(32)
+        self.title_font = get_font(64)  # Larger font for the title
         self.image_size = (600, 400)
         self.text_height = 150
-        self.images = self.load_images()
+        self.images = None  # Loaded once the preloader has them
         self.texts = [
             "A long time ago, in the middle of nowhere, the peace of the people was quiet and peaceful. But, suddenly, everything changes.",
             "Humble folk suffered at the hands of outlaws. Robbery, murder, and countless other crimes plagued the daily lives of these poor people.",
@@ -20,117 +28,97 @@ class Presentation:
             "That day, the Dried Gut gang made a fatal mistake. The gunslinger vowed revenge—deadly revenge."
         ]
         self.current_slide = 0
-        self.fade_alpha = 0
-        self.fade_speed = 5
+        self.fade = fade_in()
+        self.slide_time = 0
 
     def load_images(self):
         images = []
         for i in range(1, 6):
-            image_path = os.path.join('assets', 'images', f'0{i}.png')
-            image = pygame.image.load(image_path)
-            image = pygame.transform.scale(image, self.image_size)
-            images.append(image)
+            image_path = asset_path('images', f'0{i}.png')
+            images.append(prepare(assets.image(image_path, self.image_size)))
         return images
 
+    def close(self):
+        if self.images is None:
+            return
+        for i in range(1, 6):
+            assets.release(('image', asset_path('images', f'0{i}.png'), self.image_size))
+        self.images = None
+
     def draw(self):
         self.screen.fill((0, 0, 0))  # Clear screen with black
+        if self.images is None:
+            return  # Black while the slides finish loading
         if self.current_slide < len(self.images):
             image_x = (self.width - self.image_size[0]) // 2
             image_y = (self.height - self.image_size[1] - self.text_height) // 2
             
             # Draw the current image with fade effect
-            image_with_alpha = self.images[self.current_slide].copy()
-            image_with_alpha.set_alpha(self.fade_alpha)
-            self.screen.blit(image_with_alpha, (image_x, image_y))
+            blit_alpha(self.screen, self.images[self.current_slide], (image_x, image_y), self.fade.alpha)
             
             # Draw text with fade effect
             self.draw_text(self.texts[self.current_slide], (255, 255, 255), 
-                           10, image_y + self.image_size[1] + 20, self.width - 20, self.fade_alpha)
+                           10, image_y + self.image_size[1] + 20, self.width - 20, self.fade.alpha)
         else:
             self.draw_title_screen()
-        pygame.display.flip()
 
     def draw_text(self, text, color, x, y, max_width, alpha):
-        words = text.split()
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font.render(test_line, True, color)
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
-
-        total_height = len(lines) * self.font.get_linesize()
-        current_y = y + (self.text_height - total_height) // 2
-
-        for line in lines:
-            text_surface = self.font.render(line, True, color)
-            text_surface.set_alpha(alpha)
-            text_rect = text_surface.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(text_surface, text_rect)
-            current_y += self.font.get_linesize()
+        # Wrapped once and cached; fades only change the alpha of the cached lines
+        block = text_block(text, self.font, color, max_width)
+        return block.draw(self.screen, self.width // 2, y + (self.text_height - block.height) // 2, alpha)
 
     def draw_title_screen(self):
         title_text = "The Pixelated Showdown"
-        title_surface = self.title_font.render(title_text, True, (255, 255, 255))
+        title_surface = render_text(title_text, self.title_font, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(title_surface, title_rect)
 
         subtitle_text = "Press ENTER to start the game"
-        subtitle_surface = self.font.render(subtitle_text, True, (255, 255, 255))
+        subtitle_surface = render_text(subtitle_text, self.font, (255, 255, 255))
         subtitle_rect = subtitle_surface.get_rect(center=(self.width // 2, self.height // 2 + 50))
         self.screen.blit(subtitle_surface, subtitle_rect)
 
-    def run(self):
-        clock = pygame.time.Clock()
-        for _ in range(len(self.images) + 1):  # +1 for the title screen
-            self.fade_alpha = 0
-            start_time = pygame.time.get_ticks()
-            
-            while self.fade_alpha < 255:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return False
-                        if event.key == pygame.K_RETURN and self.current_slide == len(self.images):
-                            return True
-                
-                self.fade_alpha = min(255, self.fade_alpha + self.fade_speed)
-                self.draw()
-                pygame.display.flip()
-                clock.tick(60)
-            
-            # Keep the slide visible for a few seconds
-            while pygame.time.get_ticks() - start_time < 5000:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            return False
-                        if event.key == pygame.K_RETURN and self.current_slide == len(self.images):
-                            return True
-                clock.tick(60)
-            
+    def enter(self):
+        # The story runs silent; there is no presentation track. The slides are
+        # normally warmed while the title is up; draw black until they are in
+        preloader.enter_scene('presentation')
+        preloader.preload('presentation')
+        self.current_slide = 0
+        self.fade = fade_in()
+        self.slide_time = 0
+
+    def exit(self):
+        self.close()
+        preloader.release('presentation')
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.manager.quit()
+        elif event.key == pygame.K_RETURN and self.images is not None and self.current_slide == len(self.images):
+            self.sound_manager.play_music('background_music', fade_ms=1000)
+            self.manager.switch('game')
+
+    def idle_ms(self):
+        if self.images is None:
+            return POLL_MS  # Black while the slides finish loading
+        # A slide stays put between its fade and its time running out; the title waits for ENTER
+        if self.current_slide == len(self.images):
+            return math.inf
+        if not self.fade.done:
+            return None
+        return max(SLIDE_MS - self.slide_time, 0)
+
+    def update(self, dt):
+        if self.images is None:
+            if preloader.ready('presentation'):
+                self.images = self.load_images()
+            return
+        # Each slide fades in and stays up for SLIDE_MS; the title waits for ENTER
+        self.fade.update(dt)
+        self.slide_time += dt
+        if self.current_slide < len(self.images) and self.fade.done and self.slide_time >= SLIDE_MS:
             self.current_slide += 1
-        
-        # Wait for ENTER key on the title screen
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        waiting = False
-                    if event.key == pygame.K_ESCAPE:
-                        return False
-            clock.tick(60)
-        
-        return True
+            self.fade = fade_in()
+            self.slide_time = 0
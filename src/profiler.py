@@ -0,0 +1,145 @@
+import os
+import csv
+import math
+import time
+import logging
+from collections import deque
+import pygame
+from src.image_cache import default_cache_dir
+
+# Per-frame timings for the F1 debug overlay. Game calls begin_frame() at the
+# top of the loop and lap(phase) after each piece of work; every lap books
+# the time since the previous one to that phase. end_frame() takes the whole
+# frame time from clock.tick, so the samples include the sleep. The last
+# HISTORY_SECONDS of samples are kept for the percentiles, the histogram and
+# the CSV dump (F12 in debug mode).
+
+PHASES = ("events", "update", "background", "sprites", "text", "hud", "arrows", "overlay", "present", "idle")
+HISTORY_SECONDS = 10
+HISTOGRAM_EDGES = (4, 8, 12, 16.7, 20, 25, 33.4, 50, 100)  # Upper bounds in ms; the last bin is open
+OVERLAY_REFRESH_MS = 250
+
+
+def default_profile_dir():
+    return os.environ.get('PIXELATED_SHOWDOWN_PROFILES',
+                          os.path.join(os.path.dirname(default_cache_dir()), 'profiles'))
+
+def percentile(values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class FrameProfiler:
+    def __init__(self, fps=60, history_seconds=HISTORY_SECONDS, clock=time.perf_counter):
+        self.budget = 1000 / fps
+        self.history_seconds = history_seconds
+        self.clock = clock
+        self.samples = deque()  # (clock seconds, frame ms, {phase: ms})
+        self.phases = {}
+        self.last = None
+        self.overlay = None
+        self.overlay_time = None
+
+    def begin_frame(self):
+        self.phases = {}
+        self.last = self.clock()
+
+    def lap(self, phase):
+        now = self.clock()
+        if self.last is not None:
+            self.phases[phase] = self.phases.get(phase, 0) + (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self, frame_ms):
+        self.lap("idle")
+        now = self.last
+        self.samples.append((now, frame_ms, self.phases))
+        while self.samples and now - self.samples[0][0] > self.history_seconds:
+            self.samples.popleft()
+
+    def frame_times(self):
+        return sorted(frame_ms for _, frame_ms, _ in self.samples)
+
+    def percentiles(self):
+        times = self.frame_times()
+        return {name: percentile(times, fraction) for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))}
+
+    def dropped_frames(self):
+        # Budget slots a frame overran: a 34 ms frame at 60 FPS dropped one
+        return sum(max(0, round(frame_ms / self.budget) - 1) for _, frame_ms, _ in self.samples)
+
+    def phase_averages(self):
+        totals = {}
+        for _, _, phases in self.samples:
+            for phase, ms in phases.items():
+                totals[phase] = totals.get(phase, 0) + ms
+        count = max(len(self.samples), 1)
+        return {phase: totals[phase] / count for phase in PHASES if phase in totals}
+
+    def histogram(self):
+        counts = [0] * (len(HISTOGRAM_EDGES) + 1)
+        for _, frame_ms, _ in self.samples:
+            for i, edge in enumerate(HISTOGRAM_EDGES):
+                if frame_ms <= edge:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def dump_csv(self, path=None):
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(default_profile_dir(), f"frames-{stamp}.csv")
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(("time", "frame_ms") + PHASES)
+                for seconds, frame_ms, phases in self.samples:
+                    writer.writerow([f"{seconds:.4f}", f"{frame_ms:.3f}"] +
+                                    [f"{phases.get(phase, 0):.3f}" for phase in PHASES])
+        except OSError as e:
+            logging.error(f"Couldn't write frame profile {path}: {e}")
+            return None
+        logging.info(f"Wrote {len(self.samples)} frame samples to {path}")
+        return path
+
+    def draw(self, screen, font, position=(10, 40)):
+        # The panel is rebuilt a few times a second; other frames just blit it
+        now = pygame.time.get_ticks()
+        if self.overlay is None or now - self.overlay_time >= OVERLAY_REFRESH_MS:
+            self.overlay = self.render_overlay(font)
+            self.overlay_time = now
+        return screen.blit(self.overlay, position)
+
+    def render_overlay(self, font):
+        white, line_height = (255, 255, 255), font.get_linesize()
+        stats = self.percentiles()
+        lines = [
+            f"frame p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f} ms",
+            f"dropped {self.dropped_frames()} in {len(self.samples)} frames",
+        ] + [f"{phase:<10}{ms:6.2f} ms" for phase, ms in self.phase_averages().items()]
+
+        counts = self.histogram()
+        bar_height = 40
+        width = 260
+        height = line_height * len(lines) + bar_height + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, white), (6, 4 + i * line_height))
+
+        # Frame-time histogram: one bar per bin, red past the frame budget
+        top = 10 + line_height * len(lines)
+        bar_width = (width - 12) // len(counts)
+        peak = max(max(counts), 1)
+        for i, count in enumerate(counts):
+            bar = int(bar_height * count / peak)
+            over_budget = i > 0 and HISTOGRAM_EDGES[i - 1] >= self.budget
+            color = (220, 60, 60) if over_budget else (60, 200, 60)
+            pygame.draw.rect(panel, color, (6 + i * bar_width, top + bar_height - bar, bar_width - 2, bar))
+        return panel
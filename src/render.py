@@ -0,0 +1,48 @@
+import pygame
+
+# Frame presenter for the duel screen. In full mode every frame repaints the
+# background and flips. In dirty-rect mode only the regions drawn last frame
+# are restored from the cached background, and only those plus this frame's
+# regions are pushed to the display. Any change of scene falls back to a full
+# repaint and flip.
+
+class FrameRenderer:
+    def __init__(self, screen, background, dirty_rects=False):
+        self.screen = screen
+        self.background = background
+        self.dirty_rects = dirty_rects
+        self.scene = None
+        self.full_redraw = True
+        self.previous = []
+        self.current = []
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def begin(self, scene=None):
+        if scene != self.scene:
+            self.scene = scene
+            self.full_redraw = True
+        if not self.dirty_rects or self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.background, rect, rect)
+        self.current = []
+
+    def mark(self, rect):
+        # Record a region drawn this frame; accepts a Rect, a list of Rects or None
+        if rect is None:
+            return
+        if isinstance(rect, list):
+            self.current.extend(r for r in rect if r)
+        elif rect:
+            self.current.append(rect)
+
+    def present(self):
+        if not self.dirty_rects or self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
@@ -0,0 +1,272 @@
+import os
+import sys
+import time
+import struct
+import random
+import logging
+import argparse
+from src.engine import DuelEngine, DUEL_ENDED
+
+# Binary session replays. A session is fully determined by its RNG seed and
+# the inputs Game fed the engine: frame steps, key presses and the few
+# scene actions (start, confirm, retry, debug skips). ReplayRecorder logs
+# those as one opcode byte plus a small payload; the timestamps are implicit
+# in the recorded frame steps. At every duel boundary it also stores a hash
+# of the engine state, which ReplayPlayer checks while re-running the
+# session, either through Game at 1x or headless through the engine alone
+# as fast as the CPU allows (python -m src.replay FILE). Like the engine,
+# this module must not import pygame.
+
+MAGIC = b"PSRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQB")  # magic, version, seed, key count
+KEY = struct.Struct("<i")
+STEP_MS = struct.Struct("<H")
+STEP_FLOAT = struct.Struct("<d")
+
+# Opcodes
+RESET = 1
+START = 2
+CONFIRM = 3
+PRESS = 4  # Payload: index into the header's key table
+STEP = 5  # Payload: whole milliseconds
+STEP_EXACT = 6  # Payload: a double, for fractional or large steps
+NEXT = 7
+WIN = 8
+SKIP_TO_END = 9
+HASH = 10  # Payload: 8-byte engine state hash
+
+OP_NAMES = {RESET: "reset", START: "start", CONFIRM: "confirm", PRESS: "press", STEP: "step",
+            NEXT: "next", WIN: "win", SKIP_TO_END: "skip_to_end", HASH: "hash"}
+
+
+class ReplayError(Exception):
+    pass
+
+
+def default_replay_dir():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.environ.get('PIXELATED_SHOWDOWN_REPLAYS', os.path.join(base, 'pixelated-showdown', 'replays'))
+
+def new_seed():
+    return random.SystemRandom().getrandbits(63)
+
+
+class ReplayRecorder:
+    playing = False
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(default_replay_dir(), time.strftime("session-%Y%m%d-%H%M%S.replay"))
+        self.path = path
+        self.buffer = bytearray()  # Records not yet written
+        self.file = None
+        self.size = 0
+        self.keys = None
+        self.duels = 0
+
+    def begin(self, seed, keys):
+        self.keys = {key: index for index, key in enumerate(keys)}
+        self.buffer += HEADER.pack(MAGIC, VERSION, seed, len(keys))
+        for key in keys:
+            self.buffer += KEY.pack(key)
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self.file = open(self.path, 'wb')
+        except OSError as e:
+            logging.error(f"Couldn't create replay {self.path}: {e}")
+
+    def record(self, op, arg=0):
+        if op == PRESS:
+            if arg not in self.keys:
+                return  # The engine ignores it; nothing to replay
+            self.buffer += bytes((PRESS, self.keys[arg]))
+        elif op == STEP:
+            if arg == int(arg) and 0 <= arg <= 0xFFFF:
+                self.buffer += bytes((STEP,)) + STEP_MS.pack(int(arg))
+            else:
+                self.buffer += bytes((STEP_EXACT,)) + STEP_FLOAT.pack(arg)
+        else:
+            self.buffer.append(op)
+
+    def duel_ended(self, engine):
+        self.buffer += bytes((HASH,)) + engine.state_hash()
+        self.duels += 1
+        self.flush()  # A crash still leaves every finished duel on disk
+
+    def flush(self):
+        if self.file is None:
+            return
+        try:
+            self.file.write(self.buffer)
+            self.file.flush()
+        except OSError as e:
+            logging.error(f"Couldn't write replay {self.path}: {e}")
+        self.size += len(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        if self.file is None:
+            return
+        self.flush()
+        self.file.close()
+        self.file = None
+        logging.info(f"Recorded {self.duels} duels to {self.path} ({self.size} bytes)")
+
+
+class Replay:
+    def __init__(self, seed, keys, ops, hashes):
+        self.seed = seed
+        self.keys = keys
+        self.ops = ops  # [(opcode, arg)]; PRESS args are keys, STEP args milliseconds
+        self.hashes = hashes  # State hash after each duel, in order
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("truncated replay header")
+        magic, version, seed, key_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ReplayError(f"not a version {VERSION} replay")
+        offset = HEADER.size
+        keys = [KEY.unpack_from(data, offset + i * KEY.size)[0] for i in range(key_count)]
+        offset += key_count * KEY.size
+
+        ops, hashes = [], []
+        try:
+            while offset < len(data):
+                op = data[offset]
+                offset += 1
+                if op == PRESS:
+                    ops.append((PRESS, keys[data[offset]]))
+                    offset += 1
+                elif op == STEP:
+                    ops.append((STEP, STEP_MS.unpack_from(data, offset)[0]))
+                    offset += STEP_MS.size
+                elif op == STEP_EXACT:
+                    ops.append((STEP, STEP_FLOAT.unpack_from(data, offset)[0]))
+                    offset += STEP_FLOAT.size
+                elif op == HASH:
+                    if offset + 8 > len(data):
+                        raise ReplayError("truncated state hash")
+                    hashes.append(bytes(data[offset:offset + 8]))
+                    offset += 8
+                elif op in OP_NAMES:
+                    ops.append((op, 0))
+                else:
+                    raise ReplayError(f"unknown opcode {op} at byte {offset - 1}")
+        except (IndexError, struct.error):
+            raise ReplayError("truncated replay record")
+        return cls(seed, keys, ops, hashes)
+
+    def engine(self):
+        return DuelEngine(keys=self.keys, rng=random.Random(self.seed))
+
+
+class ReplayPlayer:
+    playing = True
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.duels = 0
+        self.mismatches = []  # Duel numbers whose state hash differed
+        self.position = 0  # Next op, for playback in real time
+        self.played_ms = 0
+
+    def record(self, op, arg=0):
+        pass  # The inputs come from the replay
+
+    def duel_ended(self, engine):
+        expected = self.replay.hashes[self.duels] if self.duels < len(self.replay.hashes) else None
+        if engine.state_hash() != expected:
+            if not self.mismatches:
+                logging.error(f"Replay diverged at duel {self.duels + 1}")
+            self.mismatches.append(self.duels + 1)
+        self.duels += 1
+
+    @property
+    def finished(self):
+        return self.position >= len(self.replay.ops)
+
+    def ops_until(self, ms):
+        # The ops not played yet whose frame starts by ms of playback time
+        ops = self.replay.ops
+        while self.position < len(ops):
+            op, arg = ops[self.position]
+            if op == STEP:
+                if self.played_ms + arg > ms:
+                    return
+                self.played_ms += arg
+            self.position += 1
+            yield op, arg
+
+    @property
+    def verified(self):
+        return not self.mismatches and self.duels == len(self.replay.hashes)
+
+    def apply(self, engine, op, arg):
+        if op == RESET:
+            engine.reset()
+        elif op == START:
+            engine.start_chapter()
+        elif op == CONFIRM:
+            engine.confirm()
+        elif op == PRESS:
+            engine.press(arg)
+        elif op == STEP:
+            engine.step(arg)
+        elif op == NEXT:
+            engine.next_chapter()
+        elif op == WIN:
+            engine.win_game()
+        elif op == SKIP_TO_END:
+            engine.skip_to_end()
+
+    def run_headless(self):
+        # The whole session through the engine alone, as fast as possible
+        engine = self.replay.engine()
+        for op, arg in self.replay.ops:
+            self.apply(engine, op, arg)
+            for event in engine.poll_events():
+                if event.kind == DUEL_ENDED:
+                    self.duel_ended(engine)
+        return engine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-run a recorded session headless and check its state hashes")
+    parser.add_argument("replay", help="replay file written by --record")
+    parser.add_argument("--repeat", type=int, default=1, help="play it this many times and report the best time")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        replay = Replay.load(args.replay)
+    except (OSError, ReplayError) as e:
+        logging.error(f"Couldn't load replay {args.replay}: {e}")
+        return 2
+    best = None
+    for _ in range(max(args.repeat, 1)):
+        player = ReplayPlayer(replay)
+        start = time.perf_counter()
+        engine = player.run_headless()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    frames = sum(1 for op, _ in replay.ops if op == STEP)
+    logging.info(f"{len(replay.ops)} inputs, {frames} frames ({engine.time / 1000:.1f} s of play), "
+                 f"{player.duels} duels in {best * 1000:.1f} ms")
+    if not player.verified:
+        logging.error(f"State hash mismatch at duels {player.mismatches} "
+                      f"({player.duels} played, {len(replay.hashes)} recorded)")
+        return 1
+    logging.info("All duel state hashes match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
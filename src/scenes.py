@@ -0,0 +1,203 @@
+from collections import deque
+import pygame
+from src.utils import FPS, MAX_FRAME_MS
+
+# Scene stack and the one main loop. Every frame the manager pumps the event
+# queue once, hands each event to the top scene, updates it with the frame
+# time from its single clock, lets it draw and presents exactly once. Scenes
+# are registered by name (the same names the preloader uses) either built or
+# as factories, are built at most once and are reused every time they come
+# back to the top. Scenes change the stack through their manager instead of
+# running loops of their own or calling sys.exit(). Work that can wait (see
+# defer) runs one task per frame, after the frame has been presented.
+# Static scenes (see Scene.idle_ms) are drawn once and the loop then blocks
+# in pygame.event.wait instead of spinning at the frame rate; it wakes for
+# input, the scene's next timer, the music or every IDLE_WAIT_MS.
+
+IDLE_WAIT_MS = 1000
+
+
+class Scene:
+    manager = None
+
+    def enter(self):
+        # Became the top scene
+        pass
+
+    def exit(self):
+        # Removed from the stack
+        pass
+
+    def pause(self):
+        # Another scene was pushed on top
+        pass
+
+    def resume(self):
+        # The scene on top was popped
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        pass
+
+    def idle_ms(self):
+        # None while anything on screen moves. Once the scene only changes
+        # on input, how many ms until update() has something to do again
+        # (math.inf for never): the manager draws it once and then sleeps
+        # in the event queue instead of redrawing it every frame
+        return None
+
+    def present(self):
+        pygame.display.flip()
+
+
+class SceneManager:
+    def __init__(self, screen, fps=FPS, profiler=None, sound_manager=None):
+        self.screen = screen
+        self.fps = fps  # 0 runs uncapped
+        self.profiler = profiler
+        self.sound_manager = sound_manager
+        self.clock = pygame.time.Clock()
+        self.factories = {}
+        self.scenes = {}
+        self.stack = []
+        self.deferred = deque()
+        self.running = False
+
+    def register(self, name, scene):
+        # scene is a Scene or a callable that builds one on first use
+        if isinstance(scene, Scene):
+            self.scenes[name] = scene
+        else:
+            self.factories[name] = scene
+
+    def get(self, name):
+        if name not in self.scenes:
+            self.scenes[name] = self.factories.pop(name)()
+        return self.scenes[name]
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        scene = self.get(scene) if isinstance(scene, str) else scene
+        if self.stack:
+            self.top.pause()
+        scene.manager = self
+        self.stack.append(scene)
+        scene.enter()
+        return scene
+
+    def pop(self):
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self.top.resume()
+        else:
+            self.running = False
+        return scene
+
+    def switch(self, scene):
+        # Replace the top scene
+        if self.stack:
+            self.stack.pop().exit()
+        return self.push(scene)
+
+    def defer(self, task):
+        # Run task() on a later frame, in the slack after presenting it
+        self.deferred.append(task)
+
+    def quit(self):
+        while self.stack:
+            self.stack.pop().exit()
+        self.running = False
+
+    def wait(self, timeout):
+        # Sleep in the event queue until something happens or timeout ms pass
+        event = pygame.event.wait(max(1, int(timeout)))
+        return [] if event.type == pygame.NOEVENT else [event]
+
+    def idle_timeout(self, scene):
+        # How long to block before the next frame, or None to keep the frame rate
+        idle = scene.idle_ms()
+        if idle is None or self.deferred:
+            return None
+        wake = self.sound_manager.wake_ms() if self.sound_manager else None
+        return min(idle, IDLE_WAIT_MS) if wake is None else min(idle, IDLE_WAIT_MS, wake)
+
+    def catch_up(self, waited):
+        # Hand a static scene the time it slept in steps no longer than a
+        # clamped frame, stopping early once it starts animating
+        while True:
+            step = min(waited, MAX_FRAME_MS)
+            self.top.update(step)
+            waited -= step
+            if waited <= 0 or not self.running or self.top.idle_ms() is None:
+                return
+
+    def run(self, scene=None):
+        if scene is not None:
+            self.push(scene)
+        self.running = bool(self.stack)
+        profiler = self.profiler
+        dt = 0
+        timeout = None  # Set while a static scene's frame is on screen
+        shown = None  # That scene
+        while self.running:
+            events = []
+            if timeout is not None:
+                events = self.wait(timeout)
+                # The wait passes while the scene is still static, before
+                # whatever woke it is acted on. Time past the timeout is a
+                # stall, dropped like a long frame
+                self.catch_up(min(self.clock.tick(), timeout))
+                dt = 0
+                if not self.running:
+                    break
+            if profiler:
+                profiler.begin_frame()
+            events += pygame.event.get()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.quit()
+                    break
+                if self.sound_manager:
+                    self.sound_manager.handle_event(event)
+                self.top.handle_event(event)
+                if not self.running:
+                    break
+            if not self.running:
+                break
+            if profiler:
+                profiler.lap("events")
+
+            scene = self.top
+            scene.update(dt)
+            if self.sound_manager:
+                self.sound_manager.update()
+            if profiler:
+                profiler.lap("update")
+            timeout = None
+            if scene is self.top:  # Skip a frame for a scene that just left
+                static = scene.idle_ms() is not None
+                if not static or events or shown is not scene:  # Otherwise it's already on screen
+                    scene.draw()
+                    scene.present()
+                    if profiler:
+                        profiler.lap("present")
+                shown = scene if static else None
+                if self.running:
+                    timeout = self.idle_timeout(scene)
+            if self.deferred and self.running:
+                self.deferred.popleft()()  # Booked as idle time
+
+            frame_ms = self.clock.tick(self.fps)
+            if profiler:
+                profiler.end_frame(frame_ms)
+            dt = min(frame_ms, MAX_FRAME_MS)
@@ -0,0 +1,228 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import statistics
+import multiprocessing
+from src.engine import DuelEngine, CHAPTERS, PROGRESS_SPEED
+
+# Balancing simulator. Simulated players with normally distributed reaction
+# and key-to-key times and a per-key error rate play whole runs through the
+# engine, event by event rather than frame by frame, so a run costs well
+# under a millisecond. Runs are split into fixed-size batches, each with its
+# own seed, and spread over a process pool; the results only depend on the
+# seed and the run count, not on the number of processes.
+#
+#   python -m src.simulator --runs 20000 --error-rate 0.05
+#   python -m src.simulator --sweep progress_speed=20,25,30,35,40
+
+BATCH_RUNS = 250
+MIN_REACTION_MS = 100  # Faster than any human response
+MIN_KEY_MS = 40
+
+
+class PlayerModel:
+    def __init__(self, reaction_ms=(450, 120), key_ms=(180, 50), error_rate=0.05):
+        self.reaction_ms = reaction_ms  # (mean, sd) from the duel start to the first key
+        self.key_ms = key_ms  # (mean, sd) between keys
+        self.error_rate = error_rate  # Chance of each key being a wrong arrow
+
+    def reaction(self, rng):
+        return max(MIN_REACTION_MS, rng.gauss(*self.reaction_ms))
+
+    def interval(self, rng):
+        return max(MIN_KEY_MS, rng.gauss(*self.key_ms))
+
+    def key(self, rng, wanted, keys):
+        if rng.random() < self.error_rate:
+            return rng.choice([key for key in keys if key != wanted])
+        return wanted
+
+    def to_dict(self):
+        return {"reaction_ms": list(self.reaction_ms), "key_ms": list(self.key_ms), "error_rate": self.error_rate}
+
+
+def play_run(model, rng, chapters=CHAPTERS, progress_speed=PROGRESS_SPEED):
+    # One run from chapter 1 to a win or game over:
+    # (won, last chapter, [(chapter, duel won)], play time in ms)
+    engine = DuelEngine(chapters=chapters, rng=rng)
+    engine.progress_speed = progress_speed
+    engine.start_chapter()
+    engine.confirm()
+    duels = []
+    while not engine.game_over_state:
+        engine.step(engine.countdown_timer)  # To the duel start
+        chapter = engine.current_chapter
+        for position, wanted in enumerate(engine.arrow_combination):
+            engine.step(model.reaction(rng) if position == 0 else model.interval(rng))
+            if not engine.duel_started:
+                break  # Timed out
+            engine.press(model.key(rng, wanted, engine.keys))
+            if not engine.duel_started:
+                break
+        duels.append((chapter, engine.winner == "Player"))
+        if engine.chapter_intro:
+            engine.confirm()
+        elif not engine.game_over_state:
+            engine.step(engine.animation_timer)  # To the next countdown
+    return engine.won, min(engine.current_chapter, len(chapters)), duels, engine.time
+
+
+def run_batch(task):
+    # Pool worker: play a batch of runs and return summed counts plus the
+    # run lengths needed for percentiles
+    model, runs, seed, chapters, progress_speed = task
+    rng = random.Random(seed)
+    count = len(chapters)
+    result = {"runs": runs, "wins": 0, "deaths": [0] * count, "reached": [0] * count,
+              "duels": [0] * count, "duels_won": [0] * count, "run_ms": [], "run_duels": []}
+    for _ in range(runs):
+        won, last, duels, play_ms = play_run(model, rng, chapters, progress_speed)
+        result["wins"] += won
+        if not won:
+            result["deaths"][last - 1] += 1
+        for chapter in range(last):
+            result["reached"][chapter] += 1
+        for chapter, duel_won in duels:
+            result["duels"][chapter - 1] += 1
+            result["duels_won"][chapter - 1] += duel_won
+        result["run_ms"].append(play_ms)
+        result["run_duels"].append(len(duels))
+    return result
+
+
+def merge(results, count):
+    total = {"runs": 0, "wins": 0, "deaths": [0] * count, "reached": [0] * count,
+             "duels": [0] * count, "duels_won": [0] * count, "run_ms": [], "run_duels": []}
+    for result in results:
+        for name, value in result.items():
+            if name in ("run_ms", "run_duels"):
+                total[name].extend(value)
+            elif isinstance(value, list):
+                total[name] = [a + b for a, b in zip(total[name], value)]
+            else:
+                total[name] += value
+    return total
+
+
+def percentiles(values):
+    if len(values) < 2:
+        value = values[0] if values else 0
+        return {"p50": value, "p90": value, "p99": value}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98]}
+
+
+def summarise(total, chapters):
+    runs = max(total["runs"], 1)
+    return {
+        "runs": total["runs"],
+        "win_rate": total["wins"] / runs,
+        "chapters": [{
+            "name": chapter["name"],
+            "reached": total["reached"][i] / runs,
+            "died_here": total["deaths"][i] / runs,
+            "duel_win_rate": total["duels_won"][i] / total["duels"][i] if total["duels"][i] else None,
+        } for i, chapter in enumerate(chapters)],
+        "run_seconds": {name: ms / 1000 for name, ms in percentiles(total["run_ms"]).items()},
+        "run_duels": percentiles(total["run_duels"]),
+    }
+
+
+def simulate(model, runs, seed=0, processes=None, chapters=CHAPTERS, progress_speed=PROGRESS_SPEED,
+             batch_runs=BATCH_RUNS):
+    chapters = [dict(chapter) for chapter in chapters]
+    tasks = []
+    for index, start in enumerate(range(0, runs, batch_runs)):
+        tasks.append((model, min(batch_runs, runs - start), seed * 1000003 + index, chapters, progress_speed))
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) == 1:
+        results = [run_batch(task) for task in tasks]
+    else:
+        # Spawned rather than forked: workers only need the engine, and a fork
+        # of a process with pygame's or the preloader's threads can deadlock
+        with multiprocessing.get_context("spawn").Pool(min(processes, len(tasks))) as pool:
+            results = pool.map(run_batch, tasks, chunksize=1)
+    return summarise(merge(results, len(chapters)), chapters)
+
+
+def parse_sweep(text):
+    name, _, values = text.partition("=")
+    if name not in ("progress_speed", "error_rate", "reaction_ms", "key_ms") or not values:
+        raise argparse.ArgumentTypeError("expected progress_speed|error_rate|reaction_ms|key_ms=V1,V2,...")
+    try:
+        return name, [float(value) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad values in {text!r}")
+
+
+def print_report(label, report):
+    print(f"{label}: win rate {report['win_rate']:.1%} over {report['runs']} runs; "
+          f"run length p50/p90/p99 {report['run_seconds']['p50']:.0f}/{report['run_seconds']['p90']:.0f}/"
+          f"{report['run_seconds']['p99']:.0f} s, {report['run_duels']['p50']:.0f}/"
+          f"{report['run_duels']['p90']:.0f}/{report['run_duels']['p99']:.0f} duels")
+    print(f"  {'chapter':<16}{'reached':>9}{'died here':>11}{'duels won':>11}")
+    for chapter in report["chapters"]:
+        duel_win_rate = "-" if chapter["duel_win_rate"] is None else f"{chapter['duel_win_rate']:.1%}"
+        print(f"  {chapter['name']:<16}{chapter['reached']:>9.1%}{chapter['died_here']:>11.1%}{duel_win_rate:>11}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate players through every chapter to check the difficulty curve")
+    parser.add_argument("--runs", type=int, default=10000, help="runs per configuration (default 10000)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: every core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reaction", type=float, nargs=2, default=(450, 120), metavar=("MEAN", "SD"),
+                        help="ms from the duel start to the first key (default 450 120)")
+    parser.add_argument("--key-interval", type=float, nargs=2, default=(180, 50), metavar=("MEAN", "SD"),
+                        help="ms between keys (default 180 50)")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="chance of each key being wrong (default 0.05)")
+    parser.add_argument("--progress-speed", type=float, default=PROGRESS_SPEED,
+                        help=f"duel timer in percent per second (default {PROGRESS_SPEED})")
+    parser.add_argument("--sweep", type=parse_sweep, metavar="PARAM=V1,V2,...",
+                        help="repeat for each value of progress_speed, error_rate, reaction_ms or key_ms (means)")
+    parser.add_argument("--json", help="write the reports to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    configurations = [(None, None)]
+    if args.sweep:
+        configurations = [(args.sweep[0], value) for value in args.sweep[1]]
+
+    reports = []
+    for name, value in configurations:
+        reaction, key_ms = tuple(args.reaction), tuple(args.key_interval)
+        error_rate, progress_speed = args.error_rate, args.progress_speed
+        if name == "reaction_ms":
+            reaction = (value, reaction[1])
+        elif name == "key_ms":
+            key_ms = (value, key_ms[1])
+        elif name == "error_rate":
+            error_rate = value
+        elif name == "progress_speed":
+            progress_speed = value
+        model = PlayerModel(reaction, key_ms, error_rate)
+
+        start = time.perf_counter()
+        report = simulate(model, args.runs, args.seed, args.processes, progress_speed=progress_speed)
+        elapsed = time.perf_counter() - start
+        report.update(player=model.to_dict(), progress_speed=progress_speed, seconds=elapsed)
+        reports.append(report)
+        print_report("baseline" if name is None else f"{name}={value:g}", report)
+        print(f"  ({args.runs / elapsed:.0f} runs/s)")
+
+    if args.json:
+        try:
+            with open(args.json, "w") as f:
+                json.dump(reports, f, indent=2)
+        except OSError as e:
+            logging.error(f"Couldn't write {args.json}: {e}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
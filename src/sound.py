@@ -1,68 +1,94 @@
 import pygame
 import os
 import logging
+from src.assets import assets, asset_path
+from src.music import get_music_player
+from src.channels import get_channel_pool
 
 class SoundManager:
-    def __init__(self):
+    # Short effects stay resident; long tracks are streamed by MusicPlayer
+    SFX = {
+        'shoot': 'shoot.wav',
+        'win': 'win.wav',
+        'dead': 'dead.wav',
+        'start': 'start.wav',
+        'game_over': 'game_over.wav'
+    }
+
+    def __init__(self, load=True):
         pygame.mixer.init()
-        self.sounds = {
-            'background_music': pygame.mixer.Sound('assets/sounds/background_music.mp3'),
-            'shoot': pygame.mixer.Sound('assets/sounds/shoot.wav'),
-            'win': pygame.mixer.Sound('assets/sounds/win.wav'),
-            'dead': pygame.mixer.Sound('assets/sounds/dead.wav'),
-            'start': pygame.mixer.Sound('assets/sounds/start.wav'),
-            'the_final_sunset': pygame.mixer.Sound('assets/sounds/the_final_sunset.mp3')
-        }
-        self.load_sounds()
+        self.asset_keys = []
+        self.sounds = {}
+        self.loaded = False
+        self.music = get_music_player()  # Shared: there is only one music stream
+        self.channels = get_channel_pool()  # Shared: reserved mixer channels per category
+        if load:
+            self.load_sounds()  # Otherwise on first use, or whenever the caller has time
 
-    def load_sounds(self):
-        sound_files = {
-            'presentation_music': 'presentation_music.mp3',
-            'game_over': 'game_over.wav',
-            'final_sunset': 'the_final_sunset.mp3'
-        }
+    def acquire(self, path):
+        # Decoded sounds are shared by every SoundManager in the process
+        sound = assets.sound(os.path.normpath(path))
+        self.asset_keys.append(('sound', os.path.normpath(path)))
+        return sound
 
-        for sound_name, file_name in sound_files.items():
-            file_path = os.path.join('assets', 'sounds', file_name)
+    def close(self):
+        for key in self.asset_keys:
+            assets.release(key)
+        self.asset_keys = []
+
+    def load_sounds(self):
+        self.loaded = True
+        for sound_name, file_name in self.SFX.items():
+            file_path = asset_path('sounds', file_name)
             try:
-                if sound_name in ['presentation_music', 'game_over']:
-                    # We don't load these into self.sounds as they're handled differently
-                    pygame.mixer.music.load(file_path)
-                    logging.info(f"Loaded music: {sound_name}")
-                else:
-                    self.sounds[sound_name] = pygame.mixer.Sound(file_path)
-                    logging.info(f"Loaded sound: {sound_name}")
-            except pygame.error as e:
+                self.sounds[sound_name] = self.acquire(file_path)
+                logging.info(f"Loaded sound: {sound_name}")
+            except (pygame.error, FileNotFoundError) as e:
                 logging.error(f"Couldn't load sound {sound_name}: {e}")
 
     def play_sound(self, sound_name):
-        if sound_name in ['background_music', 'presentation_music']:
-            try:
-                pygame.mixer.music.load(os.path.join('assets', 'sounds', f'{sound_name}.mp3'))
-                pygame.mixer.music.play(-1)
-                logging.info(f"Playing music: {sound_name}")
-            except pygame.error as e:
-                logging.error(f"Couldn't play music {sound_name}: {e}")
+        if not self.loaded and sound_name in self.SFX:
+            self.load_sounds()
+        if sound_name in self.music.tracks:
+            self.music.play(sound_name)
         elif sound_name in self.sounds:
             try:
-                self.sounds[sound_name].play()
-                logging.info(f"Playing sound: {sound_name}")
+                if self.channels.play(sound_name, self.sounds[sound_name]) is not None:
+                    logging.info(f"Playing sound: {sound_name}")
             except pygame.error as e:
                 logging.error(f"Couldn't play sound {sound_name}: {e}")
         else:
             logging.error(f"Sound not found: {sound_name}")
 
+    def play_music(self, name, fade_ms=0):
+        # Switch tracks, crossfading when fade_ms is given; no-op if it's already playing
+        if fade_ms:
+            self.music.crossfade(name, fade_ms)
+        else:
+            self.music.play(name)
+
     def stop_music(self):
-        pygame.mixer.music.stop()
-        logging.info("Stopped music")
+        self.music.stop()
 
     def fade_out(self, time):
-        pygame.mixer.music.fadeout(time)
+        self.music.fadeout(time)
+
+    def update(self):
+        self.music.update()
+
+    def wake_ms(self):
+        return self.music.wake_ms()
+
+    def handle_event(self, event):
+        return self.music.handle_event(event)
 
     def stop_sound(self, sound_name):
-        if sound_name in self.sounds:
+        if sound_name in self.music.tracks:
+            if self.music.is_playing(sound_name):
+                self.music.stop()
+        elif sound_name in self.sounds:
             try:
-                self.sounds[sound_name].stop()
+                self.channels.stop(sound_name)
                 logging.info(f"Stopped sound: {sound_name}")
             except pygame.error as e:
                 logging.error(f"Couldn't stop sound {sound_name}: {e}")
@@ -0,0 +1,66 @@
+import time
+from contextlib import contextmanager
+
+# Startup timeline. main() books each phase of getting the title screen up
+# (imports, window, first frame) and everything it defers to idle frames or
+# first use afterwards, so time-to-first-frame can be tracked and kept low:
+#
+#   python src/main.py --startup-profile
+#
+# The clock starts when this module is imported, which main.py does before
+# importing pygame. Nothing here needs pygame.
+
+
+class StartupTimeline:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.phases = []  # (name, start ms, duration ms) in the order they finished
+        self.marks = {}  # name -> ms since start, first time only
+
+    def now(self):
+        return (self.clock() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self.now() - start))
+
+    def mark(self, name):
+        self.marks.setdefault(name, self.now())
+
+    def report(self):
+        rows = [(start, name, f"{start:9.1f} {duration:9.1f}") for name, start, duration in self.phases]
+        rows += [(at, name, f"{at:9.1f}") for name, at in self.marks.items()]
+        lines = [f"  {'phase':<24}{'start ms':>9} {'took ms':>9}"]
+        lines += [f"  {name:<24}{columns}" for _, name, columns in sorted(rows, key=lambda row: row[0])]
+        if "first frame" in self.marks:
+            lines.append(f"  time to first frame: {self.marks['first frame']:.1f} ms")
+        return lines
+
+
+class Deferred:
+    # A subsystem built on first use, or ahead of time on an idle frame;
+    # either way it is built once and booked to the timeline
+    def __init__(self, name, build, timeline=None):
+        self.name = name
+        self.build = build
+        self.timeline = timeline
+        self.value = None
+        self.built = False
+
+    def get(self):
+        if not self.built:
+            if self.timeline is None:
+                self.value = self.build()
+            else:
+                with self.timeline.phase(self.name):
+                    self.value = self.build()
+            self.built = True
+        return self.value
+
+
+timeline = StartupTimeline()
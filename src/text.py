@@ -0,0 +1,163 @@
+import pygame
+from collections import OrderedDict
+from src.transitions import blit_alpha
+
+# Process-wide font and rendered-text caches. Fonts are loaded once per
+# (face, size) and identical strings are rasterised once, so steady-state
+# frames do no font loading or glyph rendering. TextLayout wraps paragraphs
+# from per-word advance widths and keeps the wrapped, rendered lines per
+# (text, font, width), so story text costs one set of blits per frame.
+
+class FontRegistry:
+    def __init__(self):
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, face=None, size=36):
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, antialias=True):
+        # Fonts come from the registry, so the font object itself is a stable key.
+        # Cached surfaces are shared: callers that change alpha must set it before every blit.
+        key = (text, font, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+
+class TextBlock:
+    def __init__(self, lines, surfaces, line_height):
+        self.lines = lines
+        self.surfaces = surfaces
+        self.line_height = line_height
+        self.width = max((surface.get_width() for surface in surfaces), default=0)
+        self.height = len(lines) * line_height
+        self.anchor = None
+        self.rects = []
+
+    def layout(self, center_x, y):
+        # Line rects with the first line centred on (center_x, y); kept until the anchor moves
+        if self.anchor != (center_x, y):
+            self.anchor = (center_x, y)
+            self.rects = [surface.get_rect(center=(center_x, y + i * self.line_height))
+                          for i, surface in enumerate(self.surfaces)]
+        return self.rects
+
+    def draw(self, screen, center_x, y, alpha=255):
+        # Fades only change the alpha: the cached line surfaces are reused
+        return [blit_alpha(screen, surface, rect, alpha)
+                for surface, rect in zip(self.surfaces, self.layout(center_x, y))]
+
+
+class TextLayout:
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.wrapped = OrderedDict()
+        self.blocks = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, entries, key, build):
+        value = entries.get(key)
+        if value is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = entries[key] = build()
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return value
+
+    def wrap(self, text, font, max_width):
+        return self.cached(self.wrapped, (text, font, max_width),
+                           lambda: wrap_lines(text, font, max_width))
+
+    def block(self, text, font, color, max_width, antialias=True, line_height=None):
+        key = (text, font, tuple(color), max_width, antialias, line_height)
+        return self.cached(self.blocks, key,
+                           lambda: self.render_block(text, font, color, max_width, antialias, line_height))
+
+    def render_block(self, text, font, color, max_width, antialias, line_height):
+        lines = self.wrap(text, font, max_width)
+        surfaces = [font.render(line, antialias, color) for line in lines]
+        return TextBlock(lines, surfaces, line_height or font.get_linesize())
+
+    def clear(self):
+        self.wrapped.clear()
+        self.blocks.clear()
+
+
+def wrap_lines(text, font, max_width):
+    # Greedy wrap on measured word advances: no glyphs are rasterised, and
+    # explicit newlines always break. A word wider than the line gets its own.
+    space = font.size(' ')[0]
+    lines = []
+    for paragraph in text.split('\n'):
+        line, width = [], 0
+        for word in paragraph.split():
+            advance = font.size(word)[0]
+            if line and width + space + advance > max_width:
+                lines.append(' '.join(line))
+                line, width = [], 0
+            width += (space if line else 0) + advance
+            line.append(word)
+        lines.append(' '.join(line))
+    return tuple(lines)
+
+
+fonts = FontRegistry()
+text_cache = TextCache()
+text_layout = TextLayout()
+
+def get_font(size, face=None):
+    return fonts.get(face, size)
+
+def render_text(text, font, color, antialias=True):
+    return text_cache.render(text, font, color, antialias)
+
+def text_block(text, font, color, max_width, antialias=True, line_height=None):
+    return text_layout.block(text, font, color, max_width, antialias, line_height)
+
+def text_stats():
+    return {
+        "font_hits": fonts.hits,
+        "font_misses": fonts.misses,
+        "fonts_loaded": len(fonts.fonts),
+        "text_hits": text_cache.hits,
+        "text_misses": text_cache.misses,
+        "text_entries": len(text_cache.entries),
+        "layout_hits": text_layout.hits,
+        "layout_misses": text_layout.misses,
+    }
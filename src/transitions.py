@@ -0,0 +1,88 @@
+import pygame
+
+# Time-based fades shared by the story scenes. Surfaces are brought into the
+# display's pixel format once, up front; every frame then only changes the
+# surface alpha and blits, so a fade allocates nothing. Alpha is restored
+# after each blit because images and text surfaces are shared through the
+# asset manager and the text cache.
+
+FADE_MS = 850  # The old 5-alpha-per-frame fade at 60 FPS
+
+
+class Fade:
+    def __init__(self, duration=FADE_MS, start=0, end=255):
+        self.duration = duration
+        self.start = start
+        self.end = end
+        self.elapsed = 0
+
+    def update(self, dt):
+        self.elapsed = min(self.duration, self.elapsed + dt)
+
+    @property
+    def done(self):
+        return self.elapsed >= self.duration
+
+    @property
+    def alpha(self):
+        if self.duration <= 0:
+            return self.end
+        return round(self.start + (self.end - self.start) * self.elapsed / self.duration)
+
+
+def fade_in(duration=FADE_MS):
+    return Fade(duration, 0, 255)
+
+def fade_out(duration=FADE_MS):
+    return Fade(duration, 255, 0)
+
+
+def prepare(surface):
+    # Convert once so blits don't convert the pixel format every frame
+    display = pygame.display.get_surface()
+    if display is None:
+        return surface
+    if surface.get_bitsize() == display.get_bitsize() and surface.get_masks() == display.get_masks():
+        return surface  # Already display format (e.g. from the image cache): no copy
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+def blit_alpha(screen, surface, position, alpha):
+    if alpha <= 0:
+        return None
+    previous = surface.get_alpha()
+    surface.set_alpha(alpha)
+    rect = screen.blit(surface, position)
+    surface.set_alpha(previous)
+    return rect
+
+
+class Transition:
+    def __init__(self, screen):
+        self.screen = screen
+        self.overlay = prepare(pygame.Surface(screen.get_size()))  # Black, for fade-to-black
+        self.snapshot = None
+
+    def draw(self, layers, alpha):
+        # layers: (surface, position) pairs drawn at the same alpha
+        return [blit_alpha(self.screen, surface, position, alpha) for surface, position in layers]
+
+    def crossfade(self, old_layers, new_layers, alpha):
+        # alpha is the new layers' opacity; the old ones fade out as it rises
+        return self.draw(old_layers, 255 - alpha) + self.draw(new_layers, alpha)
+
+    def capture(self):
+        # Freeze what's on screen (one copy) so it can be faded to black
+        if self.snapshot is None:
+            self.snapshot = self.screen.copy()
+        else:
+            self.snapshot.blit(self.screen, (0, 0))
+        return self.snapshot
+
+    def fade_to_black(self, alpha):
+        # alpha is the overlay's opacity: 0 shows the snapshot, 255 is black
+        if self.snapshot is not None:
+            self.screen.blit(self.snapshot, (0, 0))
+        blit_alpha(self.screen, self.overlay, (0, 0), alpha)
+        return self.screen.get_rect()
@@ -1,10 +1,10 @@
 import pygame
+from src.text import get_font, render_text
 
 def draw_message(screen, message, width, height, y_offset=0):
-    font = pygame.font.Font(None, 36)
-    text = font.render(message, True, (0, 0, 0))
+    text = render_text(message, get_font(36), (0, 0, 0))
     text_rect = text.get_rect(center=(width // 2, height // 2 + y_offset))
-    screen.blit(text, text_rect)
+    return screen.blit(text, text_rect)
 
 def draw_progress_bar(screen, x, y, width, height, progress):
     border_color = (100, 100, 100)  # Gray
@@ -19,4 +19,10 @@ def draw_progress_bar(screen, x, y, width, height, progress):
     pygame.draw.rect(screen, bar_color, (x, y, progress_width, height))
 
     # Draw border
-    pygame.draw.rect(screen, border_color, (x, y, width, height), 2)
+    return pygame.draw.rect(screen, border_color, (x, y, width, height), 2)
+
+# Simulation timing. All timers are expressed in milliseconds and advanced by
+# the frame delta, so the game plays the same at any frame rate.
+FPS = 60
+FRAME_MS = 1000 / FPS
+MAX_FRAME_MS = 250  # Clamp long stalls (window drag, breakpoints) to one step
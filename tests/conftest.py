@@ -1,6 +1,67 @@
 import sys
 import os
+import tempfile
+import pytest
+from unittest.mock import Mock, patch
+
+# Run pygame headless so the suite works without a display or sound card
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PIXELATED_SHOWDOWN_CACHE', tempfile.mkdtemp(prefix='pixelated-cache-'))
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
\ No newline at end of file
+sys.path.insert(0, project_root)
+
+class FakeClock:
+    # Stands in for time.perf_counter; only moves when a test advances it
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def mock_sound_manager():
+    from src.sound import SoundManager
+    with patch('src.sound.pygame.mixer.Sound', return_value=Mock()), \
+         patch('pygame.mixer.Channel'):
+        yield SoundManager()
+
+@pytest.fixture
+def make_game(mock_sound_manager):
+    # Builds Games on an off-screen surface whose sound effects are mocks
+    import pygame
+    from src.game import Game
+
+    def make(**kwargs):
+        with patch('pygame.display.set_mode'), \
+             patch('pygame.mixer.init'), \
+             patch('src.game.SoundManager', return_value=mock_sound_manager):
+            return Game(pygame.Surface((800, 600)), **kwargs)
+    return make
+
+@pytest.fixture
+def game(make_game):
+    return make_game(debug_mode=True)
+
+@pytest.fixture(autouse=True)
+def clear_asset_cache():
+    # The asset manager, music player and channel pool are process-wide; keep patched loaders from leaking between tests
+    from src.assets import assets
+    from src.music import reset_music_player
+    from src.channels import reset_channel_pool
+    assets.clear()
+    reset_music_player()
+    reset_channel_pool()
+    yield
+    reset_music_player()
+    reset_channel_pool()
+    assets.clear()
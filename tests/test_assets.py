@@ -0,0 +1,102 @@
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from src.assets import AssetManager, assets
+from src.image_cache import ImageCache
+from src.graphics import Graphics
+from src.sound import SoundManager
+
+class TestAssetManager:
+    def test_asset_is_loaded_once_and_shared(self):
+        manager = AssetManager()
+        loader = Mock(return_value=pygame.Surface((10, 10)))
+        first = manager.acquire('thing', loader)
+        assert manager.acquire('thing', loader) is first
+        loader.assert_called_once()
+        assert manager.entries['thing'].refs == 2
+
+    def test_release_frees_asset_after_last_reference(self):
+        manager = AssetManager()
+        manager.acquire('thing', lambda: pygame.Surface((10, 10)))
+        manager.acquire('thing', lambda: pygame.Surface((10, 10)))
+        manager.release('thing')
+        assert 'thing' in manager.entries
+        manager.release('thing')
+        assert 'thing' not in manager.entries
+
+    def test_report_lists_resident_bytes(self):
+        manager = AssetManager()
+        manager.acquire('small', lambda: pygame.Surface((10, 10), pygame.SRCALPHA))
+        manager.acquire('big', lambda: {'a': pygame.Surface((100, 10), pygame.SRCALPHA)})
+        report = manager.report()
+        assert [key for key, _, _ in report] == ['big', 'small']
+        assert report[1][2] == 10 * 10 * 4
+        assert manager.resident_bytes() == 110 * 10 * 4
+
+class TestSharedAssets:
+    def test_graphics_instances_share_sprites(self):
+        screen = pygame.Surface((800, 600))
+        first = Graphics(screen, 800, 600)
+        loads = assets.loads
+        second = Graphics(screen, 800, 600)
+        assert assets.loads == loads
+        assert second.player_images is first.player_images
+        assert second.background is first.background
+
+    def test_graphics_close_releases_sprites(self):
+        graphics = Graphics(pygame.Surface((800, 600)), 800, 600)
+        graphics.close()
+        assert assets.entries == {}
+
+    def test_sound_managers_decode_each_file_once(self):
+        with patch('src.assets.pygame.mixer.Sound', side_effect=lambda path: Mock()) as mock_sound:
+            first = SoundManager()
+            calls = mock_sound.call_count
+            second = SoundManager()
+            assert mock_sound.call_count == calls
+            assert second.sounds['shoot'] is first.sounds['shoot']
+            assert 'the_final_sunset' not in first.sounds
+
+class TestImageCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ImageCache(str(tmp_path))
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        image = pygame.Surface((30, 30))
+        image.fill((200, 100, 50))
+        path = str(tmp_path / "01.png")
+        pygame.image.save(image, path)
+        return path
+
+    def test_second_load_skips_decode_and_scale(self, cache, source):
+        first = cache.load(source, (60, 40))
+        with patch('pygame.image.load') as mock_load, patch('pygame.transform.scale') as mock_scale:
+            second = cache.load(source, (60, 40))
+            mock_load.assert_not_called()
+            mock_scale.assert_not_called()
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.get_size() == (60, 40)
+        assert not second.get_locked()
+        assert pygame.image.tobytes(second, "RGB") == pygame.image.tobytes(first, "RGB")
+
+    def test_changed_source_or_size_invalidates(self, cache, source, tmp_path):
+        cache.load(source, (60, 40))
+        cache.load(source, (30, 20))
+        assert cache.misses == 2
+        image = pygame.Surface((30, 30))
+        image.fill((0, 0, 255))
+        pygame.image.save(image, source)
+        assert cache.load(source, (60, 40)).get_at((0, 0))[:3] == (0, 0, 255)
+        assert cache.misses == 3
+        # The stale entry for the old contents was replaced
+        assert len(list(tmp_path.glob("01-60x40-*.raw"))) == 1
+
+    def test_corrupt_entry_is_rebuilt(self, cache, source, tmp_path):
+        cache.load(source, (60, 40))
+        entry = next(tmp_path.glob("01-60x40-*.raw"))
+        entry.write_bytes(b"short")
+        assert cache.load(source, (60, 40)).get_at((0, 0))[:3] == (200, 100, 50)
+        assert cache.misses == 2
@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.channels import ChannelPool, Voice
+
+
+@pytest.fixture
+def clock():
+    now = [1000]
+    clock = lambda: now[0]
+    clock.now = now
+    return clock
+
+@pytest.fixture
+def pool(clock):
+    def make_channel(index):
+        channel = Mock()
+        channel.index = index
+        channel.get_busy.return_value = False
+        return channel
+    voices = {
+        'click': Voice('ui', 1, 0),
+        'shot': Voice('gunfire', 2, 30),
+        'ricochet': Voice('gunfire', 1, 0),
+        'cry': Voice('voice', 3, 100),
+    }
+    with patch('pygame.mixer.set_num_channels'), patch('pygame.mixer.set_reserved'), \
+         patch('pygame.mixer.Channel', side_effect=make_channel):
+        return ChannelPool({'ui': 1, 'gunfire': 2, 'voice': 1}, voices, clock)
+
+
+class TestChannelPool:
+    def test_categories_get_their_own_channels(self, pool):
+        assert [channel.index for channel in pool.channels['ui']] == [0]
+        assert [channel.index for channel in pool.channels['gunfire']] == [1, 2]
+        assert [channel.index for channel in pool.channels['voice']] == [3]
+
+    def test_mixer_channels_are_reserved(self, clock):
+        with patch('pygame.mixer.set_num_channels') as set_num, patch('pygame.mixer.set_reserved') as set_reserved, \
+             patch('pygame.mixer.Channel'):
+            ChannelPool({'ui': 1, 'voice': 2}, {}, clock)
+        set_reserved.assert_called_once_with(3)
+        assert set_num.call_args[0][0] >= 3
+
+    def test_sounds_play_in_their_category(self, pool):
+        sound = Mock()
+        channel = pool.play('cry', sound)
+        assert channel is pool.channels['voice'][0]
+        channel.play.assert_called_once_with(sound)
+
+    def test_full_category_does_not_spill_into_others(self, pool, clock):
+        pool.play('cry', Mock()).get_busy.return_value = True
+        clock.now[0] += 1000
+        assert pool.play('shot', Mock()) in pool.channels['gunfire']
+        assert not pool.channels['voice'][0].stop.called
+
+    def test_steals_oldest_voice_of_equal_or_lower_priority(self, pool, clock):
+        first = pool.play('ricochet', Mock())
+        first.get_busy.return_value = True
+        clock.now[0] += 50
+        second = pool.play('shot', Mock())
+        second.get_busy.return_value = True
+        clock.now[0] += 50
+        assert pool.play('shot', Mock()) is first
+        first.stop.assert_called_once()
+        assert pool.stolen == 1
+
+    def test_drops_when_only_higher_priority_voices_play(self, pool, clock):
+        for _ in range(2):
+            pool.play('shot', Mock()).get_busy.return_value = True
+            clock.now[0] += 50
+        assert pool.play('ricochet', Mock()) is None
+        assert pool.dropped == 1
+
+    def test_retriggers_inside_cooldown_collapse(self, pool, clock):
+        assert pool.play('shot', Mock()) is not None
+        clock.now[0] += 10
+        assert pool.play('shot', Mock()) is None
+        clock.now[0] += 30
+        assert pool.play('shot', Mock()) is not None
+        assert pool.stats() == {'played': 2, 'dropped': 0, 'stolen': 0, 'collapsed': 1}
+
+    def test_stop_only_stops_that_sound(self, pool):
+        cry = pool.play('cry', Mock())
+        shot = pool.play('shot', Mock())
+        pool.stop('cry')
+        cry.stop.assert_called_once()
+        shot.stop.assert_not_called()
@@ -0,0 +1,113 @@
+import random
+
+from src.combo import ComboMatcher, ComboSet, build_automaton, MATCHED, FAILED
+from src.engine import ARROWS
+
+KEYS = ARROWS
+
+
+def slice_duel(combination, keys):
+    # The list-and-slice rules DuelEngine.press used before the matcher:
+    # (result or None, correct leading keys, keys consumed)
+    player_input, correct_keys = [], 0
+    for key in keys:
+        player_input.append(key)
+        position = len(player_input) - 1
+        if correct_keys == position and position < len(combination) and combination[position] == key:
+            correct_keys += 1
+        if player_input[-len(combination):] == combination:
+            return MATCHED, correct_keys, len(player_input)
+        if len(player_input) >= len(combination):
+            return FAILED, correct_keys, len(player_input)
+    return None, correct_keys, len(player_input)
+
+def first_occurrence(combination, keys):
+    # Keys consumed when combination first appears in the stream, or None
+    for end in range(len(combination), len(keys) + 1):
+        if list(keys[end - len(combination):end]) == list(combination):
+            return end
+    return None
+
+def random_cases(count, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        combination = [rng.choice(KEYS) for _ in range(rng.randint(1, 12))]
+        if rng.random() < 0.5:  # Mostly right, with the odd slip
+            keys = [key if rng.random() < 0.9 else rng.choice(KEYS) for key in combination]
+        else:
+            keys = [rng.choice(KEYS) for _ in range(rng.randint(0, 16))]
+        yield combination, keys
+
+
+class TestStrictMatching:
+    def test_agrees_with_slice_semantics(self):
+        for combination, keys in random_cases(3000):
+            matcher = ComboMatcher(combination)
+            consumed = 0
+            for key in keys:
+                if matcher.done:
+                    break
+                matcher.feed(key)
+                consumed += 1
+            assert (matcher.result, matcher.progress, consumed) == slice_duel(combination, keys)
+
+    def test_progress_after_every_key(self):
+        for combination, keys in random_cases(500, seed=11):
+            matcher = ComboMatcher(combination)
+            for count, key in enumerate(keys[:len(combination)], start=1):
+                matcher.feed(key)
+                assert matcher.progress == slice_duel(combination, keys[:count])[1]
+
+    def test_history_is_bounded_by_the_combination(self):
+        matcher = ComboMatcher(["up", "down"], strict=False)
+        for _ in range(1000):
+            matcher.feed("left")
+        assert list(matcher.history) == ["left", "left"]
+        assert matcher.count == 1000
+
+    def test_decided_attempt_ignores_more_keys(self):
+        matcher = ComboMatcher(["up"])
+        assert matcher.feed("down") == FAILED
+        assert matcher.feed("up") == FAILED
+        assert matcher.count == 1
+
+
+class TestSlidingMatching:
+    def test_agrees_with_naive_search(self):
+        rng = random.Random(3)
+        for _ in range(2000):
+            combination = [rng.choice(KEYS[:2]) for _ in range(rng.randint(1, 6))]
+            keys = [rng.choice(KEYS[:2]) for _ in range(rng.randint(0, 30))]
+            matcher = ComboMatcher(combination, strict=False)
+            matched_at = None
+            for count, key in enumerate(keys, start=1):
+                if matcher.feed(key) == MATCHED:
+                    matched_at = count
+                    break
+            assert matched_at == first_occurrence(combination, keys)
+
+    def test_automaton_falls_back_on_overlaps(self):
+        table = build_automaton("abab")
+        assert table[3]["b"] == 4
+        assert table[3]["a"] == 1  # "aba" + "a" keeps only the last "a"
+        assert table[2].get("b", 0) == 0
+        matcher = ComboMatcher("abab", strict=False)
+        assert [matcher.feed(key) for key in "aabab"] == [None] * 4 + [MATCHED]
+
+
+class TestComboSet:
+    def test_one_key_stream_feeds_every_combo(self):
+        combos = ComboSet()
+        combos.add("left player", ["up", "up", "left"])
+        combos.add("right player", ["up", "down"])
+        assert combos.feed("up") == []
+        assert combos.feed("up") == [("right player", FAILED)]
+        assert combos.progress("left player") == 2
+        assert combos.feed("left") == [("left player", MATCHED)]
+        assert combos.feed("left") == []
+
+    def test_removed_combos_stop_matching(self):
+        combos = ComboSet()
+        combos.add("target", ["up"])
+        combos.remove("target")
+        assert combos.feed("up") == []
@@ -0,0 +1,91 @@
+import random
+import subprocess
+import sys
+import pytest
+
+from src.engine import (DuelEngine, ARROWS, CHAPTERS, ANIMATION_DURATION, COUNTDOWN_STEP,
+                        CHAPTER_STARTED, COUNTDOWN_STARTED, DUEL_STARTED, DUEL_ENDED, GAME_OVER, GAME_WON)
+
+@pytest.fixture
+def engine():
+    return DuelEngine(rng=random.Random(1))
+
+def start_duel(engine):
+    engine.start_chapter()
+    engine.confirm()
+    engine.step(COUNTDOWN_STEP * 4)
+    assert engine.duel_started
+
+class TestDuelEngine:
+    def test_engine_has_no_pygame_dependency(self):
+        code = "import sys, src.engine; sys.exit('pygame' in sys.modules)"
+        assert subprocess.call([sys.executable, "-c", code]) == 0
+
+    def test_chapter_intro_and_countdown_events(self, engine):
+        start_duel(engine)
+        kinds = [event.kind for event in engine.poll_events()]
+        assert kinds == [CHAPTER_STARTED, COUNTDOWN_STARTED, DUEL_STARTED]
+        assert len(engine.arrow_combination) == CHAPTERS[0]["combo"]
+
+    def test_correct_combination_wins(self, engine):
+        start_duel(engine)
+        for key in engine.arrow_combination:
+            engine.press(key)
+        assert engine.winner == "Player"
+        assert engine.enemy_lives == CHAPTERS[0]["lives"] - 1
+        assert engine.poll_events()[-1].kind == DUEL_ENDED
+        assert engine.animation_timer == ANIMATION_DURATION * 3
+
+    def test_timeout_loses(self, engine):
+        start_duel(engine)
+        engine.step(100 * 1000 / engine.progress_speed)
+        assert engine.winner == "Computer"
+        assert engine.player_lives == 2
+
+    def test_timeout_mid_step_only_delays_by_the_rest_of_the_step(self, engine):
+        start_duel(engine)
+        engine.step(100 * 1000 / engine.progress_speed + 200)
+        assert engine.winner == "Computer"
+        assert engine.animation_timer == pytest.approx(ANIMATION_DURATION * 3 - 200)
+
+    def test_keys_outside_alphabet_are_ignored(self, engine):
+        start_duel(engine)
+        engine.press("enter")
+        assert engine.player_input == []
+
+    def test_losing_every_duel_ends_the_game(self, engine):
+        start_duel(engine)
+        for _ in range(3):
+            engine.end_duel("Computer")
+            engine.step(ANIMATION_DURATION * 3 + COUNTDOWN_STEP * 4)
+        assert engine.game_over_state
+        assert GAME_OVER in [event.kind for event in engine.poll_events()]
+
+    def test_winning_every_duel_wins_the_game(self, engine):
+        engine.start_chapter()
+        while not engine.game_over_state:
+            if engine.chapter_intro:
+                engine.confirm()
+            elif engine.duel_started:
+                for key in engine.arrow_combination:
+                    engine.press(key)
+            else:
+                engine.step(100)
+        assert engine.won
+        assert engine.poll_events()[-1].kind == GAME_WON
+
+    def test_step_is_frame_rate_independent(self):
+        results = []
+        for dt in (1000 / 30, 1000 / 144, 250):
+            engine = DuelEngine(rng=random.Random(7))
+            start_duel(engine)
+            while engine.duel_started:
+                engine.step(dt)
+            results.append((engine.winner, engine.player_lives))
+        assert len(set(results)) == 1
+
+    def test_custom_key_alphabet(self):
+        engine = DuelEngine(keys=[1, 2], rng=random.Random(3))
+        start_duel(engine)
+        assert set(engine.arrow_combination) <= {1, 2}
+        assert ARROWS == ("left", "up", "right", "down")
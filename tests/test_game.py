@@ -8,24 +8,10 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
-from src.game import Game
 from src.characters import Player, Computer
 from src.graphics import Graphics
 from src.sound import SoundManager
-
-@pytest.fixture
-def mock_sound_manager():
-    with patch('src.sound.pygame.mixer.Sound', return_value=Mock()) as mock_sound:
-        sound_manager = SoundManager()
-        yield sound_manager
-
-@pytest.fixture
-def game(mock_sound_manager):
-    with patch('pygame.display.set_mode'), \
-         patch('pygame.mixer.init'), \
-         patch('src.game.SoundManager', return_value=mock_sound_manager):
-        game_instance = Game(Mock(), debug_mode=True)
-        return game_instance
+from src.music import MUSIC_END
 
 class TestGameInitialization:
     def test_game_attributes(self, game, mock_sound_manager):
@@ -88,8 +74,9 @@ class TestGameMechanics:
 
     def test_reset_game(self, game):
         game.winner = "Player"
-        game.duel_started = True
-        game.player_input = [pygame.K_UP, pygame.K_DOWN]
+        game.engine.start_duel()
+        game.engine.press(game.arrow_combination[0])
+        assert game.player_input == [game.arrow_combination[0]]
         game.progress = 50
         game.player.state = "shoot"
         game.computer.state = "hit"
@@ -103,16 +90,15 @@ class TestGameMechanics:
         assert game.computer.state == "normal"
 
 class TestGameUpdate:
-    @patch('random.random')
-    def test_update_start_duel(self, mock_random, game):
-        mock_random.return_value = 0.005
-        game.update()
+    def test_update_start_duel(self, game):
+        # The duel starts once the countdown's elapsed time runs out, not on a random frame
+        game.start_countdown()
+        game.update(game.COUNTDOWN_STEP * 4)
         assert game.duel_started == True
 
-    @patch('random.random')
-    def test_update_no_start_duel(self, mock_random, game):
-        mock_random.return_value = 0.02
-        game.update()
+    def test_update_no_start_duel(self, game):
+        game.start_countdown()
+        game.update(game.COUNTDOWN_STEP * 4 - 1)
         assert game.duel_started == False
 
     def test_update_progress(self, game):
@@ -128,14 +114,157 @@ class TestGameUpdate:
         assert game.winner == "Computer"
         assert game.duel_started == False
 
+class TestTimedPhases:
+    def test_start_chapter_does_not_block(self, game):
+        game.start_chapter()
+        assert game.chapter_intro == True
+        assert game.duel_started == False
+
+    def test_countdown_runs_through_update(self, game):
+        game.start_countdown()
+        assert game.duel_started == False
+        game.update(game.COUNTDOWN_STEP * 4 - 1)
+        assert game.duel_started == False
+        game.update(1)
+        assert game.duel_started == True
+        assert len(game.arrow_combination) == game.combination_length
+
+    def test_post_duel_delay_starts_countdown(self, game):
+        game.end_duel("Computer")
+        game.update(game.ANIMATION_DURATION * 3)
+        assert game.countdown_timer == game.COUNTDOWN_STEP * 4
+
+    def test_only_screens_waiting_for_a_key_are_static(self, game):
+        game.debug_mode = False  # The overlay keeps every screen moving
+        game.start_chapter()
+        assert game.idle_ms() is not None
+        game.confirm()
+        assert game.idle_ms() is None  # Countdown
+        game.update(game.COUNTDOWN_STEP * 4)
+        assert game.duel_started
+        assert game.idle_ms() is None
+
+class TestFrameRateIndependence:
+    @pytest.mark.parametrize("fps", [30, 60, 144])
+    def test_progress_depletes_in_same_time(self, game, fps):
+        game.duel_started = True
+        for _ in range(fps):  # One second of frames
+            game.update(1000 / fps)
+        assert game.progress == pytest.approx(game.progress_speed)
+
+    def test_post_duel_delay_is_time_based(self, game):
+        game.end_duel("Player")
+        game.update(game.ANIMATION_DURATION * 3 - 1)
+        assert game.animation_timer > 0
+        game.update(1)
+        assert game.countdown_timer == game.COUNTDOWN_STEP * 4
+
+    def test_character_animation_chain(self, game):
+        player = game.player
+        player.set_state("shoot")
+        player.update(player.ANIMATION_DURATION)
+        assert player.state == "win"
+        player.update(player.ANIMATION_DURATION * 2 - 1)
+        assert player.state == "win"
+        player.update(1)
+        assert player.state == "normal"
+
+    def test_character_long_frame_skips_through_chain(self, game):
+        player = game.player
+        player.set_state("shoot")
+        player.update(player.ANIMATION_DURATION * 4)
+        assert player.state == "normal"
+        assert player.animation_timer == 0
+
+def draw_frame(game):
+    # One frame as the scene manager runs it
+    game.draw()
+    game.present()
+
+class TestDirtyRectRendering:
+    @pytest.fixture
+    def dirty_game(self, game):
+        game.renderer.dirty_rects = True
+        return game
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    def test_scene_change_flips_full_screen(self, mock_flip, mock_update, dirty_game):
+        dirty_game.start_chapter()
+        draw_frame(dirty_game)
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    def test_steady_duel_frames_update_only_dirty_regions(self, mock_flip, mock_update, dirty_game):
+        dirty_game.start_duel()
+        draw_frame(dirty_game)
+        dirty_game.update()
+        draw_frame(dirty_game)
+        assert mock_flip.call_count == 1
+        rects = mock_update.call_args[0][0]
+        assert rects
+        assert sum(rect.w * rect.h for rect in rects) < dirty_game.WIDTH * dirty_game.HEIGHT / 4
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    def test_dirty_frames_match_full_frames(self, mock_flip, mock_update, game):
+        game.start_duel()
+        draw_frame(game)
+        game.update()
+        draw_frame(game)
+        full = pygame.image.tobytes(game.screen, "RGB")
+
+        game.renderer.dirty_rects = True
+        game.renderer.invalidate()
+        draw_frame(game)
+        game.player_lives -= 1  # A heart disappears
+        draw_frame(game)
+        game.player_lives += 1
+        draw_frame(game)
+        assert pygame.image.tobytes(game.screen, "RGB") == full
+
+class TestArrowStrip:
+    def test_duel_frames_do_not_scale_arrows(self, game):
+        game.start_duel()
+        with patch('pygame.transform.scale') as mock_scale, \
+             patch.object(game.graphics, 'build_combination_strip') as mock_build:
+            for _ in range(10):
+                game.graphics.draw_arrow_combination(game.arrow_combination, game.correct_keys)
+            mock_scale.assert_not_called()
+            mock_build.assert_not_called()
+
+    def test_correct_keys_are_highlighted_incrementally(self, game):
+        game.start_duel()
+        game.arrow_combination = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+        game.graphics.draw_arrow_combination(game.arrow_combination, game.correct_keys)
+        strip = game.graphics.combination_strip
+        game.check_input(pygame.K_UP)
+        game.check_input(pygame.K_DOWN)
+        assert game.correct_keys == 2
+        game.graphics.draw_arrow_combination(game.arrow_combination, game.correct_keys)
+        assert game.graphics.combination_strip is strip
+        assert game.graphics.highlighted == 2
+
+    def test_wrong_key_stops_highlighting(self, game):
+        game.start_duel()
+        game.arrow_combination = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+        game.check_input(pygame.K_UP)
+        game.check_input(pygame.K_UP)
+        game.check_input(pygame.K_LEFT)
+        assert game.correct_keys == 1
+
 class TestSoundManager:
     def test_sound_manager_initialization(self, mock_sound_manager):
-        assert 'background_music' in mock_sound_manager.sounds
+        assert 'background_music' in mock_sound_manager.music.tracks
+        assert 'background_music' not in mock_sound_manager.sounds
         assert 'shoot' in mock_sound_manager.sounds
 
     def test_sound_manager_play_sound(self, mock_sound_manager):
-        mock_sound_manager.play_sound('shoot')
-        mock_sound_manager.sounds['shoot'].play.assert_called_once()
+        with patch.object(mock_sound_manager.channels, 'play') as mock_play:
+            mock_sound_manager.play_sound('shoot')
+        mock_play.assert_called_once_with('shoot', mock_sound_manager.sounds['shoot'])
 
     @patch('pygame.mixer.music')
     def test_sound_manager_play_music(self, mock_mixer_music, mock_sound_manager):
@@ -163,15 +292,99 @@ class TestGameProgression:
 
     @patch('src.game.EndingScene')
     def test_win_game(self, mock_ending_scene, game):
-        mock_ending_scene.return_value.show_ending.return_value = "new_game"
+        game.manager = Mock()
         game.win_game()
         assert game.game_over_state == True
-        mock_ending_scene.return_value.show_ending.assert_called_once()
+        game.manager.push.assert_called_once_with(mock_ending_scene.return_value)
+
+    def test_leaving_the_game_releases_its_preloaded_assets(self, game):
+        with patch('src.game.preloader') as mock_preloader:
+            game.exit()
+        mock_preloader.release.assert_called_once_with('game')
+
+    @patch('src.game.EndingScene')
+    def test_new_game_after_the_ending(self, mock_ending_scene, game):
+        game.manager = Mock()
+        game.win_game()
+        mock_ending_scene.return_value.result = "new_game"
+        game.resume()
+        assert game.game_over_state == False
+        assert game.current_chapter == 1
+        assert game.chapter_intro
 
 class TestDebugMode:
-    def test_debug_skip_to_end(self, game):
+    @patch('src.game.EndingScene')
+    def test_debug_skip_to_end(self, mock_ending_scene, game):
+        game.manager = Mock()
         game.debug_skip_to_end()
         assert game.current_chapter == 8
         assert game.enemy_lives == 1
         assert game.combination_length == 12
         assert game.computer.current_enemy == "Dried Gut"
+        assert game.game_over_state == True  # Straight to the ending
+
+class TestMusicPlayer:
+    @patch('pygame.mixer.music')
+    def test_music_is_streamed_not_decoded(self, mock_mixer_music, mock_sound_manager):
+        with patch('pygame.mixer.Sound') as mock_sound:
+            mock_sound_manager.play_sound('the_final_sunset')
+            mock_sound.assert_not_called()
+        mock_mixer_music.load.assert_called_once()
+        mock_mixer_music.play.assert_called_once_with(0)
+        assert mock_sound_manager.music.is_playing('the_final_sunset')
+
+    @patch('pygame.mixer.music')
+    def test_stop_sound_stops_streamed_track(self, mock_mixer_music, mock_sound_manager):
+        mock_sound_manager.play_sound('the_final_sunset')
+        mock_sound_manager.stop_sound('the_final_sunset')
+        mock_mixer_music.stop.assert_called_once()
+        assert mock_sound_manager.music.current is None
+
+    @patch('pygame.time.get_ticks')
+    @patch('pygame.mixer.music')
+    def test_crossfade_fades_out_then_in(self, mock_mixer_music, mock_ticks, mock_sound_manager):
+        music = mock_sound_manager.music
+        mock_ticks.return_value = 0
+        music.play('background_music')
+        music.crossfade('the_final_sunset', 1000)
+        mock_mixer_music.fadeout.assert_called_once_with(500)
+        music.update()
+        assert music.current is None
+        mock_ticks.return_value = 500
+        music.update()
+        mock_mixer_music.play.assert_called_with(0, fade_ms=500)
+        assert music.is_playing('the_final_sunset')
+
+    @patch('pygame.mixer.music')
+    def test_end_event_clears_the_finished_track(self, mock_mixer_music, mock_sound_manager):
+        music = mock_sound_manager.music
+        music.play('the_final_sunset')
+        mock_mixer_music.get_busy.return_value = False
+        assert music.handle_event(pygame.event.Event(MUSIC_END))
+        assert music.current is None
+
+    @patch('pygame.mixer.music')
+    def test_replaying_current_track_is_a_no_op(self, mock_mixer_music, mock_sound_manager):
+        mock_mixer_music.get_busy.return_value = True
+        mock_sound_manager.play_sound('background_music')
+        mock_sound_manager.play_sound('background_music')
+        mock_sound_manager.play_music('background_music', fade_ms=1000)
+        mock_mixer_music.load.assert_called_once()
+        mock_mixer_music.stop.assert_not_called()
+        mock_mixer_music.fadeout.assert_not_called()
+
+    @patch('pygame.mixer.music')
+    def test_track_switches_read_nothing_from_disk(self, mock_mixer_music, mock_sound_manager):
+        music = mock_sound_manager.music
+        music.play('background_music')
+        music.play('the_final_sunset')
+        with patch('builtins.open') as mock_open:
+            music.play('background_music')
+            music.play('final_sunset')
+            mock_open.assert_not_called()
+        assert mock_mixer_music.load.call_count == 4
+
+    @patch('pygame.mixer.music')
+    def test_sound_managers_share_one_player(self, mock_mixer_music, mock_sound_manager):
+        with patch('pygame.mixer.init'), patch('pygame.mixer.Sound'):
+            assert SoundManager().music is mock_sound_manager.music
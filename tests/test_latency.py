@@ -0,0 +1,102 @@
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from src.latency import LatencyTracker, LatencyProbe
+
+
+@pytest.fixture
+def tracker(clock):
+    return LatencyTracker(clock=clock)
+
+def keydown(**attributes):
+    return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, **attributes)
+
+
+class TestLatencyTracker:
+    def test_press_is_timed_through_to_the_flip(self, tracker, clock):
+        tracker.key_down(keydown(), chapter=1)
+        clock.advance(1)
+        tracker.decided()
+        clock.advance(2)
+        tracker.state_changed()
+        clock.advance(10)
+        tracker.presented()
+        decision, state, photon = tracker.samples[1][0]
+        assert decision == pytest.approx(1)
+        assert state == pytest.approx(3)
+        assert photon == pytest.approx(13)
+        assert tracker.decisive == 1
+
+    def test_injected_events_are_timed_from_injection(self, tracker, clock):
+        tracker.key_down(keydown(injected_at=clock.now - 0.005), chapter=2)
+        tracker.presented()
+        assert tracker.samples[2][0][2] == pytest.approx(5)
+        assert tracker.samples[2][0][1] is None
+
+    def test_presses_in_one_frame_share_the_flip(self, tracker, clock):
+        tracker.key_down(keydown(), chapter=1)
+        clock.advance(4)
+        tracker.key_down(keydown(), chapter=1)
+        clock.advance(4)
+        tracker.presented()
+        tracker.presented()  # Nothing left open
+        assert [sample[2] for sample in tracker.samples[1]] == pytest.approx([8, 4])
+
+    def test_stats_per_chapter(self, tracker, clock):
+        for ms in range(1, 101):
+            tracker.key_down(keydown(), chapter=3)
+            clock.advance(ms)
+            tracker.presented()
+        stats = tracker.stats(3)
+        assert stats["count"] == 100
+        assert (stats["p50"], stats["p95"], stats["max"]) == pytest.approx((50, 95, 100))
+        assert tracker.stats(4) is None
+        assert "ch 3" in tracker.summary(3)
+
+
+class TestGameLatency:
+    def test_winning_press_is_stamped_through_end_duel(self, game):
+        game.engine.start_countdown()
+        game.engine.start_duel()
+        game.handle_engine_events()
+        combination = list(game.arrow_combination)
+        with patch('pygame.display.flip'):
+            for key in combination:
+                game.latency.key_down(keydown(), game.current_chapter)
+                game.check_input(key)
+            game.draw()
+            game.present()
+        samples = game.latency.samples[1]
+        assert len(samples) == len(combination)
+        assert samples[-1][1] is not None
+        assert all(sample[1] is None for sample in list(samples)[:-1])
+        assert game.latency.decisive == 1
+
+    def test_chapter_report_waits_for_the_last_key_to_be_presented(self, game):
+        game.start_chapter()
+        game.latency.key_down(keydown(), game.current_chapter)
+        counts = []
+        with patch.object(game.latency, 'log_report',
+                          side_effect=lambda chapter: counts.append(game.latency.stats(chapter)["count"])):
+            game.next_chapter()  # The key that won chapter 1 is still waiting for its frame
+            assert counts == []
+            with patch('pygame.display.flip'):
+                game.draw()
+                game.present()
+        assert counts == [1]
+        assert game.latency_report_due is None
+
+
+class TestLatencyProbe:
+    def test_probe_confirms_intros_and_plays_the_right_key(self):
+        game = Mock(chapter_intro=True, duel_started=False)
+        probe = LatencyProbe(game)
+        assert probe.next_key() == pygame.K_RETURN
+        game.chapter_intro = False
+        game.duel_started = True
+        game.arrow_combination = [pygame.K_UP, pygame.K_DOWN]
+        game.correct_keys = 1
+        assert probe.next_key() == pygame.K_DOWN
+        game.correct_keys = 2
+        assert probe.next_key() is None
@@ -0,0 +1,86 @@
+import os
+import pygame
+import pytest
+from unittest.mock import patch
+
+from src.assets import AssetManager, ASSET_DIR, asset_path, pack_name
+from src.pack import AssetPack, PackError, write_pack, referenced_assets, MAGIC
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    image = pygame.Surface((8, 6))
+    image.fill((10, 200, 30))
+    image_file = str(tmp_path / "slide.png")
+    pygame.image.save(image, image_file)
+    (tmp_path / "copy.png").write_bytes((tmp_path / "slide.png").read_bytes())
+    (tmp_path / "notes.txt").write_bytes(b"0123456789")
+    path = str(tmp_path / "assets.pack")
+    write_pack(path, [("notes.txt", str(tmp_path / "notes.txt")), ("images/01.png", image_file),
+                      ("images/02.png", str(tmp_path / "copy.png"))])
+    return path
+
+@pytest.fixture
+def pack(pack_path):
+    pack = AssetPack(pack_path)
+    yield pack
+    pack.close()
+
+
+class TestAssetPack:
+    def test_index_and_views(self, pack):
+        assert pack.names() == ["notes.txt", "images/01.png", "images/02.png"]
+        with pack.view("notes.txt") as data:
+            assert bytes(data) == b"0123456789"
+        reader = pack.open("notes.txt")
+        assert reader.read(4) == b"0123"
+        reader.seek(-2, os.SEEK_END)
+        assert reader.read() == b"89"
+        reader.close()
+        assert pack.verify() == []
+
+    def test_identical_files_are_stored_once(self, pack):
+        assert pack.entries["images/01.png"] == pack.entries["images/02.png"]
+
+    def test_rejects_other_and_truncated_files(self, pack_path, tmp_path):
+        other = tmp_path / "other.pack"
+        other.write_bytes(b"PNG\x00" + bytes(20))
+        with pytest.raises(PackError):
+            AssetPack(str(other))
+        with open(pack_path, 'rb') as f:
+            data = f.read()
+        assert data[:4] == MAGIC
+        other.write_bytes(data[:-1])
+        with pytest.raises(PackError):
+            AssetPack(str(other))
+
+
+class TestPackedAssets:
+    def test_images_load_from_the_pack(self, pack_path):
+        manager = AssetManager()
+        manager.open_pack(pack_path)
+        with patch('builtins.open', side_effect=AssertionError("read a loose file")):
+            image = manager.image(asset_path('images', '01.png'))
+        assert image.get_at((0, 0))[:3] == (10, 200, 30)
+        manager.clear()
+        manager.pack.close()
+
+    def test_unpacked_assets_fall_back_to_files(self, pack_path, tmp_path):
+        manager = AssetManager()
+        manager.open_pack(pack_path)
+        loose = tmp_path / "loose.bin"
+        loose.write_bytes(b"abc")
+        assert manager.data(str(loose)) == b"abc"
+        manager.pack.close()
+
+    def test_asset_paths_do_not_depend_on_the_working_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert os.path.exists(asset_path('sounds', 'shoot.wav'))
+        assert pack_name(asset_path('sounds', 'shoot.wav')) == "sounds/shoot.wav"
+
+    def test_builder_packs_only_referenced_assets(self):
+        names = [pack_name(path) for path in referenced_assets()]
+        assert names[0] == "sounds/background_music.mp3"  # The title screen's music comes first
+        assert "images/01.png" in names and "sounds/game_over.wav" in names
+        assert not any(name.endswith(".webp") or name == "images/player.png" for name in names)
+        assert all(os.path.abspath(path).startswith(ASSET_DIR) for path in referenced_assets())
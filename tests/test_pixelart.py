@@ -0,0 +1,59 @@
+import pygame
+
+from src.pixelart import rasterise, build_sheet, palette_colors
+
+SPRITE = [
+    [0, 1, 1, 0],
+    [1, 2, 2, 1],
+    [0, 1, 0, 0],
+]
+PALETTE = [(0, 0, 0), (255, 0, 0)]
+
+
+def reference(pixels, pixel_size, palette):
+    # What the per-pixel pygame.draw.rect loops used to produce
+    colors = palette_colors(palette)
+    surface = pygame.Surface((len(pixels[0]) * pixel_size, len(pixels) * pixel_size), pygame.SRCALPHA)
+    for y, row in enumerate(pixels):
+        for x, index in enumerate(row):
+            if index:
+                pygame.draw.rect(surface, colors[index], (x * pixel_size, y * pixel_size, pixel_size, pixel_size))
+    return surface
+
+def rgba_bytes(surface):
+    return pygame.image.tobytes(surface, 'RGBA')
+
+
+class TestRasterise:
+    def test_matches_per_pixel_rects(self):
+        sprite = rasterise(SPRITE, 3, PALETTE)
+        assert sprite.get_size() == (12, 9)
+        assert rgba_bytes(sprite) == rgba_bytes(reference(SPRITE, 3, PALETTE))
+
+    def test_palette_indices_pick_colours(self):
+        sprite = rasterise(SPRITE, 1, {1: (0, 0, 255), 2: (0, 255, 0)})
+        assert sprite.get_at((1, 0)) == (0, 0, 255, 255)
+        assert sprite.get_at((1, 1)) == (0, 255, 0, 255)
+        assert sprite.get_at((0, 0)).a == 0
+
+    def test_lit_cells_draw_over_an_existing_surface(self):
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill((255, 255, 255))
+        rasterise(SPRITE, 2, PALETTE, surface, offset=(1, 1))
+        assert surface.get_at((0, 0)) == (255, 255, 255, 255)
+        assert surface.get_at((1, 1)) == (255, 255, 255, 255)  # Unlit cell keeps the background
+        assert surface.get_at((3, 1)) == (0, 0, 0, 255)
+
+
+class TestSpriteSheet:
+    def test_sheet_cells_match_single_sprites(self):
+        tall = SPRITE + [[1, 1, 1, 1]]
+        sheet = build_sheet({"wide": SPRITE, "tall": tall}, (20, 20), PALETTE)
+        assert list(sheet) == ["wide", "tall"]
+        assert sheet["wide"].get_parent() is sheet["tall"].get_parent()
+        for name, pixels in (("wide", SPRITE), ("tall", tall)):
+            cell = sheet[name]
+            assert cell.get_size() == (20, 20)
+            expected = pygame.Surface((20, 20), pygame.SRCALPHA)
+            expected.blit(reference(pixels, 5, PALETTE), (0, 0))
+            assert rgba_bytes(cell) == rgba_bytes(expected)
@@ -0,0 +1,46 @@
+import pygame
+import pytest
+from unittest.mock import Mock
+
+from src.assets import AssetManager
+from src.preload import Preloader, FINAL_CHAPTER
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = str(tmp_path / "slide.png")
+    pygame.image.save(pygame.Surface((8, 8)), path)
+    return path
+
+@pytest.fixture
+def preloader(image_path):
+    manager = AssetManager()
+    scene_assets = {'ending': [('image', image_path, None), ('image', image_path + '.missing', None)]}
+    preloader = Preloader(manager, scene_assets, {'game': ['ending']})
+    yield preloader
+    preloader.stop()
+
+class TestPreloader:
+    def test_ending_is_only_warmed_on_the_final_chapter(self, preloader):
+        preloader.enter_scene('game', FINAL_CHAPTER - 1)
+        assert preloader.scheduled == set()
+        preloader.enter_scene('game', FINAL_CHAPTER)
+        assert preloader.wait('ending', timeout=5000)
+
+    def test_preloaded_asset_is_handed_off_without_loading(self, preloader, image_path):
+        preloader.preload('ending')
+        assert preloader.wait('ending', timeout=5000)
+        loader = Mock()
+        preloader.manager.acquire(('image', image_path, None), loader)
+        loader.assert_not_called()
+
+    def test_missing_asset_does_not_stall_the_scene(self, preloader, image_path):
+        preloader.preload('ending')
+        assert preloader.wait('ending', timeout=5000)
+        assert preloader.held['ending'] == [('image', image_path, None)]
+
+    def test_release_drops_preloaded_references(self, preloader, image_path):
+        preloader.preload('ending')
+        preloader.wait('ending', timeout=5000)
+        preloader.release('ending')
+        assert not preloader.ready('ending')
+        assert not preloader.manager.is_loaded(('image', image_path, None))
@@ -0,0 +1,79 @@
+import csv
+import pygame
+import pytest
+
+from src.profiler import FrameProfiler, PHASES, percentile
+
+
+@pytest.fixture
+def profiler(clock):
+    return FrameProfiler(60, history_seconds=10, clock=clock)
+
+def run_frame(profiler, clock, frame_ms, update_ms=1.0):
+    profiler.begin_frame()
+    clock.advance(update_ms)
+    profiler.lap("update")
+    clock.advance(frame_ms - update_ms)
+    profiler.end_frame(frame_ms)
+
+
+class TestFrameProfiler:
+    def test_laps_book_time_to_phases(self, profiler, clock):
+        profiler.begin_frame()
+        clock.advance(2)
+        profiler.lap("events")
+        clock.advance(3)
+        profiler.lap("sprites")
+        clock.advance(1)
+        profiler.lap("sprites")
+        clock.advance(11)
+        profiler.end_frame(17)
+        phases = profiler.samples[-1][2]
+        assert phases["events"] == pytest.approx(2)
+        assert phases["sprites"] == pytest.approx(4)
+        assert phases["idle"] == pytest.approx(11)
+
+    def test_percentiles_and_dropped_frames(self, profiler, clock):
+        for _ in range(98):
+            run_frame(profiler, clock, 16.7)
+        run_frame(profiler, clock, 33.4)
+        run_frame(profiler, clock, 50.1)
+        stats = profiler.percentiles()
+        assert stats["p50"] == pytest.approx(16.7)
+        assert stats["p99"] == pytest.approx(33.4)
+        assert profiler.dropped_frames() == 3
+
+    def test_history_is_bounded_in_time(self, profiler, clock):
+        for _ in range(1200):  # 20 seconds at 60 FPS
+            run_frame(profiler, clock, 1000 / 60)
+        assert 590 <= len(profiler.samples) <= 602
+
+    def test_histogram_bins_frame_times(self, profiler, clock):
+        for frame_ms in (3, 16, 16.5, 40, 500):
+            run_frame(profiler, clock, frame_ms, update_ms=0.5)
+        counts = profiler.histogram()
+        assert sum(counts) == 5
+        assert counts[0] == 1 and counts[3] == 2 and counts[-1] == 1
+
+    def test_dump_csv_writes_every_sample(self, profiler, clock, tmp_path):
+        for _ in range(5):
+            run_frame(profiler, clock, 16.7)
+        path = profiler.dump_csv(str(tmp_path / "frames.csv"))
+        with open(path) as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["time", "frame_ms"] + list(PHASES)
+        assert len(rows) == 6
+        assert float(rows[1][1]) == pytest.approx(16.7)
+
+    def test_overlay_is_rebuilt_only_periodically(self, profiler, clock):
+        pygame.font.init()
+        run_frame(profiler, clock, 16.7)
+        screen = pygame.Surface((800, 600))
+        rect = profiler.draw(screen, pygame.font.Font(None, 18))
+        panel = profiler.overlay
+        profiler.draw(screen, pygame.font.Font(None, 18))
+        assert profiler.overlay is panel
+        assert rect.topleft == (10, 40)
+
+    def test_percentile_of_empty_history(self):
+        assert percentile([], 0.5) == 0.0
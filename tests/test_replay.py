@@ -0,0 +1,101 @@
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from src.engine import COUNTDOWN_STEP
+from src.replay import (Replay, ReplayError, ReplayRecorder, ReplayPlayer, MAGIC,
+                        PRESS, STEP, CONFIRM, START)
+
+
+def play_session(game, duels=3):
+    # Win one duel, fluff one, time one out
+    game.start_chapter()
+    game.confirm()
+    for duel in range(duels):
+        game.update(COUNTDOWN_STEP * 4)
+        assert game.duel_started
+        if duel % 3 == 0:
+            for key in game.arrow_combination:
+                game.check_input(key)
+        elif duel % 3 == 1:
+            game.check_input(pygame.K_a)  # Not an arrow: ignored, not recorded
+            wrong = [key for key in game.engine.keys if key != game.arrow_combination[0]][0]
+            game.check_input(wrong)
+        while game.duel_started:
+            game.update(16.5 if duel % 3 == 2 else 17)
+        game.update(3 * 500)
+
+@pytest.fixture
+def recording(make_game, tmp_path):
+    path = str(tmp_path / "session.replay")
+    game = make_game(seed=1234, replay=ReplayRecorder(path))
+    play_session(game)
+    game.replay.close()
+    return path, game
+
+
+class TestRecording:
+    def test_session_seed_fixes_the_combos(self, make_game):
+        combos = []
+        for _ in range(2):
+            game = make_game(seed=99)
+            game.start_chapter()
+            game.confirm()
+            game.update(COUNTDOWN_STEP * 4)
+            combos.append(list(game.arrow_combination))
+        assert combos[0] == combos[1]
+
+    def test_replay_holds_the_inputs_and_a_hash_per_duel(self, recording):
+        path, game = recording
+        replay = Replay.load(path)
+        assert replay.seed == 1234
+        assert replay.keys == list(game.engine.keys)
+        assert replay.ops[:2] == [(START, 0), (CONFIRM, 0)]
+        assert pygame.K_a not in [arg for op, arg in replay.ops if op == PRESS]
+        assert 16.5 in [arg for op, arg in replay.ops if op == STEP]
+        assert len(replay.hashes) == 3
+        with open(path, 'rb') as f:
+            assert f.read(4) == MAGIC
+
+
+class TestPlayback:
+    def test_headless_playback_reproduces_every_duel(self, recording):
+        path, game = recording
+        player = ReplayPlayer(Replay.load(path))
+        engine = player.run_headless()
+        assert player.verified
+        assert engine.state_hash() == game.engine.state_hash()
+
+    def test_visual_playback_reproduces_every_duel(self, recording, make_game):
+        path, _ = recording
+        replay = Replay.load(path)
+        game = make_game(seed=replay.seed, replay=ReplayPlayer(replay))
+        clock = Mock()
+        clock.return_value.tick.return_value = 250  # Long frames rather than waiting in real time
+        with patch('pygame.display.flip'), patch('pygame.display.update'), \
+             patch('pygame.time.Clock', clock):
+            player = game.play_replay()
+        assert player.verified
+        assert player.duels == 3
+
+    def test_divergence_is_reported(self, recording):
+        path, _ = recording
+        replay = Replay.load(path)
+        replay.seed += 1  # Different combos
+        player = ReplayPlayer(replay)
+        player.run_headless()
+        assert not player.verified
+        assert player.mismatches[0] == 1
+
+
+class TestReplayFormat:
+    def test_rejects_other_files(self):
+        with pytest.raises(ReplayError):
+            Replay.parse(b"PNG\x00" + bytes(20))
+
+    def test_rejects_truncated_records(self, recording):
+        path, _ = recording
+        with open(path, 'rb') as f:
+            data = f.read()
+        with pytest.raises(ReplayError):
+            Replay.parse(data[:-1])  # Ends in a frame step
@@ -0,0 +1,153 @@
+import math
+import pygame
+import pytest
+from unittest.mock import Mock, patch
+
+from src.scenes import Scene, SceneManager, IDLE_WAIT_MS
+from src.utils import MAX_FRAME_MS
+
+
+class RecordingScene(Scene):
+    def __init__(self, name, log, frames=None, idle=None):
+        self.name = name
+        self.log = log
+        self.frames = frames  # Quit after this many updates
+        self.idle = idle
+        self.updates = 0
+        self.dts = []
+
+    def enter(self):
+        self.log.append((self.name, "enter"))
+
+    def exit(self):
+        self.log.append((self.name, "exit"))
+
+    def pause(self):
+        self.log.append((self.name, "pause"))
+
+    def resume(self):
+        self.log.append((self.name, "resume"))
+
+    def handle_event(self, event):
+        self.log.append((self.name, "event", event.type))
+
+    def update(self, dt):
+        self.updates += 1
+        self.dts.append(dt)
+        if self.frames is not None and self.updates >= self.frames:
+            self.manager.quit()
+
+    def draw(self):
+        self.log.append((self.name, "draw"))
+
+    def idle_ms(self):
+        return self.idle
+
+
+@pytest.fixture
+def manager():
+    return SceneManager(pygame.Surface((80, 60)), fps=0)
+
+
+class TestSceneStack:
+    def test_push_pop_switch_call_the_hooks(self, manager):
+        log = []
+        manager.register("a", RecordingScene("a", log))
+        manager.register("b", RecordingScene("b", log))
+        manager.push("a")
+        manager.push("b")
+        manager.pop()
+        manager.switch("b")
+        assert log == [("a", "enter"), ("a", "pause"), ("b", "enter"), ("b", "exit"),
+                       ("a", "resume"), ("a", "exit"), ("b", "enter")]
+
+    def test_factories_build_each_scene_once(self, manager):
+        factory = Mock(side_effect=lambda: RecordingScene("a", []))
+        manager.register("a", factory)
+        first = manager.push("a")
+        manager.pop()
+        assert manager.push("a") is first
+        factory.assert_called_once()
+
+    def test_quit_exits_every_scene(self, manager):
+        log = []
+        manager.push(RecordingScene("a", log))
+        manager.push(RecordingScene("b", log))
+        manager.quit()
+        assert log[-2:] == [("b", "exit"), ("a", "exit")]
+        assert manager.top is None
+
+
+class TestMainLoop:
+    def test_one_present_per_frame(self, manager):
+        log = []
+        scene = RecordingScene("a", log, frames=3)
+        with patch('pygame.event.get', return_value=[]), patch('pygame.display.flip') as mock_flip:
+            manager.run(scene)
+        assert scene.updates == 3
+        assert log.count(("a", "draw")) == 2  # The third update quit before drawing
+        assert mock_flip.call_count == 2
+
+    def test_events_go_to_the_top_scene_and_quit_stops_the_loop(self, manager):
+        log = []
+        manager.push(RecordingScene("under", log))
+        top = manager.push(RecordingScene("top", log))
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a), pygame.event.Event(pygame.QUIT)]
+        with patch('pygame.event.get', return_value=events), patch('pygame.display.flip'):
+            manager.run()
+        assert ("top", "event", pygame.KEYDOWN) in log
+        assert ("under", "event", pygame.KEYDOWN) not in log
+        assert top.updates == 0
+        assert manager.top is None
+
+    def test_deferred_work_runs_one_task_per_frame_after_presenting(self, manager):
+        log = []
+        scene = RecordingScene("a", log, frames=3)
+        manager.defer(lambda: log.append("first"))
+        manager.defer(lambda: log.append("second"))
+        manager.defer(lambda: log.append("third"))
+        with patch('pygame.event.get', return_value=[]), patch('pygame.display.flip'):
+            manager.run(scene)
+        assert log == [("a", "enter"), ("a", "draw"), "first", ("a", "draw"), "second", ("a", "exit")]
+        assert len(manager.deferred) == 1
+
+
+class TestIdle:
+    def run_static(self, manager, scene, woken_by=()):
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in woken_by]
+        wait = Mock(side_effect=lambda timeout: events.pop(0) if events else pygame.event.Event(pygame.NOEVENT))
+        with patch('pygame.event.get', return_value=[]), patch('pygame.event.wait', wait), \
+             patch('pygame.display.flip') as mock_flip:
+            manager.run(scene)
+        return wait, mock_flip
+
+    def test_static_scene_is_drawn_once_then_waits(self, manager):
+        log = []
+        scene = RecordingScene("a", log, frames=7, idle=300)
+        wait, mock_flip = self.run_static(manager, scene)
+        assert log.count(("a", "draw")) == 1
+        assert mock_flip.call_count == 1
+        wait.assert_called_with(300)
+        assert wait.call_count == 3  # Each wait is followed by two updates: the waited time, then the frame
+
+    def test_input_wakes_and_redraws(self, manager):
+        log = []
+        scene = RecordingScene("a", log, frames=5, idle=math.inf)
+        wait, mock_flip = self.run_static(manager, scene, woken_by=[pygame.K_a])
+        assert ("a", "event", pygame.KEYDOWN) in log
+        assert log.count(("a", "draw")) == 2
+        wait.assert_called_with(IDLE_WAIT_MS)
+
+    def test_waking_never_hands_over_more_than_a_frame_at_once(self, manager):
+        # The clock says the wait took 5 s: only the 1 s asked for counts, in clamped steps
+        scene = RecordingScene("a", [], frames=6, idle=1000)
+        manager.clock = Mock(tick=Mock(return_value=5000))
+        self.run_static(manager, scene)
+        assert max(scene.dts) <= MAX_FRAME_MS
+        assert scene.dts[1:5] == [MAX_FRAME_MS] * 4
+
+    def test_animating_scene_never_waits(self, manager):
+        scene = RecordingScene("a", [], frames=3)
+        wait, mock_flip = self.run_static(manager, scene)
+        wait.assert_not_called()
+        assert mock_flip.call_count == 2
@@ -0,0 +1,48 @@
+import random
+import pytest
+
+from src.engine import CHAPTERS, PLAYER_LIVES, PROGRESS_SPEED
+from src.simulator import PlayerModel, play_run, simulate
+
+PERFECT = PlayerModel(reaction_ms=(200, 0), key_ms=(100, 0), error_rate=0)
+
+
+class TestPlayRun:
+    def test_perfect_player_clears_every_chapter(self):
+        won, last, duels, play_ms = play_run(PERFECT, random.Random(1))
+        assert won
+        assert last == len(CHAPTERS)
+        assert len(duels) == sum(chapter["lives"] for chapter in CHAPTERS)
+        assert all(duel_won for _, duel_won in duels)
+        assert play_ms > 0
+
+    def test_player_who_always_slips_dies_in_chapter_one(self):
+        model = PlayerModel(reaction_ms=(200, 0), key_ms=(100, 0), error_rate=1)
+        won, last, duels, _ = play_run(model, random.Random(1))
+        assert not won
+        assert last == 1
+        assert duels == [(1, False)] * PLAYER_LIVES
+
+    def test_slow_player_times_out(self):
+        slow = PlayerModel(reaction_ms=(2 * 100000 / PROGRESS_SPEED, 0), key_ms=(100, 0), error_rate=0)
+        won, _, duels, play_ms = play_run(slow, random.Random(1))
+        assert not won
+        assert len(duels) == PLAYER_LIVES
+
+
+class TestSimulate:
+    def test_results_do_not_depend_on_the_process_count(self):
+        model = PlayerModel(error_rate=0.02)
+        one = simulate(model, 60, seed=5, processes=1, batch_runs=10)
+        two = simulate(model, 60, seed=5, processes=2, batch_runs=10)
+        assert one == two
+        assert one["runs"] == 60
+
+    def test_attrition_adds_up(self):
+        report = simulate(PlayerModel(), 200, seed=3, processes=1)
+        chapters = report["chapters"]
+        assert chapters[0]["reached"] == 1
+        assert sum(chapter["died_here"] for chapter in chapters) + report["win_rate"] == pytest.approx(1)
+        for this, after in zip(chapters, chapters[1:]):
+            assert after["reached"] <= this["reached"]
+        assert report["run_seconds"]["p50"] <= report["run_seconds"]["p99"]
@@ -0,0 +1,32 @@
+from unittest.mock import Mock
+
+from src.startup import StartupTimeline, Deferred
+
+
+class TestStartupTimeline:
+    def test_phases_and_marks_in_start_order(self, clock):
+        timeline = StartupTimeline(clock)
+        with timeline.phase("window"):
+            clock.advance(4)
+        timeline.mark("first frame")
+        clock.advance(10)
+        timeline.mark("first frame")  # Only the first one counts
+        with timeline.phase("sound"):
+            clock.advance(2)
+        assert timeline.phases == [("window", 0, 4), ("sound", 14, 2)]
+        assert timeline.marks == {"first frame": 4}
+        lines = timeline.report()
+        assert [line.split()[0] for line in lines[1:4]] == ["window", "first", "sound"]
+        assert lines[-1] == "  time to first frame: 4.0 ms"
+
+
+class TestDeferred:
+    def test_builds_once_and_books_the_build(self, clock):
+        timeline = StartupTimeline(clock)
+        build = Mock(return_value="sound manager")
+        sound = Deferred("sound", build, timeline)
+        assert not sound.built
+        assert sound.get() == "sound manager"
+        assert sound.get() == "sound manager"
+        build.assert_called_once()
+        assert [name for name, _, _ in timeline.phases] == ["sound"]
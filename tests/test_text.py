@@ -0,0 +1,98 @@
+import pygame
+import pytest
+
+from src.text import FontRegistry, TextCache, TextLayout, fonts, get_font, text_stats, wrap_lines
+from src.utils import draw_message
+
+@pytest.fixture(autouse=True)
+def init_fonts():
+    pygame.font.init()
+
+class TestFontRegistry:
+    def test_fonts_are_shared_per_face_and_size(self):
+        registry = FontRegistry()
+        assert registry.get(None, 36) is registry.get(None, 36)
+        assert registry.get(None, 36) is not registry.get(None, 72)
+        assert (registry.hits, registry.misses) == (2, 2)
+
+class TestTextCache:
+    def test_identical_text_is_rendered_once(self):
+        cache = TextCache()
+        font = get_font(36)
+        first = cache.render("Chapter 1", font, (0, 0, 0))
+        assert cache.render("Chapter 1", font, (0, 0, 0)) is first
+        assert cache.render("Chapter 1", font, (255, 0, 0)) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TextCache(max_entries=2)
+        font = get_font(36)
+        a = cache.render("a", font, (0, 0, 0))
+        cache.render("b", font, (0, 0, 0))
+        cache.render("a", font, (0, 0, 0))
+        cache.render("c", font, (0, 0, 0))
+        assert ("b", font, (0, 0, 0), True) not in cache.entries
+        assert cache.render("a", font, (0, 0, 0)) is a
+
+    def test_steady_state_messages_do_no_font_work(self):
+        screen = pygame.Surface((800, 600))
+        draw_message(screen, "Game Over!", 800, 600)
+        before = text_stats()
+        for _ in range(10):
+            draw_message(screen, "Game Over!", 800, 600)
+        after = text_stats()
+        assert after["font_misses"] == before["font_misses"]
+        assert after["text_misses"] == before["text_misses"]
+        assert len(fonts.fonts) == after["fonts_loaded"]
+
+class TestTextLayout:
+    STORY = ("One day, a gang of the most dangerous and ruthless men, known as the \"Dried Gut,\" "
+             "attacked a farming village, killing the men and abducting the women and children.")
+
+    def prefix_wrap(self, text, font, max_width):
+        # The old measure-every-growing-prefix wrap
+        lines, current = [], []
+        for word in text.split():
+            if font.size(' '.join(current + [word]))[0] <= max_width:
+                current.append(word)
+            else:
+                lines.append(' '.join(current))
+                current = [word]
+        lines.append(' '.join(current))
+        return tuple(lines)
+
+    def test_wrap_matches_prefix_measurement(self):
+        layout = TextLayout()
+        font = get_font(32)
+        for width in (200, 400, 780):
+            assert layout.wrap(self.STORY, font, width) == self.prefix_wrap(self.STORY, font, width)
+
+    def test_newlines_break_and_long_words_get_their_own_line(self):
+        font = get_font(32)
+        assert wrap_lines("Chapter 1\nEnemy: Boot", font, 800) == ("Chapter 1", "Enemy: Boot")
+        assert wrap_lines("a Pneumonoultramicroscopic b", font, 50) == ("a", "Pneumonoultramicroscopic", "b")
+
+    def test_blocks_are_cached_per_text_font_and_width(self):
+        layout = TextLayout()
+        font = get_font(32)
+        block = layout.block(self.STORY, font, (255, 255, 255), 780)
+        assert layout.block(self.STORY, font, (255, 255, 255), 780) is block
+        assert layout.block(self.STORY, font, (255, 255, 255), 400) is not block
+        assert len(block.surfaces) == len(block.lines)
+        assert block.height == len(block.lines) * font.get_linesize()
+
+    def test_fading_reuses_the_cached_surfaces(self):
+        layout = TextLayout()
+        screen = pygame.Surface((800, 600))
+        block = layout.block(self.STORY, get_font(32), (255, 255, 255), 780)
+        surfaces = list(block.surfaces)
+        for alpha in (0, 128, 255):
+            block.draw(screen, 400, 300, alpha)
+        assert block.surfaces == surfaces
+        assert all(surface.get_alpha() == 255 for surface in surfaces)
+        assert (layout.hits, layout.misses) == (0, 2)
+
+    def test_line_height_overrides_font_linesize(self):
+        block = TextLayout().block("a\nb", get_font(36), (0, 0, 0), 800, line_height=50)
+        rects = block.layout(400, 250)
+        assert [rect.centery for rect in rects] == [250, 300]
@@ -0,0 +1,102 @@
+import pygame
+import pytest
+from unittest.mock import patch
+
+from src.transitions import Fade, Transition, fade_in, fade_out, prepare, blit_alpha
+from src.presentation import Presentation
+from src.preload import POLL_MS
+
+
+class TestFade:
+    def test_fade_is_time_based(self):
+        fade = fade_in(1000)
+        fade.update(250)
+        assert fade.alpha == 64
+        fade.update(750)
+        assert fade.alpha == 255 and fade.done
+
+    def test_fade_clamps_long_frames(self):
+        fade = fade_out(500)
+        fade.update(5000)
+        assert fade.alpha == 0 and fade.elapsed == 500
+
+    def test_zero_duration_fade_is_done(self):
+        assert Fade(0).done and Fade(0).alpha == 255
+
+
+class TestTransition:
+    @pytest.fixture
+    def screen(self):
+        return pygame.Surface((40, 30))
+
+    def test_blit_alpha_restores_shared_surface_alpha(self, screen):
+        image = pygame.Surface((10, 10))
+        image.fill((255, 255, 255))
+        blit_alpha(screen, image, (0, 0), 128)
+        assert image.get_alpha() is None
+        assert 120 < screen.get_at((5, 5)).r < 136
+
+    def test_blit_alpha_skips_invisible_surfaces(self, screen):
+        image = pygame.Surface((10, 10))
+        image.fill((255, 255, 255))
+        assert blit_alpha(screen, image, (0, 0), 0) is None
+        assert screen.get_at((5, 5)).r == 0
+
+    def test_crossfade_weights_both_layers(self, screen):
+        old, new = pygame.Surface((10, 10)), pygame.Surface((10, 10))
+        old.fill((255, 0, 0))
+        new.fill((0, 0, 255))
+        Transition(screen).crossfade([(old, (0, 0))], [(new, (0, 0))], 255)
+        assert screen.get_at((5, 5)) == (0, 0, 255, 255)
+
+    def test_fade_to_black_uses_one_snapshot(self, screen):
+        transition = Transition(screen)
+        screen.fill((200, 200, 200))
+        snapshot = transition.capture()
+        assert transition.capture() is snapshot
+        transition.fade_to_black(255)
+        assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+        transition.fade_to_black(0)
+        assert screen.get_at((0, 0))[:3] == (200, 200, 200)
+
+    def test_prepare_keeps_display_format_surfaces(self):
+        pygame.display.init()
+        try:
+            display = pygame.display.set_mode((40, 30))
+            image = pygame.Surface((10, 10), 0, display)
+            assert prepare(image) is image
+            assert prepare(pygame.Surface((10, 10), 0, 24)).get_bitsize() == display.get_bitsize()
+        finally:
+            pygame.display.quit()
+
+
+class TestPresentationFade:
+    def test_draw_does_not_copy_images(self):
+        pygame.font.init()
+        images = [pygame.Surface((600, 400)) for _ in range(5)]
+        with patch('src.presentation.assets.image', side_effect=images):
+            presentation = Presentation(pygame.Surface((800, 600)), 800, 600)
+            presentation.images = presentation.load_images()
+        presentation.fade.update(400)
+        with patch('pygame.display.flip'):
+            presentation.draw()
+        assert presentation.images[0] is images[0]
+        assert images[0].get_alpha() is None
+
+    def test_slides_wait_for_the_preloader(self):
+        pygame.font.init()
+        presentation = Presentation(pygame.Surface((800, 600)), 800, 600)
+        images = [pygame.Surface((600, 400)) for _ in range(5)]
+        with patch('src.presentation.preloader') as mock_preloader, \
+             patch('src.presentation.assets.image', side_effect=images):
+            mock_preloader.ready.return_value = False
+            presentation.enter()
+            presentation.update(1000)
+            presentation.draw()
+            assert presentation.images is None
+            assert presentation.idle_ms() == POLL_MS
+            mock_preloader.ready.return_value = True
+            presentation.update(1000)
+        mock_preloader.preload.assert_called_once_with('presentation')
+        assert presentation.images[0] is images[0]
+        assert presentation.slide_time == 0